@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2018-03-12
+#  Python Module for import                           Date : 2026-10-17
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263 
 ''' 
 _______________|  fecon235.py : unifies lib modules for fecon235 project.
@@ -12,6 +12,19 @@ _______________|  fecon235.py : unifies lib modules for fecon235 project.
      frequently used commands can be generalized with shorter names.
 
 CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  hostlimit is defined once in ys_http, shared with ys_aio.
+2026-10-17  get() remembers only definitive failures, see ys_route.
+2026-10-17  forecast() with grids optimizes by grid pass of ys_opt_holt.
+2026-10-17  groupholtf() forecasts all columns in one pass by holtbatch().
+2026-10-17  groupcotr() retrieves all COTR reports at once by cotr_batch(),
+               then normalizes and smoothes all columns at once.
+2026-10-17  get() routes code directly to one backend via ys_route,
+               remembering failed codes, instead of try/except cascade.
+2026-10-17  Include aget() and agroupget() from ys_aio for Python 3.5+
+2026-10-17  groupget() downloads concurrently on a bounded pool of
+               workers, limited per host, reporting failures per key.
+2026-10-17  groupget() and foreinfl() retrieve within a memo() context,
+               so shared leaf series are downloaded only once.
 2018-03-11  Add foreinfl() to forecast Unified Inflation 1-year ahead.
 2018-03-11  Add foreholt() function, generalizing yi_fred.holtfred(),
                but retain holtfred() here for backward compatibility.
@@ -45,8 +58,11 @@ TODO
 
 from __future__ import absolute_import, print_function
 
+import threading
 import pandas as pd
 from .lib import yi_0sys as system
+from .lib import ys_http
+from .lib import ys_route
 
 #    CASUAL import style below intentionally for Jupyter notebooks
 #    and interactive settings (lib modules follow proper import protocol).
@@ -64,6 +80,11 @@ from .lib.ys_gauss_mix import *
 from .lib.ys_mlearn import *
 from .lib.ys_opt_holt import *
 from .lib.ys_prtf_boltzmann import *
+from .lib.ys_cache import memo
+#         ys_cache should NOT be star-imported: generic names.
+if system.pythontup() >= (3, 5, 0):
+    from .lib.ys_aio import aget, agroupget
+    #     ys_aio requires async/await syntax.
 
 
 #  GROUPS:  specify our favorite series as a dictionary
@@ -107,23 +128,31 @@ def get( code, maxi=0 ):
     Stock slang can be also used for ETFs and mutual funds. 
     The general form is 's4symbol' where the symbol must be in 
     lower case, so for SPY, use 's4spy' as an argument.
+
+    The backend is chosen up front by ys_route.route(), so only one
+    backend is called.  A code which failed definitively, e.g. not
+    found, is remembered for a while, see ys_route.failttl, and fails
+    again without network access.  Transient errors are not remembered.
     '''
+    backend = ys_route.route( code )
+    ys_route.failcheck( code )
     try:
-        df = getfred( code )
-    except:
-        try:
+        if backend == 'fred':
+            df = getfred( code )
+        elif backend == 'quandl':
             if maxi:
                 df = getqdl( code, maxi )
             else:
                 df = getqdl( code )
-        except:
-            try:
-                if maxi:
-                    df = getstock( code, maxi )
-                else:
-                    df = getstock( code )
-            except: 
-                raise ValueError('INVALID symbol string or code for fecon get()')
+        else:
+            if maxi:
+                df = getstock( code, maxi )
+            else:
+                df = getstock( code )
+    except Exception as e:
+        ys_route.failed( code, e )
+        raise ValueError('INVALID symbol string or code for fecon get(): '
+                         + backend + ' :: ' + str(e))
     return df
 
 
@@ -163,9 +192,9 @@ def forecast( data, h=12, grids=0, maxi=0 ):
         except:
             raise ValueError("fecon235.forecast(): INVALID data argument.")
     if grids > 0:
-        #  Recommend grids=50 for reasonable results,
-        #  but TIME-CONSUMING for search grids > 49
-        #  to FIND OPTIMAL alpha and beta by minBrute():
+        #  Recommend grids=50 for reasonable results
+        #  to FIND OPTIMAL alpha and beta by minholtgrid(),
+        #  which evaluates the whole grid in one time pass:
         opt =  optimize_holtforecast( data, h, grids=grids )
         #  See optimize_holtforecast() in module ys_opt_holt for details.
         system.warn( str(opt[1]), stub="OPTIMAL alpha, beta, losspc, loss:" )
@@ -200,13 +229,37 @@ def holtfred( data, h=24, alpha=hw_alpha, beta=hw_beta ):
      return foreholt( data, h, alpha, beta )
 
 
-def groupget( ggdic=group4d, maxi=0 ):
-    '''Retrieve and create group dataframe, given group dictionary.'''
+#  Concurrent downloads per data HOST in groupget(), same as for agroupget():
+hostlimit = ys_http.hostlimit
+
+
+def groupget( ggdic=group4d, maxi=0, workers=8 ):
+    '''Retrieve and create group dataframe, given group dictionary.
+       Downloads run concurrently on a pool of workers threads, 
+       at most hostlimit[host] at a time per host (workers=0 for
+       sequential).  A key which fails is reported, then omitted.
+    '''
     #  Since dictionaries are unordered, create SORTED list of keys:
     keys = [ key for key in sorted(ggdic) ]
-    #  Download individual dataframes as values into a dictionary:
-    dfdic = { key : get(ggdic[key], maxi)  for key in keys }
-    #             ^Illustrates dictionary comprehension.
+    limits = dict( (host, threading.Semaphore(n))
+                   for host, n in hostlimit.items() )
+    def retrieve( key ):
+        code = ggdic[key]
+        try:
+            with limits[ ys_route.route(code) ]:
+                return get( code, maxi )
+        except Exception as e:
+            system.warn( key + ' = ' + str(code) + ' :: ' + str(e),
+                         stub="groupget failed:" )
+            return None
+    #  Download individual dataframes as values into a dictionary,
+    #  where memo() lets keys share leaf series without refetching:
+    with memo():
+        dfs = system.pmap( retrieve, keys, workers )
+    dfdic = dict( (key, df) for key, df in zip(keys, dfs) if df is not None )
+    keys = [ key for key in keys if key in dfdic ]
+    if not keys:
+        raise ValueError('groupget could not retrieve any key of group.')
     #  Paste together dataframes into one large sorted dataframe:
     groupdf = paste([ dfdic[key] for key in keys ])
     #  Name the columns:
@@ -296,15 +349,11 @@ def groupholtf( groupdf, h=12, alpha=ts.hw_alpha, beta=ts.hw_beta ):
     #  This is essentially a Kalman filter with optimal alpha-beta, 
     #  applied to each series individually, not jointly.
     #  cf. holtfred() which works given a single series dataframe.
-    forecasts = []
+    #  All series are filtered together by holtbatch(),
+    #  each over its own valid (non-NaN) values like holt().
     keys = list(groupdf.columns)
-    for k in keys:
-        kdf = todf( groupdf[k] )
-        holtdf = holt( kdf, alpha, beta )
-        forecastdf = holtforecast( holtdf, h )
-        forecasts.append( forecastdf )
-    keysdf = paste( forecasts )
-    keysdf.columns = keys
+    forecasts = holtbatch( groupdf.values, h, alpha, beta )[2]
+    keysdf = pd.DataFrame( forecasts, columns=keys )
     return keysdf
 
 
@@ -315,11 +364,20 @@ def groupcotr( group=cotr4w, alpha=0 ):
        COTR is the Commitment of Traders Report from US gov agency.
     '''
     #  For detailed derivation, see qdl-COTR-positions.ipynb
-    positions = groupget( group )
-    norpositions = groupfun( normalize, positions )
+    keys = sorted( group )
+    if all( group[k] in cotr_composites for k in keys ):
+        #  All reports retrieved at once, see cotr_batch():
+        positions = cotr_batch([ group[k] for k in keys ])
+        positions.columns = keys
+        positions = positions.dropna()
+    else:
+        positions = groupget( group )
+    #  Normalize and smooth all columns at once, equivalent to
+    #  groupfun() with normalize() and ema():
+    norpositions = (positions - positions.mean()) / positions.std()
     #  alpha default should skip SMOOTHING operation...
     if alpha:
-        return groupfun( ema, norpositions, alpha )
+        return norpositions.ewm( alpha=alpha, adjust=False ).mean()
     else:
         return norpositions
 
@@ -345,7 +403,10 @@ def foreinfl( n=120, alpha=1.0, beta=0.3673 ):
     #  from the 1960-2018 dataset, consisting of 697 monthly points.
     #  Each "way" is an orthogonal method, to be averaged as way[0].
     way = [-9, -9, -9, -9, -9]
-    inflall = get( m4infl )  # synthetic Unified Inflation, monthly.
+    with memo():
+        inflall = get( m4infl )  # synthetic Unified Inflation, monthly.
+        bond10 = get(m4bond10)
+        tips10 = get(m4tips10)
     infl = tail(inflall, n)
     #                    ^Default n=120 months, i.e. last 10 years.
     way[1] = str(infl.index[-1]).replace(" 00:00:00", "")
@@ -354,8 +415,6 @@ def foreinfl( n=120, alpha=1.0, beta=0.3673 ):
     way[2] = gm[0]  #  Geometric Mean Rate over n months.
     hw = foreholt( infl, 12, alpha, beta )  # Holt-Winters model.
     way[3] = (tailvalue(hw) - 1) * 100   # Convert forecasted level to rate.
-    bond10 = get(m4bond10)
-    tips10 = get(m4tips10)
     bei = todf(bond10 - tips10)   #  10-year BEI Break-even Inflation.
     #         ^Bond market data will be more recent than m4infl.
     way[4] = tailvalue(bei)
@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2017-05-15
+#  Python Module for import                           Date : 2026-10-17
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263 
 ''' 
 _______________|  yi_0sys.py : system and date functions including specs.
@@ -18,6 +18,9 @@ REFERENCES:
 
 
 CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  Add lazyimport() so heavy modules are imported on first use.
+2026-10-17  Add pmap() to map a function over items on a bounded pool
+               of worker threads, e.g. for concurrent downloads.
 2017-05-15  Add timestamp() per strict RFC-3339 standard.
                Also include scipy and sympy in specs().
 2017-03-16  Revise: minimumPandas = 18.0
@@ -39,6 +42,9 @@ from __future__ import absolute_import, print_function
 import sys
 import os
 import time
+import types
+import importlib
+import threading
 from subprocess import check_output, STDOUT
 #                      ^for Python 2.7 and 3+
 
@@ -114,6 +120,84 @@ def timestamp():
     return time.strftime( form, tup ) 
 
 
+def pmap( fun, items, workers=8 ):
+    '''Map fun over items using a bounded pool of threads, in order.
+       For workers < 2, simply map sequentially in this thread.
+       If any call raises, the first exception (by item order) is raised
+       after all calls have finished.
+    '''
+    items = list( items )
+    if workers < 2 or len(items) < 2:
+        return [ fun(item) for item in items ]
+    results = [ None ] * len(items)
+    errors  = [ None ] * len(items)
+    #  Shared position in items, advanced under lock by each worker:
+    position = [ 0 ]
+    lock = threading.Lock()
+    def worker():
+        while True:
+            with lock:
+                i = position[0]
+                if i >= len(items):
+                    return
+                position[0] += 1
+            try:
+                results[i] = fun( items[i] )
+            except Exception as e:
+                errors[i] = e
+    threads = [ threading.Thread(target=worker)
+                for _ in range(min(workers, len(items))) ]
+    for t in threads:
+        t.daemon = True
+        t.start()
+    for t in threads:
+        t.join()
+    for e in errors:
+        if e is not None:
+            raise e
+    return results
+
+
+class LazyModule( types.ModuleType ):
+    '''Stand-in for module which is imported on first attribute access.'''
+
+    def __init__( self, name, submodules=(), fallback=None ):
+        types.ModuleType.__init__( self, name )
+        self.__dict__['_lazy'] = [ name, submodules, fallback, None ]
+
+    def _load( self ):
+        lazy = self.__dict__['_lazy']
+        name, submodules, fallback, module = lazy
+        if module is None:
+            try:
+                module = importlib.import_module( name )
+            except ImportError:
+                if fallback is None:
+                    raise
+                module = importlib.import_module( fallback )
+            for sub in submodules:
+                importlib.import_module( sub )
+            lazy[3] = module
+        return module
+
+    def __getattr__( self, attr ):
+        #  Called only for attributes not found on the stand-in:
+        return getattr( self._load(), attr )
+
+    def __dir__( self ):
+        return dir( self._load() )
+
+
+def lazyimport( name, submodules=(), fallback=None ):
+    '''Module name, imported only upon first use, e.g.
+           plt = lazyimport( 'matplotlib.pyplot' )
+       so heavy dependencies do not delay import of our modules.
+       Also import submodules (e.g. 'scipy.stats' for 'scipy'),
+       and try fallback module name if name cannot be imported.
+    '''
+    return LazyModule( name, submodules, fallback )
+
+
 def pythontup():
     '''Represent invoked Python version as an integer 3-tuple.'''
     #  Using sys.version is overly verbose.
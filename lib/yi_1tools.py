@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2017-06-20
+#  Python Module for import                           Date : 2026-10-17
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263 
 ''' 
 _______________|  yi_1tools.py : essential utility functions.
@@ -18,6 +18,9 @@ causing problems upon: from numpy import *
    - Plain float() is fine for our numerical work here.
 
 CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  Add alongaxis() for indexing along an axis, older numpy too.
+2026-10-17  Heavy dependencies are imported lazily upon first use.
+2026-10-17  writefile() writes binary format for '.fbin', see ys_binfile.
 2017-06-20  Fix bug in diflog().
 2017-05-26  Add roundit() to round floats from an iterable.
 2017-05-20  Clarify kurtfun() using toar() and include raw option.
@@ -64,10 +67,12 @@ CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
 from __future__ import absolute_import, print_function, division
 
 import numpy as np                #  for numerical work.
-import matplotlib.pyplot as plt   #  for standard plots.
 import pandas as pd               #  for data munging.
+from . import yi_0sys as system
 
-import statsmodels.formula.api as smf
+plt = system.lazyimport( 'matplotlib.pyplot' )    #  for standard plots.
+smf = system.lazyimport( 'statsmodels.formula.api' )
+#     ^heavy modules are imported upon first use.
 
 #  #  2016-04-28  DEPRECATED as of pandas 0.18
 #  #  ols := Ordinary Least Squares, aka Linear Regression, 
@@ -75,7 +80,7 @@ import statsmodels.formula.api as smf
 #  from pandas.stats.api import ols
 #  #    See https://github.com/pydata/pandas/blob/master/pandas/stats/ols.py
 
-from . import yi_0sys as system
+from . import ys_binfile as binfile
 
 
 def nona( df ):
@@ -533,6 +538,22 @@ def pastear( array_list ):
      return np.column_stack( arr_tup )
 
 
+def alongaxis( indices, axis=-1 ):
+     '''Index tuple which selects indices along axis, elementwise,
+        for array[...] and assignment, like np.take_along_axis()
+        and np.put_along_axis() which require numpy 1.15+.
+     >>> x = np.array([[ 10, 11, 12 ], [ 20, 21, 22 ]])
+     >>> x[ alongaxis( np.array([[ 2 ], [ 0 ]]) ) ]
+     array([[12],
+            [20]])
+     '''
+     indices = np.asarray( indices )
+     grids = list( np.ix_( *[ np.arange(n) for n in indices.shape ] ) )
+     #           ^open grids which broadcast over the other axes.
+     grids[ axis ] = indices
+     return tuple( grids )
+
+
 def lagdf( df, lags=1 ):
     '''Create dataframe with lagged columns (labeled with underscore_lag).'''
     #  Argument df may have single or mutiple column(s).
@@ -564,7 +585,11 @@ def diflog( data, lags=1 ):
 def writefile( dataframe, filename='tmp-yi_1tools.csv', separator=',' ):
     '''Write dataframe to disk file using UTF-8 encoding.'''
     #  For tab delimited, use '\t' as separator.
-    dataframe.to_csv( filename, sep=separator, encoding='utf-8' )
+    #  Extension '.fbin' writes binary format instead, see ys_binfile.
+    if binfile.isbin( filename ):
+        binfile.writebin( dataframe, filename )
+    else:
+        dataframe.to_csv( filename, sep=separator, encoding='utf-8' )
     print(' ::  Dataframe written to file: ' + filename)
     return
 
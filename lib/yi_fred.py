@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2018-03-11
+#  Python Module for import                           Date : 2026-10-17
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263 
 ''' 
 _______________|  yi_fred.py : Access FRED with pandas for plots, etc.
@@ -27,6 +27,21 @@ References:
 
 
 CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  readfile() fast path only for local files and file objects,
+               so URLs still go to pd.read_csv().
+2026-10-17  Base URLs fredurl and fredgraph of makeURL() are configurable,
+               e.g. by environment FRED_URL, see ys_replay.
+2026-10-17  getdata_fred() downloads via pooled session of ys_http.
+2026-10-17  Add readfred() as fast path of readfile() for FRED layout.
+2026-10-17  readfile() reads binary '.fbin' files, see ys_binfile.
+               Add csv2bin() to convert CSV archives to binary.
+2026-10-17  Add start argument to makeURL() so that getdata_fred()
+               updates a stale cached series incrementally.
+2026-10-17  Declare synthetics in fredsynth REGISTRY, see ys_synth, which
+               replaces the if/elif chain in getfred(). Add getfreds()
+               and fredplan() for batches sharing leaf downloads.
+2026-10-17  Memoize getfred() and getdata_fred() within ys_cache.memo().
+2026-10-17  getdata_fred() consults persistent disk cache, see ys_cache.
 2018-03-11  holtfred() superceded by foreholt(), yet moved to fecon235 module.
 2017-01-06  Add USDCNY daily series, Chinese Yuan from FRB H-10.
 2016-12-21  Add Fed Funds and its "30-day" ema as d4ff and d4ff30.
@@ -92,12 +107,19 @@ except ImportError:
     from urllib2 import urlopen
     #    ^for python2 
 
+import io
+import os
+import zlib
 import numpy as np
 import pandas as pd
 from . import yi_0sys as system
 from . import yi_1tools as tools
 from . import yi_plot as plot
 from . import yi_timeseries as ts 
+from . import ys_binfile as binfile
+from . import ys_cache
+from . import ys_http
+from . import ys_synth as synth
 
 
 
@@ -260,10 +282,95 @@ m4unempfr = 'LRHUTTTTFRM156S'  # FR Unemployment rate, OECD SA monthly
 #  GOTCHA: pd.read_csv assumes str in what's read, thus
 #          make conversions for numerical work later.
 
+def isodates( chars ):
+    '''Convert rows of ISO date characters YYYY-MM-DD to datetime64[ns].
+       chars is an array of uint8 with shape (rows, 10).
+    '''
+    #  Computed from the digits directly, rather than casting bytes
+    #  to datetime64 which would need a parse per row (and which
+    #  crashes on invalid input in some numpy versions).
+    digit = chars.astype( np.int64 ) - ord('0')
+    positions = [ 0, 1, 2, 3, 5, 6, 8, 9 ]
+    if not ( (chars[:, 4] == ord('-')).all()
+             and (chars[:, 7] == ord('-')).all()
+             and (digit[:, positions] >= 0).all()
+             and (digit[:, positions] <= 9).all() ):
+        raise ValueError('readfred expects ISO dates: YYYY-MM-DD')
+    year  = digit[:,0]*1000 + digit[:,1]*100 + digit[:,2]*10 + digit[:,3]
+    month = digit[:,5]*10 + digit[:,6]
+    day   = digit[:,8]*10 + digit[:,9]
+    if not ( (1 <= month) & (month <= 12) & (1 <= day) ).all():
+        raise ValueError('readfred found invalid month or day.')
+    months = (year - 1970) * 12 + (month - 1)
+    start = months.astype('datetime64[M]').astype('datetime64[D]')
+    following = (months + 1).astype('datetime64[M]').astype('datetime64[D]')
+    if not ( day <= (following - start).astype(np.int64) ).all():
+        raise ValueError('readfred found day beyond end of month.')
+    return ( start + (day - 1) ).astype('datetime64[ns]')
+
+
+def readfred( data ):
+    '''Parse bytes of FRED CSV layout "DATE,VALUE" as pandas dataframe.
+       ISO dates go directly into datetime64, "." becomes NaN, and
+       missing values are forward filled.  Any other layout raises 
+       ValueError, so that the general readfile() may take over.
+    '''
+    #  This specialised parser avoids the general CSV machinery,
+    #  date inference, and separate passes for coercion and padding.
+    header, _, body = data.partition( b'\n' )
+    if header.count( b',' ) != 1:
+        raise ValueError('readfred expects two columns: DATE,VALUE')
+    tokens = np.array( body.split() )
+    #        ^lines like b'2013-03-08,1581.75' as fixed-width bytes.
+    if tokens.size == 0 or tokens.dtype.itemsize < 12:
+        raise ValueError('readfred found no observations.')
+    width = tokens.dtype.itemsize
+    chars = tokens.view( np.uint8 ).reshape( (tokens.size, width) )
+    if not (chars[:, 10] == ord(',')).all():
+        raise ValueError('readfred expects ISO dates: YYYY-MM-DD')
+    index = isodates( chars[:, :10] )
+    values = np.ascontiguousarray( chars[:, 11:] ).view( 'S'
+                                                + str(width - 11) ).ravel()
+    values[ values == b'.' ] = b'nan'
+    #  FRED uses "." to indicate missing value.
+    values = values.astype( np.float64 )
+    #  Fill forward: each row takes the latest position with a value.
+    position = np.arange( values.size )
+    position[ np.isnan(values) ] = 0
+    np.maximum.accumulate( position, out=position )
+    values = values[ position ]
+    #        ^leading missing values have no predecessor, so remain NaN.
+    return pd.DataFrame( { 'Y': values },
+                         index=pd.DatetimeIndex(index, name='T') )
+
+
 def readfile( filename, separator=',', compress=None ):
     '''Read file (CSV default) as pandas dataframe.'''
     #  If separator is space, use '\s+' since regex will work.
     #  compress will take 'gzip' or 'bzip' as value.
+    #  Binary files with extension '.fbin' need no parsing, see ys_binfile.
+    if binfile.isbin( filename ):
+        return binfile.readbin( filename )
+
+    #  Fast path for comma separated FRED layout, see readfred():
+    #  Anything else, e.g. URL, is left to pd.read_csv() as before.
+    isfile = hasattr( filename, 'read' ) or os.path.isfile( filename )
+    if separator == ',' and compress in [ None, 'gzip' ] and isfile:
+        if hasattr( filename, 'read' ):
+            data = filename.read()
+        else:
+            with open( filename, 'rb' ) as f:
+                data = f.read()
+        if not isinstance( data, bytes ):
+            data = data.encode( 'utf-8' )
+        if compress == 'gzip':
+            data = zlib.decompress( data, 16 + zlib.MAX_WBITS )
+            compress = None
+        try:
+            return readfred( data )
+        except ValueError:
+            #  Not FRED layout, so use the general method below:
+            filename = io.BytesIO( data )
 
     dataframe = pd.read_csv( filename, sep=separator, 
                              compression=compress, 
@@ -296,23 +403,61 @@ def readfile( filename, separator=',', compress=None ):
 
 
 
-def makeURL( fredcode ):
-    '''Create http address to access FRED's CSV files.'''
+def csv2bin( csvfile, binname=None, dtype='float64' ):
+    '''Convert CSV file, e.g. nb/*-ARC.csv.gz archive, to binary file.'''
+    if binname is None:
+        binname = csvfile
+        for ext in [ '.gz', '.bz2', '.csv' ]:
+            if binname.endswith( ext ):
+                binname = binname[ :-len(ext) ]
+        binname += binfile.SUFFIX
+    compress = 'gzip' if csvfile.endswith('.gz') else None
+    binfile.writebin( readfile(csvfile, compress=compress), binname,
+                      dtype=dtype, source=os.path.basename(csvfile) )
+    return binname
+
+
+#  BASE URLs of FRED, which may be redirected, e.g. to a local
+#  stand-in server serving recorded responses, see ys_replay:
+fredurl   = os.environ.get( 'FRED_URL',
+                            'http://research.stlouisfed.org/fred2/' )
+fredgraph = os.environ.get( 'FRED_GRAPH_URL',
+                            'https://fred.stlouisfed.org/graph/' )
+
+
+def makeURL( fredcode, start=None ):
+    '''Create http address to access FRED's CSV files.
+       Given start as 'YYYY-MM-DD', only observations since then.
+    '''
     #         Validated July 2014.
-    return 'http://research.stlouisfed.org/fred2/series/' \
-        + fredcode + '/downloaddata/' + fredcode + '.csv'
+    if start is None:
+        return fredurl + 'series/' \
+            + fredcode + '/downloaddata/' + fredcode + '.csv'
+    #  The graph endpoint accepts an observation start date (cosd):
+    return fredgraph + 'fredgraph.csv?id=' + fredcode + '&cosd=' + start
 
 
 #  N.B. -  getdata_fred is a vital helper for MORE GENERAL getfred BELOW.
 #          It's the best primitive to get raw FRED data.
 
-def getdata_fred( fredcode ):
+def getdata_fred( fredcode, cache=True ):
     '''Download CSV file from FRED and read it as pandas DATAFRAME.'''
     #  2014-08-11 former name "getdataframe".
     #  2015-12-05 fredcsv = urllib2.urlopen( makeURL(fredcode) )
     #                Change import style for python3 compatibility.
-    fredcsv = urlopen( makeURL(fredcode) )
-    return readfile( fredcsv )
+    #  2026-10-17 Parsed series are kept on local disk by ys_cache,
+    #                subject to a freshness window by frequency;
+    #                cache=False forces download.
+    #  2026-10-17 Connections are kept alive for reuse by ys_http.
+    #  2026-10-17 Stale series are updated by downloading only
+    #                observations since its tail, see ys_cache.update().
+    def download( start=None ):
+        fredcsv = ys_http.urlopen( makeURL(fredcode, start) )
+        return readfile( fredcsv )
+    if cache:
+        return ys_cache.memoize( 'fred', fredcode,
+               lambda: ys_cache.cached( 'fred', fredcode, download, download ))
+    return download()
 
 
 def index_delta_secs( dataframe ):
@@ -417,58 +562,66 @@ def quarterly( dataframe ):
 
 
 
-def getm4eurusd( fredcode=d4eurusd ):
-     '''Make monthly EURUSD, and try to prepend 1971-2002 archive.'''
+def prependarchive( dfnow, archive, found, missing ):
+     '''Try to prepend local archive (gzip CSV) to recent dataframe.'''
+     #  Prefer its binary conversion by csv2bin(), if present:
+     binarchive = archive.replace( '.csv.gz', binfile.SUFFIX )
+     try:
+          if os.path.exists( binarchive ):
+               dfold = readfile( binarchive )
+          else:
+               dfold = readfile( archive, compress='gzip' )
+          dfall = dfold.combine_first( dfnow )
+          #             ^appends dataframe
+          print( found )
+     except:
+          dfall = dfnow
+          print( missing )
+     return dfall
+
+
+
+def eurarchive( eurnow ):
+     '''Prepend 1971-2002 archive to monthly EURUSD, if available.'''
      #  Synthetic euro is the average between 
      #                 DEM fixed at 1.95583 and 
      #                 FRF fixed at 6.55957.
-     eurnow = monthly( getdata_fred( fredcode ) )
-     try:
-          eurold = readfile( 'FRED-EURUSD_1971-2002-ARC.csv.gz', compress='gzip' )
-          eurall = eurold.combine_first( eurnow )
-          #               ^appends dataframe
-          print(' ::  EURUSD synthetically goes back monthly to 1971.')
-     except:
-          eurall = eurnow
-          print(' ::  EURUSD monthly without synthetic 1971-2002 archive.')
-     return eurall
+     return prependarchive( eurnow, 'FRED-EURUSD_1971-2002-ARC.csv.gz',
+               ' ::  EURUSD synthetically goes back monthly to 1971.',
+               ' ::  EURUSD monthly without synthetic 1971-2002 archive.' )
 
 
+def getm4eurusd( fredcode=d4eurusd ):
+     '''Make monthly EURUSD, and try to prepend 1971-2002 archive.'''
+     return eurarchive( monthly( getdata_fred( fredcode ) ) )
 
-def getspx( fredcode=d4spx ):
-     '''Make daily S&P 500 series, and try to prepend 1957-archive.'''
+
+
+def spxarchive( spnow ):
+     '''Prepend 1957-archive to daily S&P 500 series, if available.'''
      #  Fred is currently licensed for only 10 years worth, 
      #  however, we have a local copy of 1957-2014 daily data.
-     spnow = getdata_fred( fredcode )
-     try:
-          spold = readfile( 'FRED-SP500_1957-2014-ARC.csv.gz', compress='gzip' )
-          spall = spold.combine_first( spnow )
-          #             ^appends dataframe
-          print(' ::  S&P 500 prepend successfully goes back to 1957.')
-     except:
-          spall = spnow
-          print(' ::  S&P 500 for last 10 years (1957-archive not found).')
-     return spall
+     return prependarchive( spnow, 'FRED-SP500_1957-2014-ARC.csv.gz',
+               ' ::  S&P 500 prepend successfully goes back to 1957.',
+               ' ::  S&P 500 for last 10 years (1957-archive not found).' )
 
 
+def getspx( fredcode=d4spx ):
+     '''Make daily S&P 500 series, and try to prepend 1957-archive.'''
+     return spxarchive( getdata_fred( fredcode ) )
 
-def gethomepx( fredcode=m4homepx ):
-     '''Make Case-Shiller 20-city, and try to prepend 1987-2000 10-city.'''
+
+
+def homepxarchive( hpnow ):
+     '''Prepend 1987-2000 10-city to Case-Shiller 20-city, in dollars.'''
      #  Fred's licensing may change since source is S&P, 
      #  however, we have a local copy of 1987-2013 monthly SA data.
-     hpnow = getdata_fred( 'SPCS20RSA' )
-     #                          20-city home price index back to 2000-01-01.
-     try:
-          hpold = readfile( 'FRED-home-Case-Shiller_1987-2013.csv.gz', compress='gzip' )
-          #                 ^includes 10-city index from 1987-2000.
-          #                  Current correlation with 20-city: 0.998
-          #                  Thus the mashup is justified.
-          hpall = hpold.combine_first( hpnow )
-          #             ^appends dataframe
-          print(' ::  Case-Shiller prepend successfully goes back to 1987.')
-     except:
-          hpall = hpnow
-          print(' ::  Case-Shiller since 2000 (1987-archive not found).')
+     hpall = prependarchive( hpnow, 'FRED-home-Case-Shiller_1987-2013.csv.gz',
+               ' ::  Case-Shiller prepend successfully goes back to 1987.',
+               ' ::  Case-Shiller since 2000 (1987-archive not found).' )
+     #                 ^archive includes 10-city index from 1987-2000.
+     #                  Current correlation with 20-city: 0.998
+     #                  Thus the mashup is justified.
      #  Case-Shiller is not dollar based, so we use:
      #  Median Sales Price of Existing Homes
      #  from the National Association of Realtors, fredcode: HOSMEDUSM052N
@@ -477,43 +630,60 @@ def gethomepx( fredcode=m4homepx ):
      return hpall * dollarindex
 
 
+def gethomepx( fredcode=m4homepx ):
+     '''Make Case-Shiller 20-city, and try to prepend 1987-2000 10-city.'''
+     return homepxarchive( getdata_fred( 'SPCS20RSA' ) )
+     #                          20-city home price index back to 2000-01-01.
 
-def getinflations( inflations=ml_infl ):
-     '''Normalize and average all inflation measures.'''
+
+
+def meaninflations( *inflations ):
+     '''Normalize and average given inflation dataframes.'''
      #  We will take the average of indexes after their 
      #  current value is set to 1 for equal weighting. 
-     inflsum = getdata_fred( inflations[0] )
-     inflsum = inflsum / float(tools.tailvalue( inflsum ))
-     for i in inflations[1:]:
-          infl = getdata_fred( i )
-          infl = infl / float(tools.tailvalue( infl ))
-          inflsum += infl
+     inflsum = inflations[0] / float(tools.tailvalue( inflations[0] ))
+     for infl in inflations[1:]:
+          inflsum += infl / float(tools.tailvalue( infl ))
      return inflsum / len(inflations)
 
 
+def getinflations( inflations=ml_infl ):
+     '''Normalize and average all inflation measures.'''
+     return meaninflations( *[ getdata_fred(i) for i in inflations ] )
 
-def getdeflator( inflation=m4infl ):
-     '''Construct a de-inflation dataframe suitable as multiplier.'''
+
+
+def deflate( infl ):
+     '''Invert inflation dataframe into de-inflation multiplier.'''
      #  Usually we encounter numbers which have been deflated to dollars 
      #  of some arbitrary year (where the value is probably 100).
      #  Here we set the present to 1, while past values have increasing  
      #     multiplicative "returns" which will yield current dollars. 
-     infl = getfred( inflation )
      lastin = tools.tailvalue( infl )
      return float( lastin ) / infl
      #           Think inverted inflation :-)
 
 
+def getdeflator( inflation=m4infl ):
+     '''Construct a de-inflation dataframe suitable as multiplier.'''
+     return deflate( getfred( inflation ) )
 
-def getm4infleu( ):
-     '''Normalize and average Eurozone Consumer Prices.'''
+
+
+def normholt( cpiall ):
+     '''Normalize Holt-Winters levels of NSA consumer prices.'''
      #  FRED carries only NSA data from Eurostat,
      #  so we shall use Holt-Winters levels.
-     cpiall   = getdata_fred( 'CP0000EZ17M086NEST' )
-     #                        ^for 17 countries.
      holtall  = ts.holtlevel( cpiall )
      normall  = holtall  / float(tools.tailvalue( holtall  ))
      return normall
+
+
+def getm4infleu( ):
+     '''Normalize and average Eurozone Consumer Prices.'''
+     cpiall   = getdata_fred( 'CP0000EZ17M086NEST' )
+     #                        ^for 17 countries.
+     return normholt( cpiall )
      #  #   SUSPENDED since last is 2013-12-01.
      #  cpicore  = getdata_fred( 'CPHPLA01EZM661N'    )
      #  holtcore = ts.holtlevel( cpicore )
@@ -524,119 +694,96 @@ def getm4infleu( ):
 
 
 
+#  ================================ REGISTRY of synthetic fredcodes =======
+#
+#  Each entry DECLARES:  code : ( (input codes,), transform )
+#  where transform takes input dataframes in that order; see ys_synth.
+#  An input equal to its own code denotes the raw FRED download,
+#  e.g. d4spx is raw SP500 prepended with the 1957-archive.
+#  Thus the dependencies of synthetics, formerly hidden in the
+#  if/elif chain of getfred, are available to the planner.
+
+fredsynth = {
+     m4gdpus:   ( (q4gdpus,),            monthly ),
+     m4gdpusr:  ( (m4defl, m4gdpus),     lambda defl, gdp: defl * gdp ),
+     m4debt:    ( (q4debt,),             monthly ),
+     m4workers: ( (m4emppop, m4pop),
+                  lambda emppop, pop: (emppop / float(100)) * pop ),
+     m4homepx:  ( ('SPCS20RSA',),        homepxarchive ),
+     #                ^20-city home price index back to 2000-01-01.
+
+     d4defl:    ( (m4defl,),             daily ),
+     m4defl:    ( (m4infl,),             deflate ),
+     m4infl:    ( tuple(ml_infl),        meaninflations ),
+
+     m4gdpeur:  ( (m4defleu, q4gdpeu),
+                  lambda defl, gdp: defl * (monthly(gdp) / float(1000)) ),
+     m4infleu:  ( ('CP0000EZ17M086NEST',), normholt ),
+     #                ^for 17 countries.
+     m4defleu:  ( (m4infleu,),           deflate ),
+
+     d4eurjpy:  ( (d4eurusd, d4usdjpy),  lambda eurusd, usdjpy: eurusd * usdjpy ),
+     m4usdjpy:  ( (d4usdjpy,),           monthly ),
+     m4eurusd:  ( (d4eurusd,),           lambda eurusd: eurarchive(monthly(eurusd)) ),
+     m4eurjpy:  ( (m4eurusd, m4usdjpy),  lambda eurusd, usdjpy: eurusd * usdjpy ),
+     m4xau:     ( (d4xau,),              monthly ),
+     m4xaueur:  ( (m4xau, m4eurusd),     lambda xauusd, eurusd: xauusd / eurusd ),
+     m4xaujpy:  ( (m4xau, m4usdjpy),     lambda xauusd, usdjpy: xauusd * usdjpy ),
+     m4xaurtb:  ( (m4usdrtb, m4xau),
+                  lambda usdrtb, xauusd: usdrtb * (xauusd / float(1000)) ),
+
+     d4ff30:    ( (d4ff,),               lambda ff: ts.ema( ff, 0.0645 ) ),
+     #                    exponential moving avg.   ^"30-day"
+     d4zero10:  ( (d4bond10,),
+                  lambda bond10: tools.zeroprice( bond10, zero10dur ) ),
+     m4zero10:  ( (d4zero10,),           monthly ),
+     d4curve:   ( (d4bond10, d4bills),   lambda bond10, bills: bond10 - bills ),
+     d4bei:     ( (d4bond10, d4tips10),  lambda bond10, tips10: bond10 - tips10 ),
+     m4bei:     ( (m4bond10, m4tips10),  lambda bond10, tips10: bond10 - tips10 ),
+     m4inflbei: ( (m4infl, m4bei),
+                  lambda infl, bei: (tools.pcent( infl, 12 ) + bei) / float(2) ),
+     #            ^average of backward (YoY%) and forward looking inflation!
+
+     d4spx:     ( (d4spx,),              spxarchive ),
+     #              ^self-reference: raw SP500 download.
+     m4spx:     ( (d4spx,),              monthly ),
+     m4spxrtb:  ( (m4usdrtb, m4spx),
+                  lambda usdrtb, spxusd: usdrtb * (spxusd / float(1000)) ),
+     q4spx:     ( (d4spx,),              quarterly ),
+
+     d4oil:     ( (d4brent, d4wti),      lambda brent, wti: (brent + wti) / float(2) ),
+     m4oil:     ( (d4oil,),              monthly ),
+     d4gas:     ( ('GASREGW',),          daily ) }
+     #                ^weekly DoE survey, USD/gallon + tax, NSA 
+
+
+
+def fredplan( fredcodes ):
+     '''List of raw FRED downloads needed to get all given fredcodes.'''
+     return synth.plan( fredsynth, fredcodes )[0]
+
+
+def getfreds( fredcodes ):
+     '''Retrieve several fredcodes as dictionary of dataframes.
+        Leaf downloads and intermediate synthetics are shared.
+     '''
+     #  Within a ys_cache.memo() context, results are also shared
+     #  across calls, e.g. m4xau for both m4xaueur and m4xaujpy:
+     dfdic = synth.evaluate( fredsynth, fredcodes, getdata_fred,
+                 lambda code, fun: ys_cache.memoize( 'getfred', code, fun ))
+     return dict( (code, df.dropna()) for code, df in dfdic.items() )
+
+
 def getfred( fredcode ):
      '''Retrieve from FRED in dataframe format, INCL. SPECIAL CASES.'''
-     #    We can SYNTHESIZE a FREDCODE by use of string equivalent arg:
-     if   fredcode == m4gdpus:
-          df = monthly( getdata_fred( q4gdpus  ) )
-     elif fredcode == m4gdpusr:
-          df = getfred( m4defl ) * getfred( m4gdpus )
-     elif fredcode == m4debt:
-          df = monthly( getdata_fred( q4debt   ) )
-     elif fredcode == m4workers:
-          workfrac = getdata_fred( m4emppop ) / float(100)
-          pop      = getdata_fred( m4pop    )
-          df = workfrac * pop
-     elif fredcode == m4homepx:
-          df = gethomepx()
-
-     elif fredcode == d4defl:
-          df = daily( getdeflator() )
-     elif fredcode == m4defl:
-          df = getdeflator()
-     elif fredcode == m4infl:
-          df = getinflations()
-
-     elif fredcode == m4gdpeur:
-          mgdpeu = monthly( getdata_fred( q4gdpeu )) / float(1000)
-          df = getfred( m4defleu ) * mgdpeu
-     elif fredcode == m4infleu:
-          df = getm4infleu()
-     elif fredcode == m4defleu:
-          df = getdeflator( m4infleu )
-
-     elif fredcode == d4eurjpy:
-          eurusd = getdata_fred( d4eurusd )
-          usdjpy = getdata_fred( d4usdjpy )
-          df = eurusd * usdjpy
-     elif fredcode == m4usdjpy:
-          df = monthly( getdata_fred( d4usdjpy ) )
-     elif fredcode == m4eurusd:
-          df = getm4eurusd()
-     elif fredcode == m4eurjpy:
-          eurusd = getfred( m4eurusd )
-          usdjpy = getfred( m4usdjpy )
-          df = eurusd * usdjpy
-     elif fredcode == m4xau:
-          df = monthly( getdata_fred( d4xau ) )
-     elif fredcode == m4xaueur:
-          xauusd = getfred( m4xau )
-          eurusd = getfred( m4eurusd )
-          df = xauusd / eurusd
-     elif fredcode == m4xaujpy:
-          xauusd = getfred( m4xau )
-          usdjpy = getfred( m4usdjpy )
-          df = xauusd * usdjpy
-     elif fredcode == m4xaurtb:
-          usdrtb = getdata_fred( m4usdrtb )
-          xauusd = getfred( m4xau ) / float(1000)
-          df = usdrtb * xauusd
-
-     elif fredcode == d4ff30:
-          df = ts.ema(getdata_fred( d4ff ), 0.0645)
-          #       exponential moving avg.   ^"30-day"
-     elif fredcode == d4zero10:
-          bond10 = getdata_fred( d4bond10 )
-          df = tools.zeroprice( bond10, zero10dur )
-     elif fredcode == m4zero10:
-          df = monthly( getfred( d4zero10 ))
-     elif fredcode == d4curve:
-          bond10 = getdata_fred( d4bond10 )
-          bills  = getdata_fred( d4bills )
-          df = bond10 - bills
-     elif fredcode == d4bei:
-          bond10 = getdata_fred( d4bond10 )
-          tips10 = getdata_fred( d4tips10 )
-          df = bond10 - tips10
-     elif fredcode == m4bei:
-          bond10 = getdata_fred( m4bond10 )
-          tips10 = getdata_fred( m4tips10 )
-          df = bond10 - tips10
-     elif fredcode == m4inflbei:
-          inflpc = tools.pcent( getfred(m4infl), 12 )  #  YoY% form 
-          df = (inflpc + getfred(m4bei)) / float(2)
-          #  ^average of backward and forward looking inflation!
-
-     elif fredcode == d4spx:
-          df = getspx()
-     elif fredcode == m4spx:
-          df = monthly( getspx() )
-     elif fredcode == m4spxrtb:
-          usdrtb = getdata_fred( m4usdrtb )
-          spxusd = getfred( m4spx ) / float(1000)
-          df = usdrtb * spxusd
-     elif fredcode == q4spx:
-          df = quarterly( getspx() )
-
-     elif fredcode == d4oil:
-          brent = getdata_fred( d4brent )
-          wti   = getdata_fred( d4wti   )
-          df = ( brent + wti ) / float(2) 
-     elif fredcode == m4oil:
-          df = monthly( getfred( d4oil ) )
-     elif fredcode == d4gas:
-          df = daily( getdata_fred( 'GASREGW' ) )
-          #           ^weekly DoE survey, USD/gallon + tax, NSA 
-
-     else:
-          df = getdata_fred( fredcode )
-     return df.dropna()
+     #    We can SYNTHESIZE a FREDCODE by use of string equivalent arg,
+     #    see fredsynth REGISTRY above for declared synthetics.
+     return getfreds([ fredcode ])[ fredcode ]
      #        ^NO NULLS finally, esp. for synthetics derived from 
      #         overlapping indexes, noting that in general: 
      #         readfile does fillna with pad beforehand.
 
 
-
 def plotfred( data, title='tmp', maxi=87654321 ):
      '''Plot data should be given as dataframe or fredcode.'''
      #  maxi is an arbitrary maximum number of points to be plotted.
@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2017-05-15
+#  Python Module for import                           Date : 2026-10-17
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263 
 ''' 
 _______________|  yi_plot.py : essential plot functions.
@@ -10,6 +10,7 @@ References:
   http://pandas.pydata.org/pandas-docs/stable/computation.html
 
 CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  Heavy dependencies are imported lazily upon first use.
 2017-05-15  Add plotqq() for quantile-quantile Q-Q probability plot.
 2016-01-21  plotn(): Replace its "dataframe = dataframe.dropna()" with todf.
 2016-01-20  Receive plotdf(), versions 2014-15, from yi_fred module.
@@ -27,13 +28,15 @@ CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
 
 from __future__ import absolute_import, print_function
 
-import matplotlib.pyplot as plt
-import matplotlib.cm as colormap
 import pandas as pd
-import scipy
 from . import yi_0sys as system
 from . import yi_1tools as tools
 
+plt      = system.lazyimport( 'matplotlib.pyplot' )
+colormap = system.lazyimport( 'matplotlib.cm' )
+scipy    = system.lazyimport( 'scipy', ['scipy.stats'] )
+#          ^heavy modules are imported upon first use.
+
 dotsperinch = 140                 #  DPI resolution for plot.
 
 
@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2017-02-07
+#  Python Module for import                           Date : 2026-10-17
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263 
 ''' 
 _______________|  yi_quandl.py : Access Quandl with pandas for plots, etc.
@@ -31,7 +31,9 @@ like this:
 It will then be stored in your working directory for continued use.
 Authtokens are saved as pickled files in the local directory as "authtoken.p"
 so it is unnecessary to enter them more than once, unless you change your
-working directory. 
+working directory.  The token is loaded only once per process, and
+is shared by all calls, see qdlapi.config (environment variable
+QUANDL_API_KEY overrides authtoken.p).
 
 After creating an account at quandl.com, set your authentication token with
 the [Deprecated: Quandl.auth() function] setQuandlToken function below.
@@ -190,6 +192,21 @@ REFERENCES:
 
 
 CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  getqdl() requests rows=maxi when the cache has no entry,
+               instead of downloading entire history for a few rows.
+2026-10-17  Add cotr_batch() to compute composite COTR positions from
+               reports retrieved concurrently.  Trader category is
+               chosen by report schema in cotr_schema().
+2026-10-17  Add getcurve() and curvesnap() for futures term structures,
+               with contracts fetched concurrently via disk cache.
+2026-10-17  setQuandlToken() sets process-wide qdlapi.config,
+               without a dummy request.
+2026-10-17  Add quandlcache() to keep datasets on local disk,
+               updating stale ones incrementally with trim_start.
+2026-10-17  Declare synthetics in qdlsynth REGISTRY, see ys_synth, which
+               replaces the if/elif chain in getqdl(). Add getqdls()
+               and qdlplan(). Refactor cotr_fraction() and cotr_average()
+               from cotr_position*() so reports are shared.
 2017-02-07  Add quandlcode for Bitcoin count and USD price.
 2017-02-06  Use names() within getqdl() to standardize names.
 2016-11-05  Remove comments intended as code templates.
@@ -211,6 +228,8 @@ from . import yi_0sys as system
 from . import yi_1tools as tools         
 from . import yi_fred as fred            #  For: plotdf, freqM2MS
 from . import yi_timeseries as ts        #  esp. Holt-Winters.
+from . import ys_cache                   #  For: memoize
+from . import ys_synth as synth          #  Registry of synthetics.
 
 
 #      __________ Convenient ABBREVIATIONS for less typing of quotes:
@@ -286,13 +305,23 @@ def setQuandlToken( API_key ):
      '''Generate authtoken.p in the local directory for API access.'''
      #  Must have API key which is free by creating a Quandl account, 
      #  however, this is not necessary for very limited usage.
-     dummy = qdlapi.get("NSE/OIL", authtoken=API_key, rows=1)
-     #  The first request is all that matters for getting initiated.
+     qdlapi.config.settoken( API_key )
+     #  Thereafter every call in this process uses API_key, no reloading.
      print(' ::  Generated authtoken.p in local directory for API access.')
      #
      #  For security, authtoken.p shall not be committed via .gitignore
 
 
+def quandlcache( quandlcode ):
+     '''Retrieve entire Quandl dataset via local disk cache, see ys_cache.
+        A stale dataset is updated by requesting only its tail rows.
+     '''
+     def tail( start ):
+          return quandl( quandlcode, trim_start=start )
+     return ys_cache.cached( 'qdl', quandlcode,
+                             lambda: quandl( quandlcode ), tail )
+
+
 def cotr_get( futures='GC', type='FO' ):
      '''Get CFTC Commitment of Traders Report COTR.'''
      #  Report for futures only requested by type "F".
@@ -302,75 +331,118 @@ def cotr_get( futures='GC', type='FO' ):
      #  Traders' option positions are computed on a futures-equivalent basis
      #  using delta factors supplied by the exchanges.
      quandlcode = 'CFTC/' + futures + '_' + type + '_ALL'
-     return quandl( quandlcode )
+     return quandlcache( quandlcode )
+
+
+def cotr_schema( cotr ):
+     '''Trader category with directional positions in CFTC COTR report.'''
+     #  "Leveraged Funds" for FINANCIALS appear short-term, whereas 
+     #  "Asset Manager" takes longer term perspective.
+     #  "Money Manager" for COMMODITIES. 
+     #  The report is structured differently than financials.
+     for category in [ 'Asset Manager', 'Money Manager' ]:
+          if category + ' Longs' in cotr.columns:
+               return category
+     raise ValueError('COTR report lacks Asset or Money Manager positions.')
+
+
+def cotr_fraction( cotr ):
+     '''Extract market position from dataframe of CFTC COTR report.'''
+     category = cotr_schema( cotr )
+     longs  = cotr[ category + ' Longs' ]
+     shorts = cotr[ category + ' Shorts' ]
+     #                _Scale-free between 0 and 1 indicating bullishness.
+     return tools.todf( longs / (longs + shorts ))
 
 
 def cotr_position( futures='GC' ):
      '''Extract market position from CFTC Commitment of Traders Report.'''
-     cotr = cotr_get( futures )
+     return cotr_fraction( cotr_get( futures ) )
      #  Report for both futures and options requested by implicit "FO".
-     #
-     #  For directionality we use these categories:
-     try:
-          longs  = cotr['Asset Manager Longs']
-          shorts = cotr['Asset Manager Shorts']
-          #  "Leveraged Funds" for FINANCIALS appear short-term, whereas 
-          #  "Asset Manager" takes longer term perspective.
-     except:
-          longs  = cotr['Money Manager Longs']
-          shorts = cotr['Money Manager Shorts']
-          #  "Money Manager" for COMMODITIES. 
-          #  The report is structured differently than financials.
-          #
-     #                _Scale-free between 0 and 1 indicating bullishness.
-     return tools.todf( longs / (longs + shorts ))
+
+
+def cotr_average( *reports ):
+     '''Average market position across several CFTC COTR reports.'''
+     positions = [ cotr_fraction( cotr ) for cotr in reports ]
+     return tools.todf( sum( positions ) / float(len( positions )) )
 
 
 def cotr_position_usd():
      '''Market position for USD from COTR of JY and EC.'''
      #  We ignore USD index DX from ICE.
-     pos1 = cotr_position( 'JY' )
-     #                      JPY futures.
-     pos2 = cotr_position( 'EC' )
-     #                      EUR futures.
-     #
-     #                  _Inverts position relative to quotation styles.
-     #                      _Average reading between two contracts.
-     return tools.todf( 1 - ((pos1 + pos2) / 2.0) )
+     #                      JPY futures, EUR futures:
+     return tools.todf( 1 - cotr_average( cotr_get('JY'), cotr_get('EC') ))
+     #                  ^Inverts position relative to quotation styles.
 
 
 def cotr_position_metals():
      '''Market position for precious metals from COTR of GC and SI.'''
-     pos1 = cotr_position( 'GC' )
-     #                      Gold Comex
-     pos2 = cotr_position( 'SI' )
-     #                      Silver Comex
-     #
-     #                  _Average reading between two contracts.
-     return tools.todf( (pos1 + pos2) / 2.0 )
+     #                      Gold Comex, Silver Comex:
+     return cotr_average( cotr_get('GC'), cotr_get('SI') )
 
 
 def cotr_position_bonds():
      '''Market position for bonds from COTR of TY and ED.'''
-     pos1 = cotr_position( 'TY' )
-     #                      TY is 10-years.
-     pos2 = cotr_position( 'ED' )
-     #                      Eurodollar strips.
-     #
-     #                  _Average reading between two contracts.
-     return tools.todf( (pos1 + pos2) / 2.0 )
+     #                TY is 10-years, ED is Eurodollar strips:
+     return cotr_average( cotr_get('TY'), cotr_get('ED') )
 
 
 def cotr_position_equities():
      '''Market position for equities from COTR of both SP and ES.'''
-     pos1 = cotr_position( 'SP' )
-     #                      SP better for options reading.
-     pos2 = cotr_position( 'ES' )
-     #                      Minis better for reading futures.
-     #
-     #                  _Average reading between two contracts.
-     return tools.todf( (pos1 + pos2) / 2.0 )
+     #                SP better for options reading, 
+     #                   minis ES better for reading futures:
+     return cotr_average( cotr_get('SP'), cotr_get('ES') )
+
+
+
+#  COMPOSITE COTR positions: futures averaged, and whether inverted.
+cotr_composites = {
+     w4cotr_xau:      ( ('GC',),       False ),
+     w4cotr_metals:   ( ('GC', 'SI'),  False ),
+     w4cotr_usd:      ( ('JY', 'EC'),  True ),
+     w4cotr_bonds:    ( ('TY', 'ED'),  False ),
+     w4cotr_equities: ( ('SP', 'ES'),  False ) }
+#  USD is inverted relative to quotation styles of JPY and EUR futures.
+
 
+def cotr_reports( futures, workers=8 ):
+     '''Retrieve CFTC COTR reports CONCURRENTLY as dictionary by futures.'''
+     def fetch( f ):
+          code = 'CFTC/' + f + '_FO_ALL'
+          return ys_cache.memoize( 'qdl', code, lambda: cotr_get( f ))
+     return dict( zip(futures, system.pmap(fetch, futures, workers)) )
+
+
+def cotr_fractions( reports ):
+     '''Market positions of several COTR reports as one dataframe,
+        dates x futures, computed column-wise in one operation.
+     '''
+     futures = sorted( reports )
+     longs, shorts = [], []
+     for f in futures:
+          category = cotr_schema( reports[f] )
+          longs.append(  reports[f][ category + ' Longs' ] )
+          shorts.append( reports[f][ category + ' Shorts' ] )
+     longs  = pd.concat( longs,  axis=1, keys=futures )
+     shorts = pd.concat( shorts, axis=1, keys=futures )
+     return longs / (longs + shorts)
+
+
+def cotr_batch( codes=sorted(cotr_composites), workers=8 ):
+     '''Composite COTR positions for codes (see cotr_composites) as
+        one dataframe, dates x codes.  All underlying reports are
+        retrieved concurrently, and each is retrieved only once.
+     '''
+     futures = sorted( set( f for code in codes
+                            for f in cotr_composites[code][0] ))
+     fractions = cotr_fractions( cotr_reports(futures, workers) )
+     positions = []
+     for code in codes:
+          futs, inverted = cotr_composites[ code ]
+          #  Average only on dates common to all futures, as cotr_average:
+          position = fractions[ list(futs) ].mean( axis=1, skipna=False )
+          positions.append( 1 - position if inverted else position )
+     return pd.concat( positions, axis=1, keys=list(codes) )
 
 
 #   DICTIONARY to translate our futures slang to vendor code:
@@ -453,6 +525,122 @@ def getfut( slang, maxi=512, col='Settle' ):
      return tools.todf( fut[[ col ]] )
 
 
+#  TERM STRUCTURE: all contracts of a root across delivery months.
+
+#  Month codes in calendar order, January to December:
+fut_months = 'FGHJKMNQUVXZ'
+
+#  Delivery months LISTED for each root, else all twelve:
+fut_cycle = {
+    'f4libor':    'HMUZ',
+    'f4bond10':   'HMUZ',
+    'f4spx':      'HMUZ',
+    'f4spes':     'HMUZ',
+    'f4cad':      'HMUZ',
+    'f4gbp':      'HMUZ',
+    'f4chf':      'HMUZ',
+    'f4eur':      'HMUZ',
+    'f4jpy':      'HMUZ',
+    'f4xau':      'GJMQVZ',
+    'f4xag':      'FHKNUZ'}
+
+
+def fut_delivery( slang ):
+    '''Delivery month of futures slang as Timestamp, first of month.
+
+    >>> print(fut_delivery( 'f4xau15z' ).date())
+    2015-12-01
+    '''
+    fut_decode( slang )
+    #  ^validates slang, except month code:
+    month = fut_months.find( slang[-1].upper() ) + 1
+    if not month:
+        raise ValueError('Futures slang argument is invalid.')
+    return pd.Timestamp( int('20' + slang[-3:-1]), month, 1 )
+
+
+def fut_slangs( root, start, end, months=None ):
+    '''List of slang for contracts of root, e.g. 'f4xau', delivered
+       from start through end, given as 'yym' e.g. '16g' and '17z'.
+       months restricts delivery months, default per fut_cycle.
+
+    >>> fut_slangs( 'f4xau', '16v', '17g' )
+    ['f4xau16v', 'f4xau16z', 'f4xau17g']
+    '''
+    months = ( months or fut_cycle.get(root, fut_months) ).upper()
+    first = fut_delivery( root + start )
+    last  = fut_delivery( root + end )
+    slangs = []
+    for year in range( first.year, last.year + 1 ):
+        for m in months:
+            slang = root + str(year)[-2:] + m.lower()
+            if first <= fut_delivery( slang ) <= last:
+                slangs.append( slang )
+    return sorted( slangs, key=fut_delivery )
+
+
+def fut_contracts( slangs, workers=8 ):
+    '''Retrieve futures contracts CONCURRENTLY, via disk cache,
+       as dictionary of dataframes by slang.  Contracts not found,
+       e.g. not yet listed, are omitted with a warning.
+    '''
+    def fetch( slang ):
+        code = fut_decode( slang )
+        try:
+            return ys_cache.memoize( 'qdl', code,
+                                     lambda: quandlcache( code ))
+        except qdlapi.DatasetNotFound:
+            system.warn( 'Futures contract not found: ' + slang )
+            return None
+    dfs = system.pmap( fetch, slangs, workers )
+    return dict( (slang, df) for slang, df in zip(slangs, dfs)
+                 if df is not None )
+
+
+def getcurve( root, start, end, col='Settle', months=None, maxi=512,
+              workers=8 ):
+    '''Term structure of root as dataframe, dates x contracts:
+       col (e.g. 'Settle') of each contract delivered from start
+       through end, see fut_slangs().  Contracts are fetched
+       concurrently, and columns named by slang in delivery order.
+       maxi limits rows to the most recent dates.
+    '''
+    slangs = fut_slangs( root, start, end, months )
+    dfdic = fut_contracts( slangs, workers )
+    found = [ slang for slang in slangs if slang in dfdic ]
+    if not found:
+        raise ValueError( 'No futures contracts found for ' + root )
+    curve = pd.concat( [ dfdic[slang][col] for slang in found ],
+                       axis=1, join='outer', keys=found ).sort_index()
+    curve.index.name = 'T'
+    return curve.tail( maxi )
+
+
+def curvesnap( roots, start, end, date=None, col='Settle', workers=8 ):
+    '''Snapshot of term structures for several roots as dataframe,
+       delivery months x roots: the latest col value of each contract
+       as of date (default: most recent).  All contracts of all roots
+       are fetched concurrently in one batch.
+    '''
+    slangs = [ slang for root in roots
+               for slang in fut_slangs( root, start, end ) ]
+    dfdic = fut_contracts( slangs, workers )
+    snaps = []
+    for root in roots:
+        quotes = {}
+        for slang in fut_slangs( root, start, end ):
+            if slang in dfdic:
+                series = dfdic[ slang ][ col ].dropna()
+                if date is not None:
+                    series = series[ :date ]
+                if len( series ):
+                    quotes[ fut_delivery(slang) ] = series.iloc[ -1 ]
+        snaps.append( pd.Series(quotes, name=root, dtype=float) )
+    snap = pd.concat( snaps, axis=1 ).sort_index()
+    snap.index.name = 'Delivery'
+    return snap
+
+
 #  CONTINUOUS FUTURES CONTRACTS are also available:
 #  
 #  Quandl proides continuous (aka concatenated or chained) futures contracts from
@@ -494,35 +682,82 @@ def freqM2MS( dataframe ):
 #  esp. for underlying sources of reconstructed data.
 
 
+def spx_1871_p( price ):
+     '''Nominal monthly Shiller S&P500 price from MULTPL dataframe.'''
+     return tools.todf( freqM2MS( price ) )
+
+
+def spx_1871_e( ratio, price ):
+     '''Nominal Shiller S&P500 earnings from P/E ratio and price.'''
+     #  Gets price/earnings ratio, so solve for 12-month earnings.
+     earn  = tools.div( price, freqM2MS( ratio ) )
+     return tools.todf( earn )
+
+
+def spx_1871_d( dyield, price ):
+     '''Nominal Shiller S&P500 dividends from yield and price.'''
+     #  Gets dividend yield in percentage form, 
+     #  but we want just plain dividends over previous 12 months.
+     dyield = tools.todf(tools.div( freqM2MS( dyield ), 100 ))
+     return tools.todf( dyield * price )
+
+
 def getm4spx_1871_p():
      '''Retrieve nominal monthly Shiller S&P500 price, starting 1871.'''
-     price  = freqM2MS(quandl( 'MULTPL/SP500_REAL_PRICE_MONTH' ))
+     return spx_1871_p( quandl( 'MULTPL/SP500_REAL_PRICE_MONTH' ))
      #                           ^But they meant NOMINAL!
      #  Their inflation-adjusted monthly series is called
      #        MULTPL/SP500_INFLADJ_MONTH
      #  Alternative: official YALE/SPCOMP, but 9 months latency!
-     return tools.todf( price )
 
 
 def getm4spx_1871_e():
      '''Retrieve nominal monthly Shiller S&P500 earnings, starting 1871.'''
-     ratio = freqM2MS(quandl( 'MULTPL/SP500_PE_RATIO_MONTH' ))
-     #  Gets price/earnings ratio, so solve for 12-month earnings.
-     #  Alternative: official YALE/SPCOMP, but 9 months latency!
-     price = getm4spx_1871_p()
-     earn  = tools.div( price, ratio )
-     return tools.todf( earn )
+     return spx_1871_e( quandl( 'MULTPL/SP500_PE_RATIO_MONTH' ),
+                        getm4spx_1871_p() )
 
 
 def getm4spx_1871_d():
      '''Retrieve nominal monthly Shiller S&P500 dividends, starting 1871.'''
-     dyield = freqM2MS(quandl( 'MULTPL/SP500_DIV_YIELD_MONTH' ))
-     #  Gets dividend yield in percentage form, 
-     #  but we want just plain dividends over previous 12 months.
-     #  Alternative: official YALE/SPCOMP, but 9 months latency!
-     dyield = tools.todf(tools.div( dyield, 100 ))
-     price  = getm4spx_1871_p()
-     return tools.todf( dyield * price )
+     return spx_1871_d( quandl( 'MULTPL/SP500_DIV_YIELD_MONTH' ),
+                        getm4spx_1871_p() )
+
+
+
+#  ============================== REGISTRY of synthetic quandlcodes =======
+#
+#  Each entry DECLARES:  code : ( (input codes,), transform )
+#  where transform takes input dataframes in that order; see ys_synth.
+#  Inputs which are not registered are raw Quandl downloads.
+
+qdlsynth = {
+     w4cotr_xau:      ( ('CFTC/GC_FO_ALL',),                   cotr_fraction ),
+     w4cotr_metals:   ( ('CFTC/GC_FO_ALL', 'CFTC/SI_FO_ALL'),  cotr_average ),
+     w4cotr_usd:      ( ('CFTC/JY_FO_ALL', 'CFTC/EC_FO_ALL'),
+                        lambda jy, ec: tools.todf( 1 - cotr_average(jy, ec) )),
+     w4cotr_bonds:    ( ('CFTC/TY_FO_ALL', 'CFTC/ED_FO_ALL'),  cotr_average ),
+     w4cotr_equities: ( ('CFTC/SP_FO_ALL', 'CFTC/ES_FO_ALL'),  cotr_average ),
+
+     m4spx_1871_p:    ( ('MULTPL/SP500_REAL_PRICE_MONTH',),    spx_1871_p ),
+     m4spx_1871_e:    ( ('MULTPL/SP500_PE_RATIO_MONTH', m4spx_1871_p),
+                        spx_1871_e ),
+     m4spx_1871_d:    ( ('MULTPL/SP500_DIV_YIELD_MONTH', m4spx_1871_p),
+                        spx_1871_d ) }
+
+
+def qdlplan( quandlcodes ):
+     '''List of raw Quandl downloads needed to get all given quandlcodes.'''
+     return synth.plan( qdlsynth, quandlcodes )[0]
+
+
+def getqdls( quandlcodes ):
+     '''Retrieve several synthetic quandlcodes as dictionary of dataframes.
+        Leaf downloads and intermediate synthetics are shared.
+     '''
+     def fetch( code ):
+          return ys_cache.memoize( 'qdl', code, lambda: quandlcache( code ))
+     return synth.evaluate( qdlsynth, quandlcodes, fetch,
+                 lambda code, fun: ys_cache.memoize( 'getqdl', code, fun ))
 
 
 def getqdl( quandlcode, maxi=87654321 ):
@@ -531,31 +766,25 @@ def getqdl( quandlcode, maxi=87654321 ):
                  useful to limit data to last maxi rows, 
                  e.g. maxi=1 for most recent row only,
                  but NOT used in all cases below.
-     We can SYNTHESIZE a quandlcode by use of string equivalent arg.
+     We can SYNTHESIZE a quandlcode by use of string equivalent arg,
+     see qdlsynth REGISTRY above for declared synthetics.
+     A vanilla series comes from the local disk cache, see quandlcache(),
+     except that with a COLD cache and limited maxi, only the last maxi
+     rows are requested (and not cached), so maxi=1 stays cheap.
      '''
-     if   quandlcode == w4cotr_xau:
-          df = cotr_position( f4xau )
-     elif quandlcode == w4cotr_metals:
-          df = cotr_position_metals()
-     elif quandlcode == w4cotr_usd:
-          df = cotr_position_usd()
-     elif quandlcode == w4cotr_bonds:
-          df = cotr_position_bonds()
-     elif quandlcode == w4cotr_equities:
-          df = cotr_position_equities()
-
-     elif quandlcode == m4spx_1871_p:
-          df = getm4spx_1871_p()
-     elif quandlcode == m4spx_1871_e:
-          df = getm4spx_1871_e()
-     elif quandlcode == m4spx_1871_d:
-          df = getm4spx_1871_d()
+     if   quandlcode in qdlsynth:
+          df = getqdls([ quandlcode ])[ quandlcode ]
 
      elif quandlcode[:2] == 'f4':
           df = getfut( quandlcode )
 
-     else:
+     elif maxi < 87654321 and not ys_cache.exists( 'qdl', quandlcode ):
+          #  Cold cache and limited maxi: request just the last maxi rows,
+          #  rather than entire history for the cache (not kept here):
           df = quandl( quandlcode, rows=maxi )
+
+     else:
+          df = quandlcache( quandlcode ).tail( maxi )
      #                 ^just the vanilla series... so
      #                  for "transformation" and "collapse" (resampling), 
      #                  call quandl() directly.
@@ -2,17 +2,25 @@
 """
 Quandl's API for Python.
 Currently supports getting, searching, and pushing datasets.
+
+Auth token, base URL, and timeout are loaded once per process
+into the shared ApiConfig instance, config.
 """
 from __future__ import (print_function, division, absolute_import,
                         unicode_literals)
+import os
 import pickle
 import datetime
+import threading
 import json
 import pandas as pd
 import re
 from dateutil import parser
 from numpy import genfromtxt
 
+from . import yi_0sys as system
+from . import ys_http
+
 try:
     from urllib.error import HTTPError  # Python 3
     from urllib.parse import urlencode
@@ -29,6 +37,68 @@ except ImportError:
 QUANDL_API_URL = 'https://www.quandl.com/api/v1/'
 VERSION = '2.8.7'
 
+#Concurrent downloads for a list of datasets in get()
+MULTISET_WORKERS = 8
+
+#Rate limit for registered users: 2,000 calls per 10 minutes.
+scheduler = ys_http.Scheduler(rate=2000 / 600.0, burst=20)
+
+
+class ApiConfig(object):
+    """Process-wide client configuration: token, base URL, and timeout.
+
+    Loaded once, rather than unpickling authtoken.p on every call.
+    Environment variables override the defaults:
+        QUANDL_API_KEY      auth token (then authtoken.p is not read)
+        QUANDL_TOKEN_FILE   path of pickled token, default ./authtoken.p
+                            resolved when this module is first imported
+        QUANDL_API_URL      base URL of API calls
+        QUANDL_TIMEOUT      seconds per HTTP request
+    """
+
+    def __init__(self):
+        self.api_url = os.environ.get('QUANDL_API_URL', QUANDL_API_URL)
+        self.token_file = os.path.abspath(
+            os.environ.get('QUANDL_TOKEN_FILE', 'authtoken.p'))
+        self.session = ys_http.Session(
+            timeout=float(os.environ.get('QUANDL_TIMEOUT', 60)))
+        self._token = os.environ.get('QUANDL_API_KEY') or None
+        self._loaded = self._token is not None
+        self._lock = threading.Lock()
+
+    @property
+    def timeout(self):
+        return self.session.timeout
+
+    @timeout.setter
+    def timeout(self, seconds):
+        self.session.timeout = seconds
+
+    def token(self):
+        """Auth token, or '' if none: token_file is read only once."""
+        with self._lock:
+            if not self._loaded:
+                try:
+                    with open(self.token_file, 'rb') as f:
+                        self._token = pickle.load(f)
+                except (IOError, OSError, EOFError, pickle.UnpicklingError):
+                    self._token = None
+                self._loaded = True
+            return self._token or ''
+
+    def settoken(self, token, save=True):
+        """Use token for all calls, and save it to token_file for reuse."""
+        with self._lock:
+            self._token = token
+            self._loaded = True
+        if save:
+            with open(self.token_file, 'wb') as f:
+                pickle.dump(token, f)
+
+
+#Shared by all Quandl calls, e.g. from yi_quandl:
+config = ApiConfig()
+
 
 def get(dataset, **kwargs):
     """Return dataframe of requested dataset from Quandl.
@@ -45,6 +115,8 @@ def get(dataset, **kwargs):
     :param str returns: specify what format you wish your dataset returned as,
         either `numpy` for a numpy ndarray or `pandas`. Default: `pandas`
     :param bool verbose: specify whether to print output text to stdout, default is False.
+    :param int priority: ys_http.INTERACTIVE (default) is served before
+        ys_http.BACKGROUND when requests are queued by the rate scheduler.
     :param str text: Deprecated. Use `verbose` instead.
     :returns: :class:`pandas.DataFrame` or :class:`numpy.ndarray`
 
@@ -69,28 +141,33 @@ def get(dataset, **kwargs):
             kwargs.update({'column':dataset_columns})
 
 
-        url = QUANDL_API_URL + 'datasets/{}.csv?'.format(dataset)
+        url = config.api_url + 'datasets/{}.csv?'.format(dataset)
 
     #Array
     elif type(dataset) == list:
-        multiple_dataset_dataframe = pd.DataFrame()
-        for i in dataset:
+        def getone(i):
             try:
                 d = get(i,**kwargs)
             except DatasetNotFound:
-                d = pd.DataFrame({'NOT FOUND': []})
+                d = pd.DataFrame({'NOT FOUND': []}, index=pd.DatetimeIndex([]))
 
             # format dataset name for column name
             specific_column_name = i.split('.')[0].replace('/','.')
             d.rename(columns = lambda x: specific_column_name + ' - ' + x, inplace = True)
-            multiple_dataset_dataframe = pd.merge(multiple_dataset_dataframe,d,right_index = True,left_index = True,how='outer')
-        return multiple_dataset_dataframe
+            return d
+        # Fetch concurrently (still subject to the rate scheduler),
+        # then align all datasets in one multi-way outer join:
+        frames = system.pmap(getone, dataset, MULTISET_WORKERS)
+        if not frames:
+            return pd.DataFrame()
+        return pd.concat(frames, axis=1, join='outer').sort_index()
 
     #If wrong format
     else:
         error = "Your dataset must either be specified as a string (containing a Quandl code) or an array (of Quandl codes)"
         raise WrongFormat(error)
     #parse parameters
+    priority = kwargs.pop('priority', ys_http.INTERACTIVE)
     kwargs.setdefault('sort_order', 'asc')
     verbose = kwargs.get('verbose', False)
     if 'text' in kwargs:
@@ -113,19 +190,20 @@ def get(dataset, **kwargs):
     if returns == 'url':
         return url      # for test purpose
     try:
-        urldata = _download(url)
+        # Rate limited, queued by priority, retried if refused:
+        urldata = scheduler.call(lambda: _download(url), priority)
         if verbose and verbose != 'no':
             print("Returning Dataframe for ", dataset)
 
     #Error catching
     except HTTPError as e:
-        #API limit reached
-        if str(e) == 'HTTP Error 403: Forbidden':
+        #API limit reached (even after retries by scheduler)
+        if e.code in (403, 429):
             error = 'API daily call limit exceeded. Contact us at connect@quandl.com if you want an increased daily limit'
             raise CallLimitExceeded(error)
 
         #Dataset not found
-        elif str(e) == 'HTTP Error 404: Not Found':
+        elif e.code == 404:
             error = "Dataset not found. Check Quandl code: {} for errors".format(dataset)
             raise DatasetNotFound(error)
 
@@ -201,7 +279,7 @@ def push(data, code, name, authtoken='', desc='', override=False, verbose=False,
               'update_or_create': override,
               'data': datestr}
 
-    url = QUANDL_API_URL + 'datasets.json?auth_token=' + token
+    url = config.api_url + 'datasets.json?auth_token=' + token
     jsonreturn = _htmlpush(url, params)
     if (jsonreturn['errors']
         and jsonreturn['errors']['code'][0] == 'has already been taken'):
@@ -229,7 +307,7 @@ def search(query, source=None, page=1, authtoken=None, verbose=True, prints=None
         print('Deprecated: "prints" is depreciated and will be removed in next release, use "verbose" instead.')
         verbose = prints
     token = _getauthtoken(authtoken, verbose)
-    search_url = QUANDL_API_URL + '/datasets.json?request_source=python&request_version=' + VERSION + '&query='
+    search_url = config.api_url + '/datasets.json?request_source=python&request_version=' + VERSION + '&query='
     #parse query for proper API submission
     parsedquery = re.sub(" ", "+", query)
     parsedquery = re.sub("&", "+", parsedquery)
@@ -283,7 +361,11 @@ def _parse_dates(date):
 
 
 # Download data into pandas dataframe
+# (url may also be a file-like object with CSV content already downloaded)
 def _download(url):
+    if isinstance(url, (strings, str)):
+        # Pooled keep-alive connections with gzip and retries:
+        url = config.session.open(url)
     dframe = pd.read_csv(url, index_col=0, parse_dates=True)
     return dframe
 
@@ -305,30 +387,27 @@ def _pushcodetest(code):
     return code
 
 def _getauthtoken(token,text):
-    """Return and save API token to a pickle file for reuse."""
-    try:
-        savedtoken = pickle.load(open('authtoken.p', 'rb'))
-    except IOError:
-        savedtoken = False
+    """Return API token from process-wide config, saving a new one for reuse."""
     if token:
-        try:
-            pickle.dump(token, open('authtoken.p', 'wb'))
-            if text == "no" or text == False:
-                pass
+        if token != config.token():
+            try:
+                config.settoken(token)
+                if text == "no" or text == False:
+                    pass
 
-            else:
-                print("Token {} activated and saved for later use.".format(token))
-        except Exception as e:
-            print("Error writing token to cache: {}".format(str(e)))
+                else:
+                    print("Token {} activated and saved for later use.".format(token))
+            except Exception as e:
+                print("Error writing token to cache: {}".format(str(e)))
 
-    elif not savedtoken and not token:
+    elif not config.token():
             if text == "no" or text == False:
                 pass
             else:
                 print("No authentication tokens found: usage will be limited.")
                 print("See www.quandl.com/api for more information.")
-    elif savedtoken and not token:
-        token = savedtoken
+    else:
+        token = config.token()
         if text == "no" or text == False:
              pass
         else:
@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2016-02-22
+#  Python Module for import                           Date : 2026-10-17
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263 
 ''' 
 _______________|  yi_secform.py : module for SEC forms.
@@ -9,7 +9,22 @@ REFERENCES:
      - Jupyter notebook SEC-13F-parse.ipynb derives and debugs this module.
           For static view, see https://git.io/13F
 
+The Information Table of form 13F is parsed as XML in a single streaming
+pass by read13f(), so that large filings (thousands of rows) need neither
+an HTML rendering nor construction of every table on a page.
+Many filings are loaded concurrently into one HOLDINGS INDEX, keyed by
+manager, quarter, CUSIP, and put/call, which is queried without reparsing:
+
+          Usage:  holdings = index13f({ ('druck', '2015Q2'): url1,
+                                        ('druck', '2015Q3'): url2 })
+                  alloc13f( holdings, 'druck', '2015Q3', top=7 )
+                  changes13f( holdings, 'druck' )
+
 CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  parse13f() reads XML of the Information Table by streaming
+               read13f(), instead of all HTML tables by pd.read_html.
+               Add index13f() to load many filings concurrently,
+               with alloc13f() and changes13f() as queries.
 2016-02-22  Replace .sort(columns=...) with .sort_values(by=...)
                per future deprecation warning in pandas 0.17.1
 2015-12-20  python3 compatible: lib import fix.
@@ -19,58 +34,91 @@ CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
 
 from __future__ import absolute_import, print_function
 
+import re
+import io
 import numpy as np                #  for numerical work.
 import pandas as pd               #  for data munging.
-#      ^for best results, install lxml, and as fallback: bs4 & html5lib.
+import xml.etree.ElementTree as ET
 
 from . import yi_0sys as system
+from . import ys_http
 
 
 #  For doctest, Stanley Druckenmiller's "Duquesne Family Office" on 2015-08-14: 
 druck150814='http://www.sec.gov/Archives/edgar/data/1536411/000153641115000006/xslForm13F_X01/form13f_20150630.xml'
 
 
-def parse13f( url=druck150814 ):
-     '''Parse SEC form 13F into a pandas dataframe.'''
-     #     url should be for so-called Information Table in html/xml format.
-     url = url.replace('https://', 'http://')
-     #                  https cannot be read by lxml, surprisingly!
-     #
-     #  Use pandas to read in the xml page...
-     #  See http://pandas.pydata.org/pandas-docs/stable/generated/pandas.read_html.html
-     #  It searches for <table> elements and only for <tr> and <th> rows 
-     #  and <td> elements within each <tr> or <th> element in the table.
-     page = pd.read_html( url )
-     #  page is a list of length 4, but only the 
-     #  last element of page interests us which turns out to be a dataframe!
-     df = page[-1]
-     #
-     #  Let's rename columns for our sanity:
-     df.columns = [ 'stock', 'class', 'cusip', 'usd', 'size', 'sh_prin', 
-          'putcall', 'discret', 'manager', 'vote1', 'vote2', 'vote3' ] 
-     #  First three ROWS are SEC labels, not data, so delete them:
-     df = df[3:]
-     #  reset_index to start from 0 instead of 3,
-     #               drop previous 'index', default is to retain:
-     df.reset_index( drop=True )
-     #
+#  Columns of parse13f() and their tags in XML Information Table:
+columns13f = [ ('stock',   'nameOfIssuer'),
+               ('class',   'titleOfClass'),
+               ('cusip',   'cusip'),
+               ('usd',     'value'),
+               ('size',    'sshPrnamt'),
+               ('sh_prin', 'sshPrnamtType'),
+               ('putcall', 'putCall'),
+               ('discret', 'investmentDiscretion'),
+               ('manager', 'otherManager'),
+               ('vote1',   'Sole'),
+               ('vote2',   'Shared'),
+               ('vote3',   'None') ]
+
+numeric13f = [ 'usd', 'size', 'vote1', 'vote2', 'vote3' ]
+
+
+def xmlurl( url ):
+     '''URL of raw XML Information Table, given its rendered view.
+     >>> print(xmlurl( 'http://www.sec.gov/Archives/edgar/data/1/2/xslForm13F_X01/a.xml' ))
+     http://www.sec.gov/Archives/edgar/data/1/2/a.xml
+     '''
+     #  EDGAR renders XML by stylesheet in a pseudo-directory "xsl...":
+     return re.sub( r'/xsl[^/]*/', '/', url )
+
+
+def read13f( source ):
+     '''Parse XML Information Table of SEC form 13F into dataframe,
+        streaming row by row.  Source is a file name, file object, or url.
+     '''
+     if hasattr( source, 'startswith' ) and '://' in source:
+          source = ys_http.urlopen( xmlurl(source) )
+     tags = dict( (tag, col) for col, tag in columns13f )
+     rows = []
+     row = {}
+     for event, elem in ET.iterparse( source, events=('end',) ):
+          tag = elem.tag.rsplit( '}', 1 )[-1]
+          #                ^drop XML namespace.
+          if tag == 'infoTable':
+               rows.append( row )
+               row = {}
+               elem.clear()
+               #  ^free memory of completed row.
+          elif tag in tags:
+               row[ tags[tag] ] = (elem.text or '').strip() or None
+     df = pd.DataFrame( rows, columns=[ col for col, tag in columns13f ] )
+     for col in numeric13f:
+          df[ col ] = pd.to_numeric( df[col] )
      #      df is the pandas DATAFRAME fully representing a 13F view.
-     #         Some columns may need numeric type conversion later.
      return df
 
 
+def parse13f( url=druck150814 ):
+     '''Parse SEC form 13F into a pandas dataframe.'''
+     #     url for so-called Information Table in html/xml format.
+     #  2026-10-17 Formerly pd.read_html( url ) built all tables on
+     #             the rendered page, keeping just the last one.
+     return read13f( url )
+
 
 def pcent13f( url=druck150814, top=7654321 ):
      '''Prune, then sort SEC 13F by percentage allocation, showing top N.
      >>> pcent13f( top= 7 )
                            stock      cusip     usd putcall  pcent
-     27          SPDR Gold Trust  78463V907  323626     NaN  21.81
-     15             Facebook Inc  30303M102  160612     NaN  10.82
-     29         Wells Fargo & Co  949746101   94449     NaN   6.36
-     31  LyondellBasell Ind's NV  N53745100   74219     NaN   5.00
-     18           Halliburton Co  406216101   66629     NaN   4.49
-     16     Freeport-McMoRan Inc  35671D857   66045     NaN   4.45
-     8             Citigroup Inc  172967424   64907     NaN   4.37
+     24          SPDR Gold Trust  78463V907  323626     NaN  21.81
+     12             Facebook Inc  30303M102  160612     NaN  10.82
+     26         Wells Fargo & Co  949746101   94449     NaN   6.36
+     28  LyondellBasell Ind's NV  N53745100   74219     NaN   5.00
+     15           Halliburton Co  406216101   66629     NaN   4.49
+     13     Freeport-McMoRan Inc  35671D857   66045     NaN   4.45
+     5             Citigroup Inc  172967424   64907     NaN   4.37
      '''
      df = parse13f( url )
      #    Drop irrevelant COLUMNS:
@@ -96,5 +144,52 @@ def pcent13f( url=druck150814, top=7654321 ):
 
 
 
+#  ______________ HOLDINGS INDEX across managers and quarters
+
+def index13f( filings, workers=8 ):
+     '''Load filings CONCURRENTLY into one holdings dataframe indexed by
+        (manager, quarter, cusip, putcall), where filings is a dictionary
+        { (manager, quarter): source } with source as for read13f().
+        Rows of a filing with same cusip and putcall ('' for shares)
+        are summed.  Column pcent is allocation within each filing.
+     '''
+     keys = sorted( filings )
+     dfs = system.pmap( lambda key: read13f( filings[key] ), keys, workers )
+     frames = []
+     for (manager, quarter), df in zip( keys, dfs ):
+          df = df[[ 'stock', 'cusip', 'usd', 'size', 'putcall' ]].copy()
+          df['putcall'] = df['putcall'].fillna( '' )
+          df['manager'] = manager
+          df['quarter'] = quarter
+          frames.append( df )
+     holdings = pd.concat( frames, ignore_index=True )
+     holdings = holdings.groupby([ 'manager', 'quarter', 'cusip', 'putcall' ]
+                   ).agg({ 'stock': 'first', 'usd': 'sum', 'size': 'sum' })
+     #  Percentage of total portfolio in USD per filing, in one pass:
+     totals = holdings['usd'].groupby( level=['manager', 'quarter']
+                                     ).transform( 'sum' )
+     holdings['pcent'] = np.round(( holdings['usd'] / totals ) * 100, 2 )
+     return holdings.sort_index()
+
+
+def alloc13f( holdings, manager, quarter, top=7654321 ):
+     '''Positions of manager in quarter sorted by allocation, top N,
+        from index13f() holdings, cf. pcent13f().
+     '''
+     df = holdings.xs( (manager, quarter), level=['manager', 'quarter'] )
+     return df.sort_values( by=['usd'], ascending=[False] ).head( top )
+
+
+def changes13f( holdings, manager, col='size' ):
+     '''Quarter-over-quarter changes of col for manager as dataframe,
+        (cusip, putcall) x quarters.  A new position counts from zero,
+        and a closed position goes to zero.
+     '''
+     table = holdings.xs( manager, level='manager' )[ col ].unstack(
+                                                      'quarter' )
+     table = table.fillna( 0 )
+     return table.diff( axis=1 ).iloc[:, 1:]
+
+
 if __name__ == "__main__":
      system.endmodule()
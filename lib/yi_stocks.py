@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2017-02-06
+#  Python Module for import                           Date : 2026-10-17
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263 
 ''' 
 _______________|  yi_stocks.py : Access stock quotes.
@@ -20,6 +20,20 @@ premium pro vendors, we shall use the convenient pandas API.)
                   #  by importing deprecated pandas.io
                   #  instead of pandas_datareader.
 
+All OHLCV columns of a stock are kept in the local disk cache (see
+ys_cache) under key slang:maxi, so that e.g. stock_one( slang, col='Volume' )
+after getstock( slang ) is served without retrieval.  Several stocks are
+retrieved concurrently by stock_batch():
+
+          Usage:  dfdic = stock_batch([ 's4spy', 's4gld' ], 365 )
+
+Data SOURCES are pluggable: sources lists names in readers which are
+tried in order.  A local directory of CSV files can stand in for the
+vendors, e.g. in tests and benchmarks:
+
+          Usage:  addsource( 'local', fixture('fixtures/stocks') )
+                  setsource( 'local' )
+
 REFERENCES:
 
 - pandas Remote Data Access (also for World Bank data)
@@ -32,6 +46,10 @@ REFERENCES:
 
 
 CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  Import pandas_datareader lazily upon first use.
+2026-10-17  Add stock_batch() for concurrent retrieval, keeping all
+               OHLCV columns in disk cache.  Sources are pluggable,
+               see readers, addsource(), setsource() and fixture().
 2017-02-06  Use names() within getstocks() to standardize names.
 2015-12-20  python3 compatible: lib import fix.
 2015-12-17  python3 compatible: fix with yi_0sys
@@ -44,13 +62,15 @@ CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
 
 from __future__ import absolute_import, print_function
 
+import os
 import datetime        #  pddata necessity.
-try:
-    import pandas_datareader.data as pddata  
-    #  for pandas 0.17 and above
-except:
-    import pandas.io.data as pddata
-    #  For old deprecated pandas
+import pandas as pd
+from . import yi_0sys as system
+
+pddata = system.lazyimport( 'pandas_datareader.data',
+                            fallback='pandas.io.data' )
+#  pandas_datareader for pandas 0.17 and above, imported upon first use,
+#  else pandas.io.data for old deprecated pandas.
 
 #  In pandas 0.17.0, the sub-package pandas.io.data will be removed 
 #  in favor of a separately installable pandas-datareader package. 
@@ -58,8 +78,8 @@ except:
 #  to your pandas installation. The API for pandas-datareader v0.1.1 
 #  is the same as in pandas v0.16.1. (GH8961)
 
-from . import yi_0sys as system
 from . import yi_1tools as tools
+from . import ys_cache
 
 
 #      __________ Convenient ABBREVIATIONS for less typing of quotes:
@@ -92,14 +112,49 @@ def stock_decode( slang ):
     return symbol
 
 
-def stock_all( slang, maxi=3650 ):
-     '''slang string retrieves ALL columns for single stock.
+#      __________ Data SOURCES of OHLCV quotes:
 
-     The slang string consists of 's4' + symbol, all in lower case, 
-     e.g. 's4spy' for SPY.
+def vendor( name ):
+     '''Reader of symbol between start and end dates via pandas_datareader.'''
+     def reader( symbol, start, end ):
+          return pddata.DataReader( symbol, name, start, end )
+     return reader
 
-     maxi is set to default of ten years past data.
+
+def fixture( directory ):
+     '''Reader of local file directory/SYMBOL.csv, e.g. as recorded
+        from a vendor, to stand in for vendors in tests and benchmarks.
      '''
+     def reader( symbol, start, end ):
+          df = pd.read_csv( os.path.join(directory, symbol + '.csv'),
+                            index_col=0, parse_dates=True )
+          return df[ start:end ]
+     return reader
+
+
+#  REGISTRY of sources by name, each reader( symbol, start, end ):
+readers = { 'yahoo':  vendor( 'yahoo' ),
+            'google': vendor( 'google' ) }
+
+#  Names of sources tried in order, i.e. Yahoo Finance before Google:
+sources = [ 'yahoo', 'google' ]
+
+
+def addsource( name, reader ):
+     '''Register reader( symbol, start, end ) of OHLCV under name.'''
+     readers[ name ] = reader
+
+
+def setsource( *names ):
+     '''Use sources in readers by names, tried in given order.'''
+     for name in names:
+          if name not in readers:
+               raise ValueError('Unknown stock source: ' + name)
+     sources[:] = names
+
+
+def stock_fetch( symbol, maxi=3650 ):
+     '''Retrieve OHLCV for symbol from first source which succeeds.'''
      #       Typical:  start = datetime.datetime(2013, 1, 20)
      #       but we just want the most current window of data.
      now   = datetime.datetime.now()
@@ -108,16 +163,47 @@ def stock_all( slang, maxi=3650 ):
      start = end - datetime.timedelta( days=maxi )
      #             Date offsets are chronological days, 
      #             NOT trading days.
+     errors = []
+     for name in sources:
+          try:
+               return readers[ name ]( symbol, start, end )
+          except Exception as e:
+               errors.append( name + ': ' + str(e) )
+     raise ValueError( 'Cannot retrieve stock ' + symbol + ' :: '
+                       + '; '.join(errors) )
+
+
+def stock_all( slang, maxi=3650 ):
+     '''slang string retrieves ALL columns for single stock.
+
+     The slang string consists of 's4' + symbol, all in lower case, 
+     e.g. 's4spy' for SPY.
+
+     maxi is set to default of ten years past data.
+     All columns are kept in disk cache under key slang:maxi.
+     '''
      symbol = stock_decode( slang )
-     #
-     #        MAIN: use Yahoo Finance before Google Finance:
-     try:
-          df = pddata.DataReader( symbol, 'yahoo',  start, end )
-          print(" ::  Retrieved from Yahoo Finance: " + symbol )
-     except:
-          df = pddata.DataReader( symbol, 'google', start, end )
-          print(" ::  Retrieved from Google Finance: " + symbol)
-     return df
+     key = slang + ':' + str( maxi )
+     fetch = lambda: stock_fetch( symbol, maxi ).astype( float )
+     #                                   ^binary cache keeps floats.
+     return ys_cache.memoize( 'stock', key,
+                              lambda: ys_cache.cached( 'stock', key, fetch ))
+
+
+def stock_batch( slangs, maxi=3650, workers=8 ):
+     '''Retrieve ALL columns of several stocks CONCURRENTLY
+        as dictionary of dataframes by slang.
+        A stock which fails is reported, then omitted.
+     '''
+     def retrieve( slang ):
+          try:
+               return stock_all( slang, maxi )
+          except Exception as e:
+               system.warn( slang + ' :: ' + str(e), stub="stock_batch failed:" )
+               return None
+     dfs = system.pmap( retrieve, slangs, workers )
+     return dict( (slang, df) for slang, df in zip(slangs, dfs)
+                  if df is not None )
 
 
 def stock_one( slang, maxi=3650, col='Close' ):
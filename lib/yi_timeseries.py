@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2017-04-11
+#  Python Module for import                           Date : 2026-10-17
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263 
 ''' 
 _______________|  yi_timeseries : essential time series functions.
@@ -33,10 +33,25 @@ REFERENCES:
 
 N.B. -  rolling_* methods, including rolling_apply, only work on one-dimensional 
 array, thus we may work outside pandas in numpy, then bring back the results.
-See holt_winters_growth() vs. holt().
+See holt_winters_growth() vs. holt().  In hot loops, e.g. optimization,
+convert data once by holtarray(), then use holtar() which skips pandas.
+For many series at once, holtbatch() runs a single pass over columns.
+For streaming updates, HoltState filters just the new observations.
 
 
 CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  holtbatch() indexes via tools.alongaxis(), not numpy 1.15+
+               take_along_axis() and put_along_axis().
+2026-10-17  HoltState.update() takes last for unindexed data, else resets
+               it; todict() records the type of last for fromdict().
+2026-10-17  Add HoltState for incremental updates from latest level and
+               growth, and holtcontinue() to resume the filter.
+2026-10-17  Add holtfilter() along axis 0, and holtbatch() for many series
+               at once with per-column NaNs and forecasts.
+2026-10-17  Add holtarray() and holtar() for array in, arrays out.
+2026-10-17  holt_winters_growth() computes level and growth as linear
+               filters by scipy.signal.lfilter, replacing Python loop.
+2026-10-17  Heavy dependencies are imported lazily upon first use.
 2016-12-20  Update introduction: tests and optimization.
 2016-12-14  Fix initial guess of b[0] for holt_winters_growth(),
                especially critical when beta=0 e.g. in new ema().
@@ -54,12 +69,15 @@ CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
 
 from __future__ import absolute_import, print_function
 
-import matplotlib.pyplot as plt
+import datetime
 import pandas as pd
 import numpy as np
 
 from . import yi_0sys as system 
-from .yi_1tools import todf
+plt = system.lazyimport( 'matplotlib.pyplot' )
+signal = system.lazyimport( 'scipy.signal' )
+#     ^imported upon first use.
+from .yi_1tools import todf, alongaxis
 
 
 #  Holt-Winters default parameters
@@ -67,30 +85,115 @@ hw_alpha = 0.26      #  Based on robust optimization in Gelper 2007,
 hw_beta  = 0.19      #  for Gaussian, fat tail, and outlier data.
 
 
-def holt_winters_growth( y, alpha=hw_alpha, beta=hw_beta ):
-     '''Helper for Holt-Winters growth (linear) model using numpy arrays.'''
+def holtfilter( y, alpha=hw_alpha, beta=hw_beta ):
+     '''Holt-Winters level and growth along axis 0 of array y
+        (1-D, or 2-D as time x series) without NaN: [l, b].'''
      #  N.B. -  SEASONAL variant of Holt-Winters is omitted.
-     N = y.size             #  y should be a numpy array.
      #                         0 < alpha and beta < 1
-     alphac = 1 - alpha     #  Complements of alpha and beta
-     betac  = 1 - beta      #     pre-computed before the loop.
-     #   Create ndarrays filled with zeros to be updated 
-     #   as the y data comes in:
-     l = np.zeros(( N, ))   #  Fill level array with zeros.
-     l[0] = y[0]            #  Initialize level.
-     b = np.zeros(( N, ))   #  Smoothed one-step growths.
+     #  The recursion, formerly a Python loop over i in range(1, N):
+     #       l[i] = (alpha * y[i]) + (alphac * (l[i-1] + b[i-1]))
+     #       b[i] = (beta * (l[i] - l[i-1])) + (betac * b[i-1])
+     #              ^change in smoothed level, not ydelta !!
+     #  is LINEAR with constant coefficients.  Eliminating b from the
+     #  level equation by z-transform, both l and b are outputs of 
+     #  second-order linear filters of y, which are computed by
+     #  compiled scipy.signal.lfilter (for all columns at once):
+     #       l:  numerator [alpha, -alpha*betac]
+     #       b:  numerator [alpha*beta, -alpha*beta]
+     #           common denominator [1, -(2 - alpha - alpha*beta), alphac]
+     y = np.asarray( y, dtype=float )
+     l0 = y[0]              #  Initialize level.
      #  b[0] = y[1] - y[0]  #  Propagates errors if beta=0; fixed 2016-12-14:
-     b[0] = 0               #  Algorithmically the correct guess if beta=0.
-     for i in range( 1, N ):
-          l[i] = (alpha * y[i]) + (alphac * (l[i-1] + b[i-1]))
-          ldelta = l[i] - l[i-1]
-          #      ^change in smoothed data = proxy for implicit growth.
-          b[i] = (beta * ldelta) + (betac * b[i-1])
-          #              ^not ydelta !!
+     b0 = np.zeros_like( l0 )  #  Algorithmically correct guess if beta=0.
+     l = np.empty( y.shape )
+     b = np.empty( y.shape )
+     l[0] = l0
+     b[0] = b0
+     l[1:], b[1:] = holtcontinue( y[1:], l0, b0, alpha, beta )
      return [ l, b ]
      #        ^^^^ these are arrays.
 
 
+def holtcontinue( y, l0, b0, alpha=hw_alpha, beta=hw_beta ):
+     '''Continue Holt-Winters filter from level l0 and growth b0
+        over new observations y along axis 0: [l, b] for y.'''
+     alphac = 1 - alpha     #  Complements of alpha and beta.
+     betac  = 1 - beta
+     a = [ 1.0, -(2 - alpha - alpha*beta), alphac ]
+     #  Filter states, in transposed direct form II, which
+     #  continue the recursion from prior level and growth:
+     zl = np.array([ alphac * (l0 + b0), -alphac * l0 ])
+     zb = np.array([ -alpha*beta * l0 + (1 - alpha*beta) * b0, -alphac * b0 ])
+     l = signal.lfilter( [alpha, -alpha*betac], a, y, axis=0, zi=zl )[0]
+     b = signal.lfilter( [alpha*beta, -alpha*beta], a, y, axis=0, zi=zb )[0]
+     return [ l, b ]
+
+
+def holt_winters_growth( y, alpha=hw_alpha, beta=hw_beta ):
+     '''Helper for Holt-Winters growth (linear) model using numpy arrays.'''
+     return holtfilter( np.asarray(y, dtype=float).ravel(), alpha, beta )
+     #                                  y may be of shape (N, 1)^
+
+
+def holtbatch( Y, h=12, alpha=hw_alpha, beta=hw_beta ):
+     '''Holt-Winters growth model for many series at once, given 2-D
+        array Y (time x series): [levels, growths, forecasts].
+        Levels and growths are aligned with Y, NaN where Y is NaN.
+        Forecasts of shape (h+1, series), see holtforecast().
+     '''
+     #  Each column is filtered just as holt() would after its dropna():
+     #  valid values are moved to the top of their column, preserving
+     #  order, so that leading (and interior) NaNs are skipped and all
+     #  columns start together on row 0 for a single holtfilter() pass.
+     Y = np.asarray( Y, dtype=float )
+     if Y.ndim == 1:
+          Y = Y.reshape(( -1, 1 ))
+     missing = np.isnan( Y )
+     order = np.argsort( missing, axis=0, kind='mergesort' )
+     #                                       ^stable sort.
+     packed = Y[ alongaxis( order, axis=0 ) ]
+     counts = ( ~missing ).sum( axis=0 )
+     #  Columns without data are filtered as zeros, then discarded:
+     packed[ :, counts == 0 ] = 0.0
+     lpacked, bpacked = holtfilter( packed, alpha, beta )
+     #  Trailing NaNs in packed only spoil rows past the valid values.
+     levels = np.full( Y.shape, np.nan )
+     growths = np.full( Y.shape, np.nan )
+     levels[ alongaxis( order, axis=0 ) ] = lpacked
+     growths[ alongaxis( order, axis=0 ) ] = bpacked
+     levels[ missing ] = np.nan
+     growths[ missing ] = np.nan
+     #  Forecasts from the last valid row of each column:
+     last = np.maximum( counts - 1, 0 ).reshape(( 1, -1 ))
+     pick = alongaxis( last, axis=0 )
+     ylast = packed[ pick ][0]
+     llast = lpacked[ pick ][0]
+     blast = bpacked[ pick ][0]
+     steps = np.arange( 1, h+1 ).reshape(( -1, 1 ))
+     forecasts = np.vstack([ ylast, llast + (blast * steps) ])
+     #                       ^last actual point
+     forecasts[ :, counts == 0 ] = np.nan
+     return [ levels, growths, forecasts ]
+
+
+def holtarray( data ):
+     '''Data as 1-D float array without NaN, as used by holt().'''
+     #  Convert ONCE, then call holtar() repeatedly, e.g. in optimization.
+     y = np.asarray( data, dtype=float ).ravel()
+     #                         ^dataframe should be single column.
+     return y[ ~np.isnan(y) ]
+
+
+def holtar( y, alpha=hw_alpha, beta=hw_beta ):
+     '''Holt-Winters growth model, array in and arrays out: [y, l, b].'''
+     #  Same as holt() columns Y, Level, Growth, without pandas overhead,
+     #  given y from holtarray(); otherwise converted here.
+     if not ( isinstance(y, np.ndarray) and y.ndim == 1 ):
+          y = holtarray( y )
+     l, b = holt_winters_growth( y, alpha, beta )
+     return [ y, l, b ]
+
+
 def holt( data, alpha=hw_alpha, beta=hw_beta ):
      '''Holt-Winters growth (linear) model outputs workout dataframe.'''
      #  holt is an EXPENSIVE function, so retain its output for later.
@@ -147,6 +250,104 @@ def holtforecast( holtdf, h=12 ):
      return todf( forecasts, 'Forecast' )
 
 
+class HoltState( object ):
+     '''Latest state of Holt-Winters growth model, updated incrementally:
+        level, growth, alpha, beta, last observation y at index last.
+        Only the new observations are filtered, not the whole history.
+
+          Usage:  state = HoltState.fromholt( holt(data, alpha, beta),
+                                              alpha, beta )
+                  state.update( newdata )     #  Series, list, or scalar.
+                  state.forecast( h=12 )      #  as holtforecast()
+                  json.dumps( state.todict() )
+     '''
+
+     def __init__( self, level, growth, alpha=hw_alpha, beta=hw_beta,
+                   y=None, last=None ):
+          self.level  = float( level )
+          self.growth = float( growth )
+          self.alpha  = float( alpha )
+          self.beta   = float( beta )
+          self.y      = self.level if y is None else float( y )
+          self.last   = last
+          #  ^index (e.g. timestamp) of latest observation, if known.
+
+     def __repr__( self ):
+          return ( 'HoltState(level=%r, growth=%r, alpha=%r, beta=%r, '
+                   'y=%r, last=%r)' % ( self.level, self.growth, self.alpha,
+                                        self.beta, self.y, self.last ) )
+
+     @classmethod
+     def fromholt( cls, holtdf, alpha=hw_alpha, beta=hw_beta ):
+          '''State from last row of holt() workout dataframe,
+             given the alpha and beta used by holt().'''
+          y, l, b = holtdf[-1:].values.tolist()[0]
+          return cls( l, b, alpha, beta, y, holtdf.index[-1] )
+
+     def update( self, data, last=None ):
+          '''Filter new observations: scalar, list, array, Series or
+             single column dataframe.  Observations indexed at or
+             before last are skipped, NaN is dropped.  Returns self.
+             For unindexed data, give last as the index of its latest
+             observation, else last becomes None (unknown), and then
+             the next indexed update is applied in full.
+          '''
+          index = None
+          if isinstance( data, (pd.Series, pd.DataFrame) ):
+               data = todf( data.copy() )
+               if self.last is not None and len( data ):
+                    data = data[ data.index > self.last ]
+               index = data.index
+          y = np.atleast_1d( np.asarray(data, dtype=float).ravel() )
+          y = y[ ~np.isnan(y) ]
+          if not y.size:
+               return self
+          l, b = holtcontinue( y, self.level, self.growth,
+                               self.alpha, self.beta )
+          self.level  = float( l[-1] )
+          self.growth = float( b[-1] )
+          self.y      = float( y[-1] )
+          self.last   = last if index is None else index[-1]
+          return self
+
+     def forecast( self, h=12 ):
+          '''Forecast ahead h periods, as holtforecast() given holt().'''
+          forecasts = [ self.y ] + [ self.level + (self.growth*(i+1))
+                                     for i in range(h) ]
+          #            ^last actual point
+          return todf( forecasts, 'Forecast' )
+
+     def todict( self ):
+          '''Serializable dictionary, e.g. for JSON, with last as
+             a string, integer or float, and its type in lasttype.'''
+          last = self.last
+          if last is None:
+               lasttype = None
+          elif isinstance( last, (pd.Timestamp, datetime.date) ):
+               last, lasttype = [ pd.Timestamp(last).isoformat(),
+                                  'timestamp' ]
+          elif isinstance( last, (int, np.integer) ):
+               last, lasttype = [ int(last), 'int' ]
+          elif isinstance( last, (float, np.floating) ):
+               last, lasttype = [ float(last), 'float' ]
+          else:
+               last, lasttype = [ str(last), 'str' ]
+          return { 'level': self.level, 'growth': self.growth,
+                   'alpha': self.alpha, 'beta': self.beta,
+                   'y': self.y, 'last': last, 'lasttype': lasttype }
+
+     @classmethod
+     def fromdict( cls, dic ):
+          '''State from todict() output.'''
+          last = dic.get( 'last' )
+          if last is not None:
+               convert = { 'timestamp': pd.Timestamp, 'int': int,
+                           'float': float, 'str': str }
+               last = convert[ dic['lasttype'] ]( last )
+          return cls( dic['level'], dic['growth'], dic['alpha'],
+                      dic['beta'], dic.get('y'), last )
+
+
 def plotholt( holtdf, h=12 ):
      '''Given a dataframe from holt, plot forecasts h periods ahead.'''
      #  plotdf will not work since index there is assumed to be dates.
@@ -0,0 +1,328 @@
+#  Python Module for import                           Date : 2026-10-17
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+'''
+_______________|  ys_aio.py : asyncio retrieval, awaitable get and groupget.
+
+The functions getdata_fred(), yi_quandl_api.get() and stock_all() all
+block on network I/O, so an asyncio application would otherwise need one
+executor thread per request.  Here the network I/O runs natively on the
+event loop, while CPU-bound parsing and synthesis are handed off to an
+executor, so that hundreds of series can be in flight on one loop:
+
+          Usage:  df = await aget( d4xau )
+                  groupdf = await agroupget( group4d )
+
+Retrieval follows get() and groupget() in module fecon235: each code
+is routed to one backend by ys_route.  Synthetic series declared in the
+registries fredsynth and qdlsynth (see ys_synth) are planned first, so all
+their leaf downloads proceed concurrently and are shared.  FRED leaves
+go through the disk cache of ys_cache.  Stock quotes have no plain HTTP
+source here, so getstock() runs in the executor.
+
+Requires Python 3.5 or above (async/await syntax), so this module
+is imported by fecon235 only when available.
+
+CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  hostlimit is shared with fecon235 via ys_http.
+2026-10-17  Quandl rate limit is awaited on the event loop, and refused
+               calls are retried with backoff as by the blocking client.
+2026-10-17  fetch() records or replays via tape of ys_http, see ys_replay.
+2026-10-17  Quandl downloads wait for rate of qdlapi.scheduler.
+2026-10-17  Route each code to one backend via ys_route.
+2026-10-17  First version with minimal HTTP/1.1 client over asyncio.
+'''
+
+from __future__ import absolute_import, print_function
+
+import io
+import ssl
+import zlib
+import asyncio
+from urllib.error import HTTPError
+from urllib.parse import urlsplit, urljoin
+from email.message import Message
+
+from . import yi_0sys as system
+from . import yi_1tools as tools
+from . import yi_fred as fred
+from . import yi_quandl as qdl
+from . import yi_quandl_api as qdlapi
+from . import yi_stocks as stocks
+from . import ys_cache
+from . import ys_http
+from . import ys_route
+from . import ys_synth as synth
+
+
+#  Concurrent connections per data HOST, same as for groupget():
+hostlimit = ys_http.hostlimit
+
+timeout   = 60      #  seconds per HTTP request.
+redirects = 5       #  maximum redirects to follow.
+
+
+
+#  ______________ Minimal HTTP/1.1 client (GET only)
+
+async def _readbody( reader, headers ):
+    '''Read response body per Transfer-Encoding or Content-Length.'''
+    if headers.get('transfer-encoding', '').lower() == 'chunked':
+        chunks = []
+        while True:
+            line = await reader.readline()
+            size = int( line.split(b';')[0].strip(), 16 )
+            if size == 0:
+                #  Skip any trailer headers up to the blank line:
+                while (await reader.readline()) not in (b'\r\n', b'\n', b''):
+                    pass
+                break
+            chunks.append( await reader.readexactly(size) )
+            await reader.readline()
+            #  ^CRLF after each chunk.
+        return b''.join( chunks )
+    if 'content-length' in headers:
+        return await reader.readexactly( int(headers['content-length']) )
+    return await reader.read()
+    #      ^until connection closes.
+
+
+def _decode( body, headers ):
+    '''Decompress body per Content-Encoding.'''
+    encoding = headers.get('content-encoding', '').lower()
+    if encoding == 'gzip':
+        return zlib.decompress( body, 16 + zlib.MAX_WBITS )
+    if encoding == 'deflate':
+        return zlib.decompress( body )
+    return body
+
+
+async def _request( url ):
+    '''Single GET request: [status, reason, headers, body].'''
+    parts = urlsplit( url )
+    https = parts.scheme == 'https'
+    port  = parts.port or (443 if https else 80)
+    path  = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+    context = ssl.create_default_context() if https else None
+    reader, writer = await asyncio.open_connection( parts.hostname, port,
+                                                    ssl=context )
+    try:
+        request = ( 'GET ' + path + ' HTTP/1.1\r\n'
+                    + 'Host: ' + parts.netloc + '\r\n'
+                    + 'User-Agent: fecon235\r\n'
+                    + 'Accept-Encoding: gzip\r\n'
+                    + 'Connection: close\r\n\r\n' )
+        writer.write( request.encode('latin-1') )
+        status = (await reader.readline()).decode('latin-1').split(None, 2)
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1')
+            if line in ('\r\n', '\n', ''):
+                break
+            key, _, value = line.partition(':')
+            headers[ key.strip().lower() ] = value.strip()
+        body = _decode( await _readbody(reader, headers), headers )
+    finally:
+        writer.close()
+    reason = status[2].strip() if len(status) > 2 else ''
+    return [ int(status[1]), reason, headers, body ]
+
+
+async def fetch( url ):
+    '''Content of url as bytes, following redirects.
+       Raises HTTPError (as urlopen would) for status other than 2xx.
+       Records to, or replays from, tape of ys_http if installed.
+    '''
+    tape = ys_http.tape
+    if tape is None:
+        return await _fetch( url )
+    if tape.replaying:
+        return tape.play( url )
+    try:
+        body = await _fetch( url )
+    except HTTPError as e:
+        tape.keep( url, b'', e.code, e.reason )
+        raise
+    tape.keep( url, body )
+    return body
+
+
+async def _fetch( url ):
+    '''Content of url as bytes from network, see fetch().'''
+    for _ in range( redirects + 1 ):
+        status, reason, headers, body = await asyncio.wait_for(
+                                             _request(url), timeout )
+        if status in (301, 302, 303, 307, 308) and 'location' in headers:
+            url = urljoin( url, headers['location'] )
+            continue
+        if not 200 <= status < 300:
+            hdrs = Message()
+            for key, value in headers.items():
+                hdrs[ key ] = value
+            raise HTTPError( url, status, reason, hdrs, io.BytesIO(body) )
+        return body
+    raise HTTPError( url, 310, 'Too many redirects', Message(), None )
+
+
+
+#  ______________ Retrieval
+
+class Retriever(object):
+    '''Shares connection limits and in-flight leaf downloads across codes.'''
+
+    def __init__( self, executor=None ):
+        self.executor = executor
+        self.limits   = dict( (host, asyncio.Semaphore(n))
+                              for host, n in hostlimit.items() )
+        self.inflight = {}
+
+    async def run( self, fun, *args ):
+        '''Run blocking fun(*args) in the executor.'''
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor( self.executor, fun, *args )
+
+    async def ratelimit( self, scheduler ):
+        '''Wait for a token of scheduler on the event loop,
+           rather than blocking a thread of the executor.'''
+        while True:
+            wait = scheduler.tryacquire()
+            if not wait:
+                return
+            await asyncio.sleep( wait )
+
+    async def download( self, host, url ):
+        '''Bytes from url, at most hostlimit[host] concurrently.'''
+        async with self.limits[ host ]:
+            return await fetch( url )
+
+    def shared( self, key, coroutine ):
+        '''Task for key, so that concurrent requests share one download.'''
+        if key not in self.inflight:
+            self.inflight[ key ] = asyncio.ensure_future( coroutine() )
+        return self.inflight[ key ]
+
+    async def fredleaf( self, fredcode ):
+        '''Awaitable getdata_fred(), via the disk cache of ys_cache.'''
+        async def retrieve():
+            df = await self.run( ys_cache.lookup, 'fred', fredcode )
+            if df is None:
+                body = await self.download( 'fred', fred.makeURL(fredcode) )
+                df = await self.run( fred.readfile, io.BytesIO(body) )
+                await self.run( ys_cache.keep, 'fred', fredcode, df )
+            return df
+        return (await self.shared( ('fred', fredcode), retrieve )).copy()
+
+    async def qdlleaf( self, quandlcode, **kwargs ):
+        '''Awaitable yi_quandl_api.get() for a single dataset.'''
+        url = qdlapi.get( quandlcode, returns='url', **kwargs )
+        async def retrieve():
+            #  Share the rate limit of the blocking Quandl client,
+            #  also retrying refused calls as its scheduler.call() does:
+            attempt = 0
+            while True:
+                await self.ratelimit( qdlapi.scheduler )
+                try:
+                    body = await self.download( 'quandl', url )
+                    break
+                except HTTPError as e:
+                    if qdlapi.scheduler.refused( e, attempt ):
+                        attempt += 1
+                        continue
+                    if e.code in (403, 429):
+                        raise qdlapi.CallLimitExceeded(
+                                                 'API call limit exceeded.')
+                    if e.code == 404:
+                        raise qdlapi.DatasetNotFound( 'Dataset not found. '
+                                  + 'Check Quandl code: ' + quandlcode )
+                    raise qdlapi.ErrorDownloading( 'Error Downloading! '
+                                                    + str(e) )
+            return await self.run( qdlapi._download, io.BytesIO(body) )
+        return (await self.shared( ('quandl', url), retrieve )).copy()
+
+    async def synthesize( self, registry, codes, leaf ):
+        '''Evaluate codes per registry, with leaves downloaded concurrently.'''
+        leaves = synth.plan( registry, codes )[0]
+        dfs = await asyncio.gather( *[ leaf(code) for code in leaves ] )
+        raw = dict( zip(leaves, dfs) )
+        return await self.run( synth.evaluate, registry, codes,
+                               lambda code: raw[code] )
+
+    async def getfred( self, fredcode ):
+        '''Awaitable getfred().'''
+        dfdic = await self.synthesize( fred.fredsynth, [fredcode],
+                                       self.fredleaf )
+        return dfdic[ fredcode ].dropna()
+
+    async def getqdl( self, quandlcode, maxi=87654321 ):
+        '''Awaitable getqdl().'''
+        if quandlcode in qdl.qdlsynth:
+            dfdic = await self.synthesize( qdl.qdlsynth, [quandlcode],
+                                           self.qdlleaf )
+            df = dfdic[ quandlcode ]
+        elif quandlcode[:2] == 'f4':
+            fut = await self.qdlleaf( qdl.fut_decode(quandlcode), rows=512 )
+            df = tools.todf( fut[[ 'Settle' ]] )
+        else:
+            df = await self.qdlleaf( quandlcode, rows=maxi )
+        return tools.names( df ).dropna()
+
+    async def getstock( self, slang, maxi=3650 ):
+        '''Awaitable getstock(), which blocks within the executor.'''
+        async with self.limits[ 'stock' ]:
+            return await self.run( stocks.getstock, slang, maxi )
+
+    async def get( self, code, maxi=0 ):
+        '''Awaitable get(): one backend per ys_route.route().'''
+        backend = ys_route.route( code )
+        ys_route.failcheck( code )
+        try:
+            if backend == 'fred':
+                return await self.getfred( code )
+            if backend == 'quandl':
+                if maxi:
+                    return await self.getqdl( code, maxi )
+                return await self.getqdl( code )
+            if maxi:
+                return await self.getstock( code, maxi )
+            return await self.getstock( code )
+        except Exception as e:
+            ys_route.failed( code, e )
+            raise ValueError( 'INVALID symbol string or code for fecon'
+                              + ' aget(): ' + backend + ' :: ' + str(e) )
+
+
+async def aget( code, maxi=0, executor=None ):
+    '''Awaitable counterpart of get() in module fecon235.'''
+    return await Retriever( executor ).get( code, maxi )
+
+
+async def agroupget( ggdic, maxi=0, executor=None ):
+    '''Awaitable counterpart of groupget() in module fecon235.
+       All keys are retrieved concurrently, sharing leaf downloads.
+       A key which fails is reported, then omitted.
+    '''
+    retriever = Retriever( executor )
+    #  Since dictionaries are unordered, create SORTED list of keys:
+    keys = [ key for key in sorted(ggdic) ]
+    dfs = await asyncio.gather( *[ retriever.get(ggdic[key], maxi)
+                                   for key in keys ], return_exceptions=True )
+    dfdic = {}
+    for key, df in zip( keys, dfs ):
+        if isinstance( df, Exception ):
+            system.warn( key + ' = ' + str(ggdic[key]) + ' :: ' + str(df),
+                         stub="agroupget failed:" )
+        else:
+            dfdic[ key ] = df
+    keys = [ key for key in keys if key in dfdic ]
+    if not keys:
+        raise ValueError('agroupget could not retrieve any key of group.')
+    #  Paste together dataframes into one large sorted dataframe:
+    groupdf = tools.paste([ dfdic[key] for key in keys ])
+    #  Name the columns:
+    groupdf.columns = keys
+    return groupdf
+
+
+if __name__ == "__main__":
+     system.endmodule()
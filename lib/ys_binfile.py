@@ -0,0 +1,144 @@
+#  Python Module for import                           Date : 2026-10-17
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+'''
+_______________|  ys_binfile.py : columnar binary file format for series.
+
+Reading CSV requires parsing dates and numbers each time.  Here a time
+series dataframe is kept in a compact binary file which is read by
+MEMORY MAPPING with zero parsing.  The file extension is SUFFIX, '.fbin',
+and yi_fred.readfile() and yi_1tools.writefile() dispatch on it.
+
+     FILE LAYOUT (little-endian):
+          8 bytes   MAGIC
+          4 bytes   uint32 length of the header
+          header    JSON text, padded with spaces to 8-byte alignment:
+                    rows, columns, dtype, index name, freq, source.
+          rows x    int64 index: nanoseconds since the epoch.
+          columns x rows x dtype values (float64 or float32),
+                    one contiguous block per column.
+
+          Usage:  writebin( df, 'gold.fbin', source='FRED GOLDAMGBD228NLBM' )
+                  df = readbin( 'gold.fbin' )
+                  bininfo( 'gold.fbin' )     #  header as dictionary.
+
+CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  First version.
+'''
+
+from __future__ import absolute_import, print_function
+
+import json
+import struct
+import numpy as np
+import pandas as pd
+
+from . import yi_0sys as system
+
+
+SUFFIX  = '.fbin'
+MAGIC   = b'FECBIN01'
+dtypes  = [ 'float64', 'float32' ]
+
+
+def isbin( filename ):
+    '''Is filename (string, not buffer) in our binary format by extension?'''
+    return hasattr( filename, 'endswith' ) and filename.endswith( SUFFIX )
+
+
+def binheader( dataframe, dtype='float64', source='' ):
+    '''Header dictionary describing dataframe for writebin().'''
+    if dtype not in dtypes:
+        raise ValueError('binfile dtype must be one of: ' + str(dtypes))
+    try:
+        freq = pd.infer_freq( dataframe.index )
+    except (TypeError, ValueError):
+        #  e.g. fewer than 3 rows.
+        freq = None
+    return { 'rows':    len(dataframe.index),
+             'columns': [ str(c) for c in dataframe.columns ],
+             'dtype':   dtype,
+             'index':   dataframe.index.name,
+             'freq':    freq,
+             'source':  source }
+
+
+def writebin( dataframe, filename, dtype='float64', source='', **extra ):
+    '''Write dataframe with DatetimeIndex to binary file (or file object).
+       Any extra keywords are recorded in the header.
+    '''
+    header = binheader( dataframe, dtype, source )
+    header.update( extra )
+    index = pd.DatetimeIndex( dataframe.index ).values
+    index = index.astype('datetime64[ns]').view('<i8')
+    values = np.asarray( dataframe.values, dtype=dtype )
+    #  Columnar: C-order transpose puts each column in one block.
+    blocks = np.ascontiguousarray( values.T, dtype=np.dtype(dtype)
+                                                    .newbyteorder('<') )
+    text = json.dumps( header ).encode('utf-8')
+    pad = (-(len(MAGIC) + 4 + len(text))) % 8
+    text += b' ' * pad
+    def write( f ):
+        f.write( MAGIC )
+        f.write( struct.pack('<I', len(text)) )
+        f.write( text )
+        f.write( index.tobytes() )
+        f.write( blocks.tobytes() )
+    if hasattr( filename, 'write' ):
+        write( filename )
+    else:
+        with open( filename, 'wb' ) as f:
+            write( f )
+    return header
+
+
+def _header( f ):
+    '''Read header dictionary and data offset from open binary file.'''
+    if f.read( len(MAGIC) ) != MAGIC:
+        raise ValueError('Not a fecon235 binary file.')
+    size = struct.unpack( '<I', f.read(4) )[0]
+    header = json.loads( f.read(size).decode('utf-8') )
+    return header, len(MAGIC) + 4 + size
+
+
+def bininfo( filename ):
+    '''Header of binary file as dictionary.'''
+    with open( filename, 'rb' ) as f:
+        return _header( f )[0]
+
+
+def loadbin( filename, mmap=True ):
+    '''Read binary file as [header, dataframe].
+       With mmap, values are memory mapped copy-on-write: pages are read
+       lazily from disk, and changes are never written back.
+    '''
+    with open( filename, 'rb' ) as f:
+        header, offset = _header( f )
+        rows  = header['rows']
+        ncols = len( header['columns'] )
+        dtype = np.dtype( header['dtype'] ).newbyteorder('<')
+        if mmap and rows > 0 and ncols > 0:
+            index = np.memmap( filename, dtype='<i8', mode='c',
+                               offset=offset, shape=(rows,) )
+            blocks = np.memmap( filename, dtype=dtype, mode='c',
+                                offset=offset + 8 * rows,
+                                shape=(ncols, rows) )
+        else:
+            f.seek( offset )
+            index = np.fromfile( f, dtype='<i8', count=rows )
+            blocks = np.fromfile( f, dtype=dtype, count=ncols * rows )
+            blocks = blocks.reshape( (ncols, rows) )
+    index = pd.DatetimeIndex( np.asarray(index).view('datetime64[ns]'),
+                              name=header['index'] )
+    #  Transpose of columnar blocks is a view, so no copying here:
+    dataframe = pd.DataFrame( blocks.T, index=index,
+                              columns=header['columns'], copy=False )
+    return [ header, dataframe ]
+
+
+def readbin( filename, mmap=True ):
+    '''Read binary file as dataframe, see loadbin().'''
+    return loadbin( filename, mmap )[1]
+
+
+if __name__ == "__main__":
+     system.endmodule()
@@ -0,0 +1,423 @@
+#  Python Module for import                           Date : 2026-10-17
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+'''
+_______________|  ys_cache.py : persistent on-disk cache for retrieved series.
+
+Retrieval such as yi_fred.getdata_fred() is expensive: each call requires
+an HTTP round trip followed by a full parse of the vendor's CSV text.
+Here we keep every parsed series on local disk in binary form, so
+that the same series requested again (by another notebook, or another
+worker process) is simply loaded instead of downloaded.
+
+- Entries are CONTENT-ADDRESSED: the file name is the SHA-1 hash of
+  the namespace (e.g. 'fred') joined with the vendor code.
+- FRESHNESS depends on the frequency of the series: daily data expires
+  sooner than quarterly data, see the freshness table below.
+- Entries beyond the size budget are EVICTED, least-recently-used first.
+
+          Usage:  df = cached( 'fred', 'DGS10', fetch )
+                  #                              ^function without args,
+                  #                               called only on a miss.
+
+                  df = cached( 'fred', 'DGS10', fetch, tailfetch )
+                  #                                     ^function of
+                  #   start date, for rows since then: see update().
+
+                  setcache( directory='/tmp/fecon', megabytes=512 )
+                  setcache( enabled=False )    #  bypass cache entirely.
+                  cacheinfo()                  #  [entries, bytes, directory]
+                  cacheclear()
+
+Within a single evaluation context, e.g. groupget(), the same leaf series
+is often requested repeatedly by different synthetics.  A SCOPED MEMO
+keeps such results in memory, so each key is computed exactly once:
+
+          Usage:  with memo() as m:
+                      df1 = getfred( m4xaueur )
+                      df2 = getfred( m4xaujpy )    #  m4xau not recomputed.
+                  print( m.hits, m.misses )
+
+Environment variables are read when this module is first imported:
+     FECON235_CACHE      directory path, or "off" to disable caching.
+     FECON235_CACHE_MB   size budget in megabytes.
+
+CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  cached() falls back to fetch() if incremental update() fails.
+2026-10-17  Add exists() to check for an entry without reading it.
+2026-10-17  Store entries in columnar binary format of ys_binfile.
+2026-10-17  Add update() so that cached() with tailfetch appends only
+               new rows to a stale entry, unless revisions are detected.
+2026-10-17  memo() enters the active memo atomically; a memo which
+               is not active never deactivates another.
+2026-10-17  Add memo() for scoped in-memory memoization with counters.
+2026-10-17  First version, used by getdata_fred() in yi_fred module.
+'''
+
+from __future__ import absolute_import, print_function, division
+
+import os
+import time
+import hashlib
+import tempfile
+import threading
+import numpy as np
+import pandas as pd
+
+from . import yi_0sys as system
+from . import ys_binfile as binfile
+
+
+#  FRESHNESS table: (maximum spacing of index in seconds, maximum age in secs)
+#  The spacing of a series is the minimum difference between index values,
+#  so the first row which accommodates that spacing gives its maximum age.
+freshness = [ (   93600.0,      6 * 3600 ),   # daily,  ~1 day + 2 hours.
+              (  691200.0,     24 * 3600 ),   # weekly, ~8 days.
+              ( 2678400.0,  3 * 24 * 3600 ),  # monthly, 31 days.
+              (      None,  7 * 24 * 3600 ) ] # quarterly and beyond.
+
+
+#  Module-wide SETTINGS, modified by setcache():
+_settings = { 'directory': os.path.join(os.path.expanduser('~'),
+                                        '.cache', 'fecon235'),
+              'megabytes': 256,
+              'enabled':   True }
+
+_envdir = os.environ.get('FECON235_CACHE', '')
+if _envdir.lower() in ('off', 'no', 'false', '0'):
+    _settings['enabled'] = False
+elif _envdir:
+    _settings['directory'] = _envdir
+try:
+    _settings['megabytes'] = float(os.environ['FECON235_CACHE_MB'])
+except (KeyError, ValueError):
+    pass
+
+SUFFIX = binfile.SUFFIX
+
+
+def setcache( directory=None, megabytes=None, enabled=None ):
+    '''Configure cache directory, size budget in megabytes, and switch.'''
+    if directory is not None:
+        _settings['directory'] = directory
+    if megabytes is not None:
+        _settings['megabytes'] = megabytes
+    if enabled is not None:
+        _settings['enabled'] = enabled
+    return dict(_settings)
+
+
+def cachekey( namespace, code ):
+    '''Content address for code within namespace, as hex string.'''
+    ident = namespace + ':' + code
+    return hashlib.sha1( ident.encode('utf-8') ).hexdigest()
+
+
+def cachepath( namespace, code ):
+    '''Full path of the cache file for code within namespace.'''
+    return os.path.join( _settings['directory'],
+                         cachekey(namespace, code) + SUFFIX )
+
+
+def spacing_secs( dataframe ):
+    '''Minimum spacing in seconds between index values (cf. index_delta_secs).'''
+    if len(dataframe.index) < 2:
+        return None
+    nanosecs = np.diff( dataframe.index.values ).min()
+    return nanosecs.astype('timedelta64[s]').astype(np.float64)
+
+
+def maxage( dataframe ):
+    '''Maximum age in seconds before a cached dataframe is considered stale.'''
+    secs = spacing_secs( dataframe )
+    for spacing, age in freshness:
+        if spacing is None or (secs is not None and secs <= spacing):
+            return age
+    return freshness[-1][1]
+
+
+def _makedirs( directory ):
+    '''Create directory if necessary (Python 2 lacks exist_ok).'''
+    try:
+        os.makedirs( directory )
+    except OSError:
+        if not os.path.isdir( directory ):
+            raise
+
+
+def _rename( src, dst ):
+    '''Atomic rename which overwrites dst, also on Windows for Python 3.'''
+    try:
+        os.replace( src, dst )
+    except AttributeError:
+        #  Python 2 lacks os.replace:
+        os.rename( src, dst )
+
+
+def store( namespace, code, dataframe ):
+    '''Write dataframe in binary form to its cache file, then evict.'''
+    directory = _settings['directory']
+    _makedirs( directory )
+    path = cachepath( namespace, code )
+    #  Write to a temporary file first, then rename atomically,
+    #  so concurrent readers never observe a partial file:
+    fd, tmp = tempfile.mkstemp( suffix='.tmp', dir=directory )
+    try:
+        with os.fdopen( fd, 'wb' ) as f:
+            binfile.writebin( dataframe, f, source=namespace,
+                              code=code, stamp=time.time() )
+        _rename( tmp, path )
+    except:
+        if os.path.exists( tmp ):
+            os.remove( tmp )
+        raise
+    evict()
+    return path
+
+
+def load( namespace, code, fresh=True ):
+    '''Read dataframe from its cache file, or None if absent (or stale).'''
+    path = cachepath( namespace, code )
+    try:
+        #  Without mmap, so that eviction may always remove the file:
+        header, df = binfile.loadbin( path, mmap=False )
+        stamp = float( header['stamp'] )
+    except (IOError, OSError, KeyError, ValueError):
+        #  Absent, partially evicted, or corrupt: treat as a miss.
+        return None
+    if fresh and (time.time() - stamp) > maxage( df ):
+        return None
+    #  Touch the file so that eviction is least-recently-used:
+    try:
+        os.utime( path, None )
+    except OSError:
+        pass
+    return df
+
+
+def lookup( namespace, code ):
+    '''Fresh dataframe for code from disk cache, else None (or disabled).'''
+    if not _settings['enabled']:
+        return None
+    return load( namespace, code )
+
+
+def exists( namespace, code ):
+    '''Is there an entry for code, fresh or stale, and caching enabled?'''
+    return _settings['enabled'] and os.path.exists( cachepath(namespace,
+                                                              code) )
+
+
+def keep( namespace, code, dataframe ):
+    '''Store dataframe for code if caching is enabled, never failing.'''
+    if not _settings['enabled']:
+        return
+    try:
+        store( namespace, code, dataframe )
+    except (IOError, OSError, ValueError, TypeError) as e:
+        #  Read-only or full disk, or non-numeric columns,
+        #  should not prevent retrieval:
+        system.warn( str(e), stub="ys_cache store failed:" )
+
+
+def overlaps( old, new ):
+    '''Do rows of old from the first date of new agree with new?'''
+    if len(new.index) == 0 or list(old.columns) != list(new.columns):
+        return False
+    common = old[ old.index >= new.index[0] ]
+    if not common.index.isin( new.index ).all():
+        #  Rows were removed upstream.
+        return False
+    #  NaN agrees with NaN, and tolerate float round trip of CSV text:
+    return np.allclose( common.values, new.loc[ common.index ].values,
+                        rtol=1e-12, atol=0.0, equal_nan=True )
+
+
+def update( old, tailfetch, overlap=5 ):
+    '''Append new rows to old dataframe using tailfetch(start), else None.
+       start is the date (as 'YYYY-MM-DD' string) of the row
+       overlap rows before the end of old.  If the rows from start
+       were REVISED upstream, None signals that a full fetch is needed.
+    '''
+    if len(old.index) <= overlap:
+        return None
+    start = old.index[ -overlap ]
+    new = tailfetch( start.strftime('%Y-%m-%d') )
+    if len(new.index) == 0 or new.index[0] > start:
+        #  Overlapping rows must be present for validation.
+        return None
+    if not overlaps( old, new ):
+        return None
+    return pd.concat([ old[ old.index < new.index[0] ], new ])
+
+
+def cached( namespace, code, fetch, tailfetch=None ):
+    '''Return dataframe for code from disk cache, else fetch() and store it.
+       Given tailfetch(start), a stale entry is updated INCREMENTALLY
+       by appending rows from start, see update().
+    '''
+    df = lookup( namespace, code )
+    if df is not None:
+        return df
+    if tailfetch is not None and _settings['enabled']:
+        stale = load( namespace, code, fresh=False )
+        if stale is not None:
+            try:
+                df = update( stale, tailfetch )
+            except (IOError, OSError, ValueError) as e:
+                #  e.g. tail endpoint down, or HTTPError 404 on a replay
+                #  tape: a full fetch() may still succeed.
+                system.warn( str(e), stub="ys_cache update failed:" )
+                df = None
+    if df is None:
+        df = fetch()
+    keep( namespace, code, df )
+    return df
+
+
+def _entries():
+    '''List of [mtime, size, path] for all cache files.'''
+    directory = _settings['directory']
+    try:
+        names = os.listdir( directory )
+    except OSError:
+        return []
+    entries = []
+    for name in names:
+        if name.endswith( SUFFIX ) or name.endswith( '.npz' ):
+            #                               ^former format, to be evicted.
+            path = os.path.join( directory, name )
+            try:
+                st = os.stat( path )
+            except OSError:
+                continue
+            entries.append([ st.st_mtime, st.st_size, path ])
+    return entries
+
+
+def evict( megabytes=None ):
+    '''Remove least-recently-used entries until within size budget.'''
+    if megabytes is None:
+        megabytes = _settings['megabytes']
+    budget = megabytes * 1024 * 1024
+    entries = sorted( _entries() )
+    #         ^oldest access first.
+    total = sum( e[1] for e in entries )
+    removed = 0
+    for mtime, size, path in entries:
+        if total <= budget:
+            break
+        try:
+            os.remove( path )
+            removed += 1
+        except OSError:
+            pass
+        total -= size
+    return removed
+
+
+def cacheinfo():
+    '''Summary list: [number of entries, total bytes, directory].'''
+    entries = _entries()
+    return [ len(entries), sum( e[1] for e in entries ),
+             _settings['directory'] ]
+
+
+def cacheclear():
+    '''Delete all cache files, returning the number removed.'''
+    return evict( megabytes=0 )
+
+
+
+#  ______________ SCOPED MEMO (in memory, for one evaluation context)
+
+class Memo(object):
+    '''In-memory memo which is active within a "with" block, see memo().'''
+
+    def __init__( self ):
+        self.store  = {}
+        self.locks  = {}
+        self.hits   = 0
+        self.misses = 0
+        self.depth  = 0
+        self.lock   = threading.Lock()
+
+    def _enter( self ):
+        #  Caller holds _memolock.
+        if _active[0] is None:
+            _active[0] = self
+        self.depth += 1
+
+    def __enter__( self ):
+        with _memolock:
+            self._enter()
+        return self
+
+    def __exit__( self, *exc ):
+        with _memolock:
+            self.depth -= 1
+            if self.depth == 0:
+                if _active[0] is self:
+                    _active[0] = None
+                self.store.clear()
+                self.locks.clear()
+        return False
+
+    def fetch( self, key, fun ):
+        '''Return memoized value for key, computing fun() only once.'''
+        with self.lock:
+            if key in self.store:
+                self.hits += 1
+                return self.store[ key ].copy()
+            keylock = self.locks.setdefault( key, threading.Lock() )
+        #  Concurrent requests for the same key wait for the first one:
+        with keylock:
+            with self.lock:
+                if key in self.store:
+                    self.hits += 1
+                    return self.store[ key ].copy()
+            value = fun()
+            with self.lock:
+                self.store[ key ] = value
+                self.misses += 1
+        #  DataFrames are mutable (e.g. todf renames columns in place),
+        #  so callers always receive copies, never the memoized original:
+        return value.copy()
+
+
+_active   = [ None ]
+_memolock = threading.Lock()
+
+
+class _MemoScope(object):
+    '''Context of memo(): enters the active memo, else a new one,
+       in one step under _memolock, so that concurrent threads
+       share one memo rather than clearing each other's.'''
+
+    def __enter__( self ):
+        with _memolock:
+            self.memo = _active[0] or Memo()
+            self.memo._enter()
+        return self.memo
+
+    def __exit__( self, *exc ):
+        return self.memo.__exit__( *exc )
+
+
+def memo():
+    '''Context manager for scoped memoization: with memo() as m: ...
+       Nested contexts share the outermost memo (and its counters),
+       as do contexts entered by other threads meanwhile.
+    '''
+    return _MemoScope()
+
+
+def memoize( namespace, key, fun ):
+    '''Return fun() memoized by (namespace, key) if a memo is active.'''
+    m = _active[0]
+    if m is None:
+        return fun()
+    return m.fetch( (namespace, key), fun )
+
+
+if __name__ == "__main__":
+     system.endmodule()
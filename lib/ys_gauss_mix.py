@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2017-06-29
+#  Python Module for import                           Date : 2026-10-17
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263 
 ''' 
 _______________|  ys_gauss_mix.py : Gaussian mixture for fecon235
@@ -20,6 +20,7 @@ REFERENCES:
   J. Financial and Quantitative Analysis, 4:2:179-199.
 
 CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  Heavy dependencies are imported lazily upon first use.
 2017-06-29  Fallback clause for gemrate() when log fails (2008Q4).
 2017-06-05  Add gm2gemrat() and gm2gem(). Clarify gm2_main().
                Unify GM(2) and gemrat() with only one pass through data.
@@ -37,9 +38,10 @@ CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
 
 from __future__ import absolute_import, print_function, division
 
-import sympy as sym
 import numpy as np
 from fecon235.lib import yi_0sys as system
+sym = system.lazyimport( 'sympy' )
+#     ^heavy module is imported upon first use.
 from . import yi_1tools as tools
 
 '''
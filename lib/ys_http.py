@@ -0,0 +1,364 @@
+#  Python Module for import                           Date : 2026-10-17
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+'''
+_______________|  ys_http.py : HTTP session with keep-alive connection pool.
+
+Calling urlopen() for each series performs a fresh TCP (and TLS)
+handshake every time.  When we refresh hundreds of codes against the
+same few hosts, such handshakes are a large share of total latency.
+A Session keeps idle connections per host for reuse (keep-alive),
+requests gzip transfer encoding, applies a timeout, goes through
+proxies from the environment (e.g. HTTP_PROXY, NO_PROXY) as urlopen()
+would, and retries transient errors with exponential backoff:
+
+          Usage:  data = session.get( url )        #  bytes
+                  f = urlopen( url )               #  file-like, for readfile
+                  session.timeout = 30             #  configure shared session.
+
+For APIs with a rate limit, a Scheduler enforces a token-bucket rate,
+serving queued requests by priority, and retries calls refused with
+status 403 or 429 after exponential backoff:
+
+          Usage:  scheduler = Scheduler( rate=3.0, burst=20 )
+                  data = scheduler.call( lambda: session.get(url),
+                                         priority=BACKGROUND )
+
+For reproducible tests and benchmarks, module ys_replay installs a tape
+which records responses by URL, or replays them without network access.
+
+Errors follow urlopen(): HTTPError for a status other than 2xx (after
+retries for 5xx), and socket or HTTP exceptions if a host is unreachable.
+The shared session serves getdata_fred() in yi_fred.  Quandl's
+_download() in yi_quandl_api uses its own Session, config.session,
+so that its timeout (QUANDL_TIMEOUT) is configured apart.
+
+CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  Session honours proxies from environment, e.g. HTTP_PROXY,
+               as urlopen() does: tunnel for https, absolute URI for http.
+2026-10-17  Docstring: Quandl uses its own Session, not the shared one.
+2026-10-17  Define hostlimit here, shared by sync and async retrieval.
+2026-10-17  Add Scheduler.tryacquire() for waiting on an event loop,
+               and Scheduler.refused() for retries shared with ys_aio.
+2026-10-17  Session.get() records or replays via tape, see ys_replay.
+2026-10-17  Add Scheduler for rate limits with priority, used by Quandl.
+2026-10-17  First version.
+'''
+
+from __future__ import absolute_import, print_function
+
+import io
+import base64
+import heapq
+import time
+import itertools
+import zlib
+import socket
+import threading
+
+try:
+    import http.client as httplib
+    from urllib.error import HTTPError
+    from urllib.parse import urlsplit, urljoin, unquote
+    from urllib.request import getproxies, proxy_bypass
+    #    ^for python3
+except ImportError:
+    import httplib
+    from urllib2 import HTTPError
+    from urlparse import urlsplit, urljoin
+    from urllib import getproxies, proxy_bypass, unquote
+    #    ^for python2
+
+from . import yi_0sys as system
+
+
+#  TAPE for record or replay of responses, installed by ys_replay:
+tape = None
+
+#  Errors which may be TRANSIENT, so the request is worth retrying:
+retrystatus = [ 500, 502, 503, 504 ]
+retryerrors = ( socket.error, socket.timeout, httplib.HTTPException )
+#                ^includes ConnectionError in Python 3.
+
+redirects = [ 301, 302, 303, 307, 308 ]
+
+
+class Session(object):
+    '''Pool of keep-alive HTTP(S) connections, shared across threads.'''
+
+    def __init__( self, timeout=60, retries=3, backoff=0.5, maxidle=8 ):
+        self.timeout = timeout      #  seconds per connect and read.
+        self.retries = retries      #  attempts beyond the first.
+        self.backoff = backoff      #  seconds before first retry, doubling.
+        self.maxidle = maxidle      #  idle connections kept per host.
+        self.idle    = {}           #  (scheme, host, port, proxy) : [conns]
+        self.lock    = threading.Lock()
+        self.connects = 0           #  count of new connections made.
+        self.headers = { 'User-Agent':      'fecon235',
+                         'Accept-Encoding': 'gzip',
+                         'Connection':      'keep-alive' }
+
+    def proxy( self, scheme, host ):
+        '''Proxy for scheme from environment, as urlopen() would use,
+           e.g. HTTP_PROXY and NO_PROXY: (host, port, auth) or None.
+        '''
+        url = getproxies().get( scheme )
+        if not url or proxy_bypass( host ):
+            return None
+        if '://' not in url:
+            url = 'http://' + url
+        parts = urlsplit( url )
+        auth = None
+        if parts.username:
+            userpass = unquote( parts.username ) + ':' \
+                       + unquote( parts.password or '' )
+            auth = 'Basic ' + base64.b64encode(
+                                 userpass.encode('utf-8') ).decode('ascii')
+        return ( parts.hostname, parts.port or 80, auth )
+
+    def connection( self, key ):
+        '''Idle connection for key, else new: [connection, reused].'''
+        with self.lock:
+            pool = self.idle.get( key )
+            if pool:
+                return [ pool.pop(), True ]
+            self.connects += 1
+        scheme, host, port, proxy = key
+        if proxy:
+            #  Connect to proxy, which for https tunnels to host:
+            host, port, auth = proxy
+            if scheme == 'https':
+                conn = httplib.HTTPSConnection( host, port,
+                                                timeout=self.timeout )
+                tunnel = { 'Proxy-Authorization': auth } if auth else None
+                conn.set_tunnel( key[1], key[2], headers=tunnel )
+            else:
+                conn = httplib.HTTPConnection( host, port,
+                                               timeout=self.timeout )
+        elif scheme == 'https':
+            conn = httplib.HTTPSConnection( host, port, timeout=self.timeout )
+        else:
+            conn = httplib.HTTPConnection( host, port, timeout=self.timeout )
+        return [ conn, False ]
+
+    def release( self, key, conn ):
+        '''Return connection to the pool for reuse, or close it.'''
+        with self.lock:
+            pool = self.idle.setdefault( key, [] )
+            if len(pool) < self.maxidle:
+                pool.append( conn )
+                return
+        conn.close()
+
+    def close( self ):
+        '''Close all idle connections.'''
+        with self.lock:
+            pools = list( self.idle.values() )
+            self.idle.clear()
+        for pool in pools:
+            for conn in pool:
+                conn.close()
+
+    def request( self, url ):
+        '''Single GET attempt: [status, reason, headers, body].'''
+        parts = urlsplit( url )
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        proxy = self.proxy( parts.scheme, parts.hostname )
+        key = ( parts.scheme, parts.hostname, port, proxy )
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        headers = self.headers
+        if proxy and parts.scheme != 'https':
+            #  Plain HTTP proxy expects absolute URI on request line:
+            path = parts.scheme + '://' + parts.netloc + path
+            if proxy[2]:
+                headers = dict( headers )
+                headers['Proxy-Authorization'] = proxy[2]
+        while True:
+            conn, reused = self.connection( key )
+            try:
+                conn.request( 'GET', path, headers=headers )
+                response = conn.getresponse()
+                body = response.read()
+                break
+            except retryerrors:
+                conn.close()
+                if not reused:
+                    raise
+                #  Server closed an idle keep-alive connection,
+                #  so try again with another (possibly new) connection.
+        if response.getheader('connection', '').lower() == 'close' \
+           or response.version < 11:
+            conn.close()
+        else:
+            self.release( key, conn )
+        encoding = (response.getheader('content-encoding') or '').lower()
+        if encoding == 'gzip':
+            body = zlib.decompress( body, 16 + zlib.MAX_WBITS )
+        elif encoding == 'deflate':
+            body = zlib.decompress( body )
+        return [ response.status, response.reason, response.msg, body ]
+
+    def get( self, url ):
+        '''Content of url as bytes, following redirects, with retries.
+           If a tape is installed (see ys_replay), responses are
+           recorded to it, or else replayed from it without network.
+        '''
+        if tape is None:
+            return self.live( url )
+        return tape.get( url, self.live )
+
+    def live( self, url ):
+        '''Content of url as bytes from network, see get().'''
+        attempt = 0
+        hops = 0
+        while True:
+            try:
+                status, reason, headers, body = self.request( url )
+            except retryerrors as e:
+                if attempt >= self.retries or isinstance(e, socket.gaierror):
+                    #  Unknown host name is not worth retrying.
+                    raise
+                status = None
+            if status in redirects and hops < 5:
+                url = urljoin( url, headers['location'] )
+                hops += 1
+                continue
+            if status is None or status in retrystatus:
+                if attempt < self.retries:
+                    time.sleep( self.backoff * (2 ** attempt) )
+                    attempt += 1
+                    continue
+            if not 200 <= status < 300:
+                raise HTTPError( url, status, reason, headers,
+                                 io.BytesIO(body) )
+            return body
+
+    def open( self, url ):
+        '''File-like object with content of url (cf. urlopen).'''
+        return io.BytesIO( self.get(url) )
+
+
+#  ______________ SCHEDULER for rate-limited APIs
+
+#  PRIORITY of requests: lower numbers are served first.
+INTERACTIVE = 0
+BACKGROUND  = 10
+
+
+class Scheduler(object):
+    '''Token bucket which queues requests by priority, and retries calls
+       refused for exceeding the rate limit (403 or 429) with backoff.
+    '''
+
+    def __init__( self, rate=1.0, burst=10, retries=4, backoff=1.0,
+                  limitstatus=(403, 429) ):
+        self.rate    = float(rate)   #  sustained requests per second.
+        self.burst   = burst         #  capacity of bucket.
+        self.retries = retries       #  retries of refused call.
+        self.backoff = backoff       #  seconds before first retry, doubling.
+        self.limitstatus = limitstatus
+        self.tokens  = float(burst)
+        self.stamp   = time.time()
+        self.waiting = []            #  heap of (priority, sequence).
+        self.count   = itertools.count()
+        self.cond    = threading.Condition()
+
+    def refill( self ):
+        '''Add tokens accrued since last refill (call with cond held).'''
+        now = time.time()
+        self.tokens = min( self.burst,
+                           self.tokens + (now - self.stamp) * self.rate )
+        self.stamp = now
+
+    def acquire( self, priority=INTERACTIVE ):
+        '''Block until a token is available for this request.
+           Requests of higher priority (lower number) go first,
+           then first come, first served.
+        '''
+        ticket = ( priority, next(self.count) )
+        with self.cond:
+            heapq.heappush( self.waiting, ticket )
+            try:
+                while True:
+                    self.refill()
+                    if self.waiting[0] == ticket:
+                        if self.tokens >= 1:
+                            heapq.heappop( self.waiting )
+                            self.tokens -= 1
+                            self.cond.notify_all()
+                            #  ^next in line becomes head.
+                            return
+                        self.cond.wait( (1 - self.tokens) / self.rate )
+                    else:
+                        self.cond.wait()
+            except:
+                #  e.g. KeyboardInterrupt: leave the queue.
+                self.waiting.remove( ticket )
+                heapq.heapify( self.waiting )
+                self.cond.notify_all()
+                raise
+
+    def tryacquire( self, priority=INTERACTIVE ):
+        '''Take a token without blocking: 0 if taken, else seconds to
+           wait before trying again, e.g. by asyncio.sleep().
+           Blocked requests of same or higher priority go first.
+        '''
+        with self.cond:
+            self.refill()
+            ahead = self.waiting and self.waiting[0][0] <= priority
+            if self.tokens >= 1 and not ahead:
+                self.tokens -= 1
+                return 0
+            return max( (1 - self.tokens) / self.rate, 1 / self.rate )
+
+    def pause( self, seconds ):
+        '''Empty the bucket so that no request starts for seconds.'''
+        with self.cond:
+            self.refill()
+            self.tokens = min( self.tokens, -seconds * self.rate )
+
+    def call( self, fun, priority=INTERACTIVE ):
+        '''Return fun() once permitted by rate, retrying if refused.'''
+        attempt = 0
+        while True:
+            self.acquire( priority )
+            try:
+                return fun()
+            except HTTPError as e:
+                if not self.refused( e, attempt ):
+                    raise
+                attempt += 1
+
+    def refused( self, e, attempt ):
+        '''Given HTTPError e on attempt (from 0), pause all requests
+           and return True if the call should be retried.'''
+        if e.code not in self.limitstatus or attempt >= self.retries:
+            return False
+        delay = self.backoff * (2 ** attempt)
+        try:
+            delay = max( delay, float(e.headers['Retry-After']) )
+        except (KeyError, TypeError, ValueError, AttributeError):
+            pass
+        #  Everyone waits, since the limit applies to all requests:
+        self.pause( delay )
+        return True
+
+
+
+#  SHARED session for downloads in fecon235, except Quandl's own:
+session = Session()
+
+#  Concurrent downloads per data HOST, see ys_route.route(),
+#  for both groupget() in fecon235 and Retriever in ys_aio:
+hostlimit = { 'fred' : 8, 'quandl' : 4, 'stock' : 4 }
+#               ^at most session.maxidle, so connections are reused.
+
+
+def urlopen( url ):
+    '''Drop-in for urlopen(url).read() usage, via shared session.'''
+    return session.open( url )
+
+
+if __name__ == "__main__":
+     system.endmodule()
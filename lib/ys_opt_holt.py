@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2016-12-29
+#  Python Module for import                           Date : 2026-10-17
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263 
 ''' 
 _______________|  ys_opt_holt.py : optimize Holt-Winters parameters/forecast
@@ -16,7 +16,19 @@ Here we rely on a single method to find optimal alpha and beta:
 See lib/ys_optimize.py for implementation details and references.
 Also tests/test_optimize.py is intended as a TUTORIAL for USAGE.
 
+Since the Holt-Winters recursion is the same for every (alpha, beta) pair,
+minholtgrid() runs it ONCE over time with state arrays holding all pairs
+of the grid, rather than rerunning loss_holt() per pair as minBrute()
+would. The grid and the choice among pairs follow minBrute() exactly.
+
 CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  loss_holtgrid() takes absolute errors and median in place,
+               so holtgrid_memory bounds its peak memory.
+2026-10-17  Add loss_holtgrid() and minholtgrid() to evaluate the whole
+               (alpha, beta) grid in one time pass, chunked over the grid.
+               optimize_holt() uses it in place of minBrute(loss_holt).
+2026-10-17  loss_holt() uses array API ts.holtar(), and optimize_holt()
+               converts data to array once, not per grid point.
 2016-12-29  Include percentage loss in alphabetaloss list.
 2016-12-28  Add optimize_holtforecast() for forecasting.
                Noted: 2*sigma approximated by 3*(median_absolute_error)
@@ -54,16 +66,14 @@ def loss_holt(params, *args):
     '''
     #  Specify arguments:
     alpha, beta = params
-    data = args[0]   #  Primary data assumed to be single column.
+    data = args[0]   #  Primary data assumed to be single column,
+    #                   preferably already an array by ts.holtarray().
 
     #  Information from the Holt-Winters filter is distilled 
-    #  to the holt() multi-column workout dataframe;
+    #  to arrays like the holt() multi-column workout dataframe,
+    #  but without pandas overhead per evaluation;
     #  see tests/test_optimize.py for numerical examples.
-    holtdf = ts.holt( data, alpha, beta ) 
-    #  Henceforth use numpy arrays, rather than dataframes:
-    y = holtdf['Y'].values       # Actual data, without index
-    l = holtdf['Level'].values
-    b = holtdf['Growth'].values
+    y, l, b = ts.holtar( data, alpha, beta )
 
     error = y[1:] - (l[:-1] + b[:-1])
           #  #  Equivalent, but more expensive, version of previous line...
@@ -91,6 +101,64 @@ def loss_holt(params, *args):
 #          that mandatory comma: ( alone, )
 
 
+#  Bytes for the one-step errors of a chunk of grid pairs in loss_holtgrid(),
+#  which bounds its peak memory (besides arrays of size N or grid size):
+holtgrid_memory = 64 * 2**20
+
+
+def loss_holtgrid( y, alphagrid, betagrid, memory=None ):
+    '''Loss of loss_holt() at every (alpha, beta) pair of given grids,
+       as array of shape (alphas, betas), in a single time pass over y.
+       Grid pairs are processed in chunks bounded by memory in bytes.
+    '''
+    y = ts.holtarray( y )
+    alphas, betas = np.meshgrid( np.asarray(alphagrid, dtype=float),
+                                 np.asarray(betagrid, dtype=float),
+                                 indexing='ij' )
+    alphas = alphas.ravel()
+    betas = betas.ravel()
+    N = y.size
+    #  Errors for each pair must be retained for their median:
+    chunk = max( 1, int((memory or holtgrid_memory) // (8 * max(N, 1))) )
+    losses = np.empty( alphas.size )
+    for start in range( 0, alphas.size, chunk ):
+        alpha = alphas[ start:start+chunk ]
+        beta  = betas[ start:start+chunk ]
+        alphac = 1 - alpha
+        betac  = 1 - beta
+        #  Same recursion as ts.holt_winters_growth(), for all pairs:
+        l = np.full( alpha.size, y[0] )
+        b = np.zeros( alpha.size )
+        error = np.empty(( N-1, alpha.size ))
+        for i in range( 1, N ):
+            error[i-1] = y[i] - (l + b)
+            #            ^Actual  ^Prediction MODEL
+            lprior = l
+            l = (alpha * y[i]) + (alphac * (l + b))
+            b = (beta * (l - lprior)) + (betac * b)
+        #  Ignore the first ten errors due to initialization warm-up;
+        #  absolute values and median IN PLACE, so that error is the
+        #  only buffer of size N by chunk:
+        np.absolute( error, out=error )
+        losses[ start:start+chunk ] = np.median( error[10:], axis=0,
+                                                 overwrite_input=True )
+    return losses.reshape(( np.size(alphagrid), np.size(betagrid) ))
+
+
+def minholtgrid( y, boundpairs, grids=50, memory=None ):
+    '''Minimize loss_holt() by grid search over boundpairs, 
+       [(alpha min, max), (beta min, max)], like minBrute(loss_holt)
+       with the same grid and tie-breaking, but in one time pass.
+    '''
+    #  Grids as scipy.optimize.brute(): interpolate inclusive of bounds.
+    alphagrid, betagrid = [ np.mgrid[ slice(low, high, complex(grids)) ]
+                            for low, high in boundpairs ]
+    losses = loss_holtgrid( y, alphagrid, betagrid, memory )
+    #  First minimum in row-major order, as brute():
+    i, j = np.unravel_index( np.argmin(losses.ravel()), losses.shape )
+    return np.array([ alphagrid[i], betagrid[j] ])
+
+
 def optimize_holt(dataframe, grids=50, alphas=(0.0, 1.0), betas=(0.0, 1.0)):
     '''Optimize Holt-Winters parameters alpha and beta for given data.
        The alphas and betas are boundaries of respective explored regions.
@@ -98,17 +166,16 @@ def optimize_holt(dataframe, grids=50, alphas=(0.0, 1.0), betas=(0.0, 1.0)):
        inclusive. Final output: [alpha, beta, losspc, median absolute loss]
        TIP: narrow down alphas and betas using optimize_holt iteratively.
     '''
-    if grids > 49:
-        system.warn("Optimizing Holt-Winters alphabetaloss may take TIME!")
-        #  Exploring loss at all the grids is COMPUTATIONALLY INTENSE
-        #  due to holt(), especially if the primary data is very large.
-        #  Tip: truncate dataframe to recent data.
-    result = yop.minBrute(fun=loss_holt, funarg=( dataframe, ), 
-                          boundpairs=[alphas, betas], grids=grids)
+    #  Convert dataframe to array ONCE, rather than at each grid point:
+    y = ts.holtarray( dataframe )
+    #  Exploring loss at all the grids used to be COMPUTATIONALLY INTENSE
+    #  by minBrute(fun=loss_holt, ...) which reruns holt() per grid point,
+    #  but minholtgrid() evaluates the whole grid in one time pass:
+    result = minholtgrid( y, [alphas, betas], grids )
     #  result is a numpy array, so convert to list:
     alpha, beta = list(result)
     #  Compute loss, given optimal parameters:
-    loss = loss_holt((alpha, beta), dataframe)
+    loss = loss_holt((alpha, beta), y)
     #  Compute percentage loss relative to absolute tailvalue:
     losspc = (float(loss) / abs(tools.tailvalue(dataframe))) * 100
     #  Since np.round and np.around print ugly, use Python round() to
@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2016-04-08
+#  Python Module for import                           Date : 2026-10-17
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263 
 ''' 
 _______________|  ys_optimize.py : Convex optimization given noisy data. 
@@ -55,6 +55,7 @@ References:
   http://www.scipy-lectures.org/advanced/mathematical_optimization
 
 CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  Heavy dependencies are imported lazily upon first use.
 2016-04-08  Clarify comments.
 2016-04-06  Semantic change of names to avoid misunderstanding.
                minimize() -> optimize()
@@ -66,8 +67,9 @@ CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
 from __future__ import absolute_import, print_function, division
 
 import numpy as np                #  for numerical work.
-import scipy.optimize as sop      #  optimization routines.
 from . import yi_0sys as system
+sop = system.lazyimport( 'scipy.optimize' )     #  optimization routines.
+#     ^heavy module is imported upon first use.
 
 
 DISPLAY = 0
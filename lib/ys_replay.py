@@ -0,0 +1,236 @@
+#  Python Module for import                           Date : 2026-10-17
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+'''
+_______________|  ys_replay.py : record and replay FRED and Quandl responses.
+
+Functions such as getfred(), getqdl() and groupget() always retrieve from
+the live services, so their results and timings are not reproducible.
+Here a Tape keeps raw responses in a directory, keyed by URL path and
+query (host and auth_token are omitted, so fixtures are portable):
+
+          Usage:  record( 'fixtures' )     #  live, and keep responses.
+                  df = getfred( d4xau )
+                  replay( 'fixtures' )     #  no network: responses on tape.
+                  df = getfred( d4xau )
+                  live()                   #  back to normal.
+
+Tape is consulted by the shared HTTP sessions of ys_http (FRED via
+getdata_fred(), Quandl via yi_quandl_api) and by fetch() in ys_aio.
+In replay, a URL not on tape raises HTTPError with status 404.
+
+To exercise the full HTTP stack without network, e.g. to measure
+retrieval throughput and cache effectiveness, a StandIn server serves
+recorded fixtures at the paths of makeURL() and QUANDL_API_URL,
+optionally with simulated latency:
+
+          Usage:  server = StandIn( 'fixtures', latency=0.05 )
+                  redirect( server.base )  #  FRED and Quandl to server.
+                  groupdf = groupget( group4d )
+                  print( server.requests )
+                  redirect()               #  restore live base URLs.
+                  server.close()
+
+CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  First version.
+'''
+
+from __future__ import absolute_import, print_function
+
+import os
+import io
+import json
+import time
+import hashlib
+import threading
+
+try:
+    from urllib.error import HTTPError
+    from urllib.parse import urlsplit, parse_qsl, urlencode
+    from http.server import HTTPServer, BaseHTTPRequestHandler
+    from socketserver import ThreadingMixIn
+    #    ^for python3
+except ImportError:
+    from urllib2 import HTTPError
+    from urlparse import urlsplit, parse_qsl
+    from urllib import urlencode
+    from BaseHTTPServer import HTTPServer, BaseHTTPRequestHandler
+    from SocketServer import ThreadingMixIn
+    #    ^for python2
+
+from . import yi_0sys as system
+from . import yi_fred as fred
+from . import yi_quandl_api as qdlapi
+from . import ys_http
+
+
+INDEX = 'index.json'
+
+#  Query parameters omitted from keys, e.g. secrets:
+omitparams = [ 'auth_token', 'api_key' ]
+
+
+def urlkey( url ):
+    '''Key of url for tape: path and query, without host or omitparams.'''
+    parts = urlsplit( url )
+    query = [ (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+              if k not in omitparams ]
+    key = parts.path or '/'
+    if query:
+        key += '?' + urlencode( query )
+    return key
+
+
+class Tape(object):
+    '''Directory of responses keyed by urlkey(), with an index file.'''
+
+    def __init__( self, directory, replaying=True ):
+        self.directory = directory
+        self.replaying = replaying
+        self.lock = threading.Lock()
+        self.index = {}      #  key : [ status, reason, filename ]
+        path = os.path.join( directory, INDEX )
+        if os.path.exists( path ):
+            with open( path ) as f:
+                self.index = json.load( f )
+        elif not replaying and not os.path.isdir( directory ):
+            os.makedirs( directory )
+
+    def keep( self, url, body, status=200, reason='OK' ):
+        '''Record response body to url (status other than 2xx for error).'''
+        key = urlkey( url )
+        name = hashlib.sha1( key.encode('utf-8') ).hexdigest()[:20] + '.dat'
+        with self.lock:
+            with open( os.path.join(self.directory, name), 'wb' ) as f:
+                f.write( body )
+            self.index[ key ] = [ status, reason, name ]
+            with open( os.path.join(self.directory, INDEX), 'w' ) as f:
+                json.dump( self.index, f, indent=1, sort_keys=True )
+
+    def lookup( self, key ):
+        '''Recorded [status, reason, body] for key, else None.'''
+        with self.lock:
+            entry = self.index.get( key )
+        if entry is None:
+            return None
+        status, reason, name = entry
+        with open( os.path.join(self.directory, name), 'rb' ) as f:
+            return [ status, reason, f.read() ]
+
+    def play( self, url ):
+        '''Recorded body of url, raising HTTPError as urlopen would.'''
+        found = self.lookup( urlkey(url) )
+        if found is None:
+            raise HTTPError( url, 404, 'Not recorded on tape', {}, None )
+        status, reason, body = found
+        if not 200 <= status < 300:
+            raise HTTPError( url, status, reason, {}, io.BytesIO(body) )
+        return body
+
+    def get( self, url, fetch ):
+        '''Replay url, or else record result of fetch(url).'''
+        if self.replaying:
+            return self.play( url )
+        try:
+            body = fetch( url )
+        except HTTPError as e:
+            self.keep( url, b'', e.code, e.reason )
+            raise
+        self.keep( url, body )
+        return body
+
+
+def record( directory ):
+    '''Retrieve live, recording all responses to directory.'''
+    ys_http.tape = Tape( directory, replaying=False )
+    return ys_http.tape
+
+
+def replay( directory ):
+    '''Serve all responses from directory, without network access.'''
+    ys_http.tape = Tape( directory, replaying=True )
+    return ys_http.tape
+
+
+def live():
+    '''Remove tape, so that retrieval is live again.'''
+    ys_http.tape = None
+
+
+#  ______________ STAND-IN server for recorded fixtures
+
+class _Server( ThreadingMixIn, HTTPServer ):
+    daemon_threads = True
+
+
+class _Handler( BaseHTTPRequestHandler ):
+    '''Serve tape of server by urlkey() of request path.'''
+    protocol_version = 'HTTP/1.1'
+    #                  ^keep-alive, as the real services.
+
+    def log_message( self, *args ):
+        pass
+
+    def do_GET( self ):
+        standin = self.server.standin
+        standin.count()
+        if standin.latency:
+            time.sleep( standin.latency )
+        found = standin.tape.lookup( urlkey(self.path) )
+        if found is None:
+            status, reason, body = [ 404, 'Not recorded on tape', b'' ]
+        else:
+            status, reason, body = found
+        self.send_response( status, reason )
+        self.send_header( 'Content-Type', 'text/csv' )
+        self.send_header( 'Content-Length', str(len(body)) )
+        self.end_headers()
+        self.wfile.write( body )
+
+
+class StandIn(object):
+    '''Local HTTP server of recorded fixtures, in a daemon thread.'''
+
+    def __init__( self, directory, latency=0.0, port=0 ):
+        self.tape = Tape( directory, replaying=True )
+        self.latency = latency      #  seconds of delay per response.
+        self.requests = 0           #  count of requests served.
+        self.lock = threading.Lock()
+        self.server = _Server( ('127.0.0.1', port), _Handler )
+        self.server.standin = self
+        self.base = 'http://127.0.0.1:' + str(self.server.server_address[1])
+        self.thread = threading.Thread( target=self.server.serve_forever )
+        self.thread.daemon = True
+        self.thread.start()
+
+    def count( self ):
+        with self.lock:
+            self.requests += 1
+
+    def close( self ):
+        '''Stop serving.'''
+        self.server.shutdown()
+        self.server.server_close()
+
+
+#  Live base URLs, as configured at import:
+livebase = { 'fredurl':   fred.fredurl,
+             'fredgraph': fred.fredgraph,
+             'quandl':    qdlapi.config.api_url }
+
+
+def redirect( base=None ):
+    '''Point FRED and Quandl at base, e.g. StandIn.base, keeping the
+       paths of live base URLs, so recorded fixtures are found.
+       Without base, restore live base URLs.
+    '''
+    def rebase( url ):
+        if base is None:
+            return url
+        return base.rstrip('/') + urlsplit( url ).path
+    fred.fredurl   = rebase( livebase['fredurl'] )
+    fred.fredgraph = rebase( livebase['fredgraph'] )
+    qdlapi.config.api_url = rebase( livebase['quandl'] )
+
+
+if __name__ == "__main__":
+     system.endmodule()
@@ -0,0 +1,252 @@
+#  Python Module for import                           Date : 2026-10-17
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+'''
+_______________|  ys_roll.py : continuous futures built from single contracts.
+
+Continuous (chained) futures from the free source CHRIS have spikes and
+gaps, while SCF is a paid source, see comments in yi_quandl.  Here we
+build continuous series locally from individual contracts, which are
+retrieved concurrently via the disk cache by yi_quandl.fut_contracts().
+
+A ROLL RULE decides which contract is held on each date:
+     'oi'      open interest crossover: hold the contract with most
+               open interest, never rolling back to an earlier one.
+     'volume'  volume crossover, likewise.
+     'expiry'  roll a fixed number of trading days before expiry of
+               each contract, taken as the start of its delivery month,
+               or its last trading day observed in data if earlier.
+
+ADJUSTMENT removes the price gap at each roll, so that returns are
+those actually earned by holding the contracts:
+     'back'    add the gaps to prior history (differences preserved).
+     'ratio'   multiply prior history by ratios (returns preserved).
+     None      raw prices of the contract held.
+The latest contract is never adjusted.
+
+The engine works on arrays of shape (..., dates, contracts) with
+contracts in delivery order, using only array operations (argmax,
+accumulate, cumulative sums and products along time, and indexing
+along axes by yi_1tools.alongaxis() which works on numpy before 1.15),
+so that hundreds of chains of equal shape are built in one pass,
+see stack():
+
+          Usage:  df = continuous( 'f4xau', '14g', '17z', rule='oi' )
+                  dfdic = continuous_batch( ['f4xau', 'f4wti'],
+                                            '14f', '17z', rule='expiry' )
+
+CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  Avoid numpy 1.15+ take_along_axis() and 1.17+ nan_to_num(nan=)
+               for Python 2.7 installs.
+2026-10-17  Expiry rule rolls by delivery month, never out of a contract
+               still trading on the last date.  Gap on a roll date without
+               price of the new contract is taken at its first price.
+2026-10-17  First version.
+'''
+
+from __future__ import absolute_import, print_function
+
+import numpy as np
+import pandas as pd
+
+from . import yi_0sys as system
+from . import yi_1tools as tools
+from . import yi_quandl as qdl
+
+
+rules   = [ 'oi', 'volume', 'expiry' ]
+adjusts = [ 'back', 'ratio', None ]
+
+#  Column of Quandl futures datasets for each crossover rule:
+rulecol = { 'oi': 'Open Interest', 'volume': 'Volume' }
+
+
+def ffill( prices ):
+    '''Forward fill NaN along dates (axis -2) of array.'''
+    prices = np.asarray( prices, dtype=float )
+    valid = ~np.isnan( prices )
+    rows = np.arange( prices.shape[-2] ).reshape( (-1, 1) )
+    last = np.maximum.accumulate( np.where(valid, rows, 0), axis=-2 )
+    #  ^row of last valid value (row 0, if none, which stays NaN).
+    return prices[ tools.alongaxis(last, axis=-2) ]
+
+
+def lastrows( prices ):
+    '''Row of last valid value per contract, shape (..., contracts).
+       For a contract without data, -1.
+    '''
+    valid = ~np.isnan( np.asarray(prices, dtype=float) )
+    rows = np.arange( valid.shape[-2] ).reshape( (-1, 1) )
+    return np.where( valid, rows, -1 ).max( axis=-2 )
+
+
+def roll_crossover( weights ):
+    '''Contract held per date, shape (..., dates): the contract with
+       greatest weight (e.g. open interest), never rolling back.
+       Dates without weights keep the prior contract.
+    '''
+    weights = np.asarray( weights, dtype=float )
+    held = np.argmax( np.where(np.isnan(weights), -np.inf, weights),
+                      axis=-1 )
+    held = np.where( np.isnan(weights).all(axis=-1), 0, held )
+    return np.maximum.accumulate( held, axis=-1 )
+
+
+def roll_expiry( prices, days=5, expiry=None ):
+    '''Contract held per date, shape (..., dates): each contract is
+       held until days rows before its expiry row, shape (..., contracts),
+       e.g. from expiryrows().  Without expiry, the last valid row of
+       each contract in prices is taken, except for contracts still
+       trading on the last row, which are never rolled out of.
+    '''
+    nrows = np.shape( prices )[-2]
+    last = lastrows( prices )
+    #  Data through the last row tells nothing about expiry:
+    ends = np.where( last >= nrows - 1, nrows, last )
+    if expiry is not None:
+        ends = np.minimum( ends, expiry )
+    #  Contracts expiring beyond the last row are never rolled out of:
+    rollrows = np.where( ends >= nrows, nrows, ends - days )
+    #  Expiry is in delivery order, so roll rows must not decrease:
+    rollrows = np.maximum.accumulate( rollrows, axis=-1 )
+    ncontracts = rollrows.shape[-1]
+    rows = np.arange( nrows )
+    #  Count of contracts already rolled out of, per date:
+    held = ( rollrows[..., np.newaxis, :] <= rows[:, np.newaxis] ).sum(
+                                                                 axis=-1 )
+    return np.minimum( held, ncontracts - 1 )
+
+
+def expiryrows( slangs, index ):
+    '''Row in index of the delivery month of each contract slang,
+       as proxy for expiry (liquidity leaves before first notice).
+       Rows past the index, for later deliveries, equal len(index).
+    '''
+    return np.array([ index.searchsorted( qdl.fut_delivery(slang) )
+                      for slang in slangs ])
+
+
+def chain( prices, held, adjust='back' ):
+    '''Continuous values, shape (..., dates), from prices of shape
+       (..., dates, contracts) and contract held per date.
+    '''
+    if adjust not in adjusts:
+        raise ValueError('adjust must be one of: ' + str(adjusts))
+    filled = ffill( prices )
+    held = np.asarray( held )
+    raw = np.asarray( prices, dtype=float )[ tools.alongaxis(
+                                         held[..., np.newaxis]) ][..., 0]
+    if adjust is None:
+        return raw
+    rows = np.arange( held.shape[-1] )
+    prior = np.concatenate( [held[..., :1], held[..., :-1]], axis=-1 )
+    starts = ( held != prior )
+    #  Contract held before the current one, forward from each roll:
+    start = np.maximum.accumulate( np.where(starts, rows, 0), axis=-1 )
+    before = prior[ tools.alongaxis(start) ]
+    new = filled[ tools.alongaxis(held[..., np.newaxis]) ]
+    old = filled[ tools.alongaxis(before[..., np.newaxis]) ]
+    new, old = new[..., 0], old[..., 0]
+    #  Gap is taken on the first date with a price of the new contract,
+    #  which is the roll date unless the new contract has no price yet:
+    valid = ~np.isnan( new )
+    validprior = np.concatenate( [np.zeros_like(valid[..., :1]),
+                                  valid[..., :-1]], axis=-1 )
+    rolled = ( (start > 0) & valid & (starts | ~validprior)
+               & ~np.isnan(old) )
+    if adjust == 'back':
+        gaps = np.where( rolled, new - old, 0.0 )
+        #  Sum of gaps on LATER dates, by reversed cumulative sum:
+        later = np.cumsum( gaps[..., ::-1], axis=-1 )[..., ::-1] - gaps
+        return raw + later
+    ratios = np.where( rolled & (old != 0), new / np.where(old, old, 1), 1.0 )
+    later = np.cumprod( ratios[..., ::-1], axis=-1 )[..., ::-1] / ratios
+    return raw * later
+
+
+def rollchain( prices, weights=None, rule='oi', adjust='back', days=5,
+               expiry=None ):
+    '''Continuous values from arrays (..., dates, contracts):
+       roll per rule, using weights for crossover rules,
+       and expiry rows, if given, for the expiry rule.
+    '''
+    if rule not in rules:
+        raise ValueError('rule must be one of: ' + str(rules))
+    if rule == 'expiry':
+        held = roll_expiry( prices, days, expiry )
+    else:
+        if weights is None:
+            raise ValueError('Crossover rule requires weights.')
+        held = roll_crossover( weights )
+    return chain( prices, held, adjust )
+
+
+def stack( frames, contracts=None ):
+    '''Align dataframes (dates x contracts in delivery order) into a
+       3-D array (frames, dates, contracts) over the union of dates,
+       padding later contracts with NaN: [array, index].
+    '''
+    index = frames[0].index
+    for df in frames[1:]:
+        index = index.union( df.index )
+    ncontracts = contracts or max( len(df.columns) for df in frames )
+    array = np.full( (len(frames), len(index), ncontracts), np.nan )
+    for i, df in enumerate( frames ):
+        values = df.reindex( index ).values
+        array[ i, :, :values.shape[1] ] = values
+    return [ array, index ]
+
+
+def panels( root, start, end, rule='oi', col='Settle', workers=8 ):
+    '''Prices and weights of contracts of root as dataframes,
+       dates x contracts, from yi_quandl.fut_contracts().
+    '''
+    slangs = qdl.fut_slangs( root, start, end )
+    dfdic = qdl.fut_contracts( slangs, workers )
+    found = [ slang for slang in slangs if slang in dfdic ]
+    if not found:
+        raise ValueError( 'No futures contracts found for ' + root )
+    def panel( column ):
+        return pd.concat( [ dfdic[slang][column] for slang in found ],
+                          axis=1, join='outer', keys=found ).sort_index()
+    prices = panel( col )
+    weights = panel( rulecol[rule] ) if rule in rulecol else None
+    return [ prices, weights ]
+
+
+def continuous_batch( roots, start, end, rule='oi', adjust='back',
+                      days=5, col='Settle', workers=8 ):
+    '''Continuous series for several roots as dictionary of dataframes,
+       built in one pass over stacked arrays.
+    '''
+    pairs = system.pmap( lambda root: panels( root, start, end, rule,
+                                              col, workers ),
+                         roots, workers=min(len(roots), 4) )
+    prices, index = stack( [ p for p, w in pairs ] )
+    weights = None
+    if rule in rulecol:
+        #  Weights reindexed to the union of price dates:
+        weights = stack( [ w.reindex( index ) for p, w in pairs ],
+                         prices.shape[-1] )[0]
+    #  Expiry rows by delivery month, padded like prices:
+    expiry = np.full( (prices.shape[0], prices.shape[-1]), len(index) )
+    for i, ( p, w ) in enumerate( pairs ):
+        expiry[ i, :len(p.columns) ] = expiryrows( p.columns, index )
+    values = rollchain( prices, weights, rule, adjust, days, expiry )
+    dfdic = {}
+    for i, root in enumerate( roots ):
+        df = tools.todf( pd.Series(values[i], index=index) )
+        dfdic[ root ] = df.dropna()
+    return dfdic
+
+
+def continuous( root, start, end, rule='oi', adjust='back', days=5,
+                col='Settle', workers=8 ):
+    '''Continuous series of root as dataframe, e.g. 'f4xau',
+       from contracts delivered from start through end as 'yym'.
+    '''
+    return continuous_batch( [root], start, end, rule, adjust, days,
+                             col, workers )[ root ]
+
+
+if __name__ == "__main__":
+     system.endmodule()
@@ -0,0 +1,107 @@
+#  Python Module for import                           Date : 2026-10-17
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+'''
+_______________|  ys_route.py : route data codes directly to their backend.
+
+Rather than trying FRED, then Quandl, then stocks until one succeeds,
+we classify the code up front by its form:
+
+     's4spy'                       stock slang            -> 'stock'
+     'f4xau15z'                    futures slang          -> 'quandl'
+     'w4cotr_xau', m4spx_1871_p    registered in qdlsynth -> 'quandl'
+     'CFTC/GC_FO_ALL'              database/dataset       -> 'quandl'
+     d4xau, 'DGS10'                everything else        -> 'fred'
+
+          Usage:  backend = route( code )
+
+Codes which recently failed DEFINITIVELY (invalid slang, dataset or
+series not found) are remembered for failttl seconds, so that repeated
+requests for an invalid code do not hit the network again.  Transient
+errors (timeouts, resets, 5xx, rate limits) are not remembered:
+
+          Usage:  failcheck( code )     #  raises ValueError if recent,
+                                        #     with the original message.
+                  failed( code, e )     #  remember failure now,
+                                        #     if e is definitive.
+
+CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  Remember only definitive failures, with original message.
+2026-10-17  First version replaces the try/except cascade of get().
+'''
+
+from __future__ import absolute_import, print_function
+
+import time
+import threading
+
+from . import yi_0sys as system
+from . import yi_quandl as qdl
+from . import yi_quandl_api as qdlapi
+from . import ys_http
+
+
+failttl = 300       #  seconds to remember a failed code.
+
+#  Messages, in lower case, of errors which retrying will not cure:
+definitive_messages = [ 'slang argument is invalid',
+                        'series does not exist' ]
+
+_failures = {}      #  code : [ time of failure, message ].
+_faillock = threading.Lock()
+
+
+def route( code ):
+    '''Backend for code: 'fred', 'quandl', or 'stock'.'''
+    if code[:2] == 's4' and not code.isupper():
+        return 'stock'
+    if code[:2] == 'f4' and not code.isupper():
+        return 'quandl'
+    if code in qdl.qdlsynth or code[:7] == 'w4cotr_' or '/' in code:
+        return 'quandl'
+    return 'fred'
+
+
+def definitive( e ):
+    '''Whether error e shows that the code itself is invalid:
+       dataset not found, HTTP 404, or one of definitive_messages.'''
+    if isinstance( e, qdlapi.DatasetNotFound ):
+        return True
+    if isinstance( e, ys_http.HTTPError ) and e.code == 404:
+        return True
+    message = str( e ).lower()
+    return any( text in message for text in definitive_messages )
+
+
+def failed( code, e ):
+    '''Remember that retrieval of code failed just now, given error e,
+       only if the failure is definitive.  Returns whether remembered.
+    '''
+    if not definitive( e ):
+        return False
+    with _faillock:
+        _failures[ code ] = [ time.time(), str(e) ]
+    return True
+
+
+def failcheck( code ):
+    '''Raise ValueError with the original message
+       if code failed within the last failttl seconds.'''
+    with _faillock:
+        failure = _failures.get( code )
+        if failure is None:
+            return
+        when, message = failure
+        if time.time() - when < failttl:
+            raise ValueError('Recently failed, retry later: ' + str(code)
+                             + ' :: ' + message)
+        del _failures[ code ]
+
+
+def failclear():
+    '''Forget all remembered failures.'''
+    with _faillock:
+        _failures.clear()
+
+
+if __name__ == "__main__":
+     system.endmodule()
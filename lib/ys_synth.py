@@ -0,0 +1,100 @@
+#  Python Module for import                           Date : 2026-10-17
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+'''
+_______________|  ys_synth.py : registry of synthetic series and fetch planner.
+
+A SYNTHETIC series is computed from other series, for example:
+     d4curve = d4bond10 - d4bills
+     d4oil   = (d4brent + d4wti) / 2
+Each synthetic DECLARES its inputs and transform in a REGISTRY, a dict:
+
+     registry[ code ] = ( (input codes,), transform )
+
+where transform accepts the input dataframes in the declared order.
+An input which is itself registered is evaluated recursively,
+otherwise it is a LEAF to be downloaded.  By convention, an input equal
+to its own code denotes the raw download of that code, e.g. d4spx is
+the raw FRED series SP500 prepended with a local archive.
+
+The PLANNER walks the dependency graph (a DAG) of the requested codes,
+returning the minimal set of leaf downloads and the order in which
+synthetics should be evaluated, so that sub-results are shared:
+
+          Usage:  leaves, nodes = plan( registry, codes )
+                  dfdic = evaluate( registry, codes, fetch )
+                  #                                  ^function of a leaf code.
+
+See fredsynth in module yi_fred and qdlsynth in module yi_quandl.
+
+CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  First version replaces if/elif chains in getfred and getqdl.
+'''
+
+from __future__ import absolute_import, print_function
+
+from . import yi_0sys as system
+
+
+def isleaf( registry, node, code ):
+    '''Is input code of registered node a leaf download?'''
+    return code == node or code not in registry
+
+
+def plan( registry, codes ):
+    '''Minimal leaf downloads and evaluation order for requested codes.
+       Returns [leaves, nodes] where nodes are in dependency order.
+    '''
+    leaves = []
+    nodes  = []
+    visiting = set()
+
+    def visit( code ):
+        if code in nodes:
+            return
+        if code in visiting:
+            raise ValueError('Cyclic synthetic series: ' + str(code))
+        visiting.add( code )
+        inputs = registry[ code ][0]
+        for i in inputs:
+            if isleaf( registry, code, i ):
+                if i not in leaves:
+                    leaves.append( i )
+            else:
+                visit( i )
+        visiting.discard( code )
+        nodes.append( code )
+        #  ^post-order, so inputs always precede their dependents.
+
+    for code in codes:
+        if code in registry:
+            visit( code )
+        elif code not in leaves:
+            leaves.append( code )
+    return [ leaves, nodes ]
+
+
+def evaluate( registry, codes, fetch, memoize=None ):
+    '''Evaluate requested codes as dict of dataframes, sharing sub-results.
+       fetch(code) downloads a leaf.  Optional memoize(code, fun)
+       may retain node results beyond this evaluation, see ys_cache.
+    '''
+    leaves, nodes = plan( registry, codes )
+    raw = dict( (leaf, fetch(leaf)) for leaf in leaves )
+    done = {}
+    for code in nodes:
+        inputs, transform = registry[ code ]
+        args = [ raw[i] if isleaf(registry, code, i) else done[i]
+                 for i in inputs ]
+        def compute():
+            return transform( *args ).dropna()
+            #  ^NO NULLS, esp. for synthetics from overlapping indexes.
+        if memoize is None:
+            done[ code ] = compute()
+        else:
+            done[ code ] = memoize( code, compute )
+    return dict( (code, done[code] if code in registry else raw[code])
+                 for code in codes )
+
+
+if __name__ == "__main__":
+     system.endmodule()
@@ -0,0 +1,172 @@
+#  Python Module for import                           Date : 2026-10-17
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+'''
+_______________|  test_aio : Test fecon235 ys_aio module.
+
+- HTTP client handles gzip, chunked transfer, redirects, and errors.
+- aget() and agroupget() retrieve FRED series on one event loop.
+- Quandl rate limit is awaited on the loop; refused calls are retried.
+A local HTTP server stands in for the data vendor: no network required.
+Skipped for Python below 3.5 where ys_aio is not available.
+
+Testing: As of fecon235 v4, we favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+               or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  Add tests of Quandl retry after refusal, shared hostlimit.
+2026-10-17  First version.
+'''
+
+from __future__ import absolute_import, print_function
+
+import gzip
+import threading
+import pytest
+from fecon235.lib import yi_0sys as system
+from fecon235.lib import yi_fred as fred
+from fecon235.lib import yi_quandl_api as qdlapi
+from fecon235.lib import ys_cache as cache
+from fecon235.lib import ys_http
+#
+#  N.B. -  In this tests directory without __init__.py,
+#          we use absolute import as if outside the fecon235 package,
+#          not relative import (cf. modules within lib).
+
+if system.pythontup() < (3, 5, 0):
+    pytest.skip('ys_aio requires Python 3.5+', allow_module_level=True)
+
+import asyncio
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from fecon235.lib import ys_aio as aio
+
+
+#  Daily gold prices, see test_timeseries.py for listing:
+with open('zdata-xau-13hj-c30.csv', 'rb') as f:
+    xaucsv = f.read()
+
+qdlcsv = b'Date,Value\n2014-01-03,5\n2014-01-01,6\n'
+refusals = [ 0 ]
+
+
+class Handler( BaseHTTPRequestHandler ):
+    '''Serve xaucsv gzipped, chunked, or plain; also redirect and 404.'''
+    protocol_version = 'HTTP/1.1'
+
+    def log_message( self, *args ):
+        pass
+
+    def do_GET( self ):
+        if self.path.startswith('/api/datasets/EX/BUSY.csv'):
+            refusals[0] -= 1
+            status = 429 if refusals[0] >= 0 else 200
+            body = b'' if status == 429 else qdlcsv
+            self.send_response( status )
+            self.send_header( 'Content-Length', str(len(body)) )
+            self.end_headers()
+            self.wfile.write( body )
+        elif self.path.startswith('/missing'):
+            self.send_response( 404 )
+            self.send_header( 'Content-Length', '0' )
+            self.end_headers()
+        elif self.path.startswith('/moved'):
+            self.send_response( 302 )
+            self.send_header( 'Location', '/gzip' )
+            self.send_header( 'Content-Length', '0' )
+            self.end_headers()
+        elif self.path.startswith('/chunked'):
+            self.send_response( 200 )
+            self.send_header( 'Transfer-Encoding', 'chunked' )
+            self.end_headers()
+            for i in range( 0, len(xaucsv), 100 ):
+                chunk = xaucsv[ i:i+100 ]
+                self.wfile.write( ('%x\r\n' % len(chunk)).encode() )
+                self.wfile.write( chunk + b'\r\n' )
+            self.wfile.write( b'0\r\n\r\n' )
+        else:
+            body = gzip.compress( xaucsv )
+            self.send_response( 200 )
+            self.send_header( 'Content-Encoding', 'gzip' )
+            self.send_header( 'Content-Length', str(len(body)) )
+            self.end_headers()
+            self.wfile.write( body )
+
+
+server = HTTPServer( ('127.0.0.1', 0), Handler )
+thread = threading.Thread( target=server.serve_forever )
+thread.daemon = True
+thread.start()
+base = 'http://127.0.0.1:' + str(server.server_address[1])
+
+
+def run( coroutine ):
+    '''Run coroutine to completion on a fresh event loop.'''
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete( coroutine )
+    finally:
+        loop.close()
+
+
+def test_ys_aio_fecon235_fetch_encodings():
+    '''Gzip, chunked, and redirected responses give the same bytes.'''
+    assert run( aio.fetch(base + '/gzip') ) == xaucsv
+    assert run( aio.fetch(base + '/chunked') ) == xaucsv
+    assert run( aio.fetch(base + '/moved') ) == xaucsv
+
+
+def test_ys_aio_fecon235_fetch_error():
+    '''Status 404 raises HTTPError as urlopen would.'''
+    with pytest.raises( aio.HTTPError ) as e:
+        run( aio.fetch(base + '/missing') )
+    assert e.value.code == 404
+
+
+def test_ys_aio_fecon235_aget_matches_readfile( monkeypatch ):
+    '''FRED synthetics via aget() and agroupget() match local parsing.'''
+    monkeypatch.setattr( fred, 'makeURL', lambda code: base + '/' + code )
+    cache.setcache( enabled=False )
+    try:
+        xau = run( aio.aget(fred.d4xau) )
+        assert xau.equals( fred.readfile('zdata-xau-13hj-c30.csv').dropna() )
+        groupdf = run( aio.agroupget({'XAU': fred.d4xau,
+                                      'Double': fred.d4eurjpy}) )
+    finally:
+        cache.setcache( enabled=True )
+    assert list(groupdf.columns) == ['Double', 'XAU']
+    assert (groupdf['Double'] == groupdf['XAU'] ** 2).all()
+
+
+def test_ys_aio_fecon235_quandl_retry( tmpdir, monkeypatch ):
+    '''Refused (429) Quandl download is retried after backoff,
+       while waiting for the rate on the loop, not in the executor.'''
+    #  Tokens are saved apart from the tests directory:
+    monkeypatch.setenv( 'QUANDL_TOKEN_FILE', str(tmpdir.join('token.p')) )
+    monkeypatch.setattr( qdlapi, 'config', qdlapi.ApiConfig() )
+    monkeypatch.setattr( qdlapi.config, 'api_url', base + '/api/' )
+    monkeypatch.setattr( qdlapi, 'scheduler',
+                         ys_http.Scheduler(rate=50, burst=1, backoff=0.01) )
+    monkeypatch.setattr( ys_http.Scheduler, 'acquire', None )
+    #  ^blocking acquire must not be used.
+    refusals[0] = 2
+    retriever = aio.Retriever()
+    df = run( retriever.qdlleaf('EX/BUSY', authtoken='x') )
+    assert refusals[0] == -1
+    assert list( df['Value'] ) == [ 5, 6 ]
+    refusals[0] = 9
+    with pytest.raises( qdlapi.CallLimitExceeded ):
+        run( retriever.qdlleaf('EX/BUSY', authtoken='y') )
+
+
+def test_ys_aio_fecon235_hostlimit_shared():
+    '''Sync groupget() and async Retriever use the same host limits.'''
+    from fecon235 import fecon235 as fe
+    assert aio.hostlimit is ys_http.hostlimit
+    assert fe.hostlimit is ys_http.hostlimit
+
+
+if __name__ == "__main__":
+     system.endmodule()
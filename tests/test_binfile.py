@@ -0,0 +1,95 @@
+#  Python Module for import                           Date : 2026-10-17
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+'''
+_______________|  test_binfile : Test fecon235 ys_binfile module.
+
+- Round trip through binary file, with and without memory mapping.
+- readfile() and writefile() dispatch on the '.fbin' extension.
+- csv2bin() converts a gzip CSV archive.
+
+Testing: As of fecon235 v4, we favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+               or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  First version.
+'''
+
+from __future__ import absolute_import, print_function
+
+import os
+import gzip
+import shutil
+import tempfile
+import numpy as np
+from fecon235.lib import yi_0sys as system
+from fecon235.lib import yi_1tools as tools
+from fecon235.lib import yi_fred as fred
+from fecon235.lib import ys_binfile as binfile
+#
+#  N.B. -  In this tests directory without __init__.py,
+#          we use absolute import as if outside the fecon235 package,
+#          not relative import (cf. modules within lib).
+
+
+#  Daily gold prices, see test_timeseries.py for listing:
+xau = fred.readfile('zdata-xau-13hj-c30.csv')
+
+tmpdir = tempfile.mkdtemp( prefix='fecon235-binfile-' )
+
+
+def test_ys_binfile_fecon235_round_trip():
+    '''Binary file gives back identical dataframe, and its header.'''
+    path = os.path.join( tmpdir, 'xau.fbin' )
+    binfile.writebin( xau, path, source='test' )
+    assert binfile.readbin( path ).equals( xau )
+    assert binfile.readbin( path, mmap=False ).equals( xau )
+    header = binfile.bininfo( path )
+    assert header['rows'] == len( xau )
+    assert header['columns'] == [ 'Y' ]
+    assert header['index'] == 'T'
+    assert header['source'] == 'test'
+
+
+def test_ys_binfile_fecon235_float32_multicolumn():
+    '''Multiple columns in float32 keep their order and precision.'''
+    df = tools.paste([ xau, tools.todf(xau['Y'] / 3) ])
+    df.columns = [ 'A', 'B' ]
+    path = os.path.join( tmpdir, 'ab.fbin' )
+    binfile.writebin( df, path, dtype='float32' )
+    df32 = binfile.readbin( path )
+    assert list(df32.columns) == [ 'A', 'B' ]
+    assert df32.values.dtype == np.float32
+    assert np.allclose( df32.values, df.values, rtol=1e-6 )
+
+
+def test_ys_binfile_fecon235_mmap_is_copy_on_write():
+    '''Changing a memory mapped dataframe never alters its file.'''
+    path = os.path.join( tmpdir, 'cow.fbin' )
+    binfile.writebin( xau, path )
+    df = binfile.readbin( path )
+    df['Y'] = 0.0
+    df.iloc[ 0, 0 ] = -1.0
+    assert binfile.readbin( path ).equals( xau )
+
+
+def test_ys_binfile_fecon235_readfile_writefile_csv2bin():
+    '''Dispatch by extension, and conversion of gzip CSV archive.'''
+    path = os.path.join( tmpdir, 'written.fbin' )
+    tools.writefile( xau, path )
+    assert fred.readfile( path ).equals( xau )
+    archive = os.path.join( tmpdir, 'FRED-XAU-ARC.csv.gz' )
+    with open('zdata-xau-13hj-c30.csv', 'rb') as src:
+        with gzip.open( archive, 'wb' ) as dst:
+            shutil.copyfileobj( src, dst )
+    binname = fred.csv2bin( archive )
+    assert binname == os.path.join( tmpdir, 'FRED-XAU-ARC.fbin' )
+    assert fred.readfile( binname ).equals( xau )
+    assert binfile.bininfo( binname )['source'] == 'FRED-XAU-ARC.csv.gz'
+
+
+if __name__ == "__main__":
+     system.endmodule()
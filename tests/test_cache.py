@@ -0,0 +1,193 @@
+#  Python Module for import                           Date : 2026-10-17
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+'''
+_______________|  test_cache : Test fecon235 ys_cache module.
+
+- Round trip of a dataframe through the disk cache.
+- Freshness window by frequency, and least-recently-used eviction.
+- Scoped memo() with hit and miss counters.
+- Incremental update of a stale entry, unless revised upstream.
+No network access is required: fetch functions are local.
+
+Testing: As of fecon235 v4, we favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+               or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  Each test of disk cache uses its own tmpdir via monkeypatch.
+2026-10-17  Add test of fallback to fetch() when tailfetch fails.
+2026-10-17  Add test of memo() shared across threads.
+2026-10-17  Add tests of incremental update().
+2026-10-17  First version.
+'''
+
+from __future__ import absolute_import, print_function
+
+import os
+import time
+import threading
+from fecon235.lib import yi_0sys as system
+from fecon235.lib import yi_fred as fred
+from fecon235.lib import ys_cache as cache
+#
+#  N.B. -  In this tests directory without __init__.py,
+#          we use absolute import as if outside the fecon235 package,
+#          not relative import (cf. modules within lib).
+
+
+#  Daily gold prices, see test_timeseries.py for listing:
+xau = fred.readfile('zdata-xau-13hj-c30.csv')
+
+def test_ys_cache_fecon235_round_trip( tmpdir, monkeypatch ):
+    '''Second retrieval must come from disk, not the fetch function.'''
+    monkeypatch.setitem( cache._settings, 'directory', str(tmpdir) )
+    calls = []
+    def fetch():
+        calls.append(1)
+        return xau
+    df1 = cache.cached( 'test', 'XAU-roundtrip', fetch )
+    df2 = cache.cached( 'test', 'XAU-roundtrip', fetch )
+    assert len(calls) == 1
+    assert df2.equals( df1 )
+    assert list(df2.columns) == ['Y']
+    assert df2.index.name == 'T'
+
+
+def test_ys_cache_fecon235_freshness_by_frequency( tmpdir, monkeypatch ):
+    '''Daily series expire sooner than quarterly series.'''
+    monkeypatch.setitem( cache._settings, 'directory', str(tmpdir) )
+    quarterly = fred.quarterly( xau )
+    assert cache.maxage( xau ) < cache.maxage( quarterly )
+    #  Age the stored entry beyond the daily window:
+    cache.store( 'test', 'XAU-stale', xau )
+    assert cache.load( 'test', 'XAU-stale' ) is not None
+    monkeypatch.setattr( cache, 'freshness', [ (None, -1) ] )
+    assert cache.load( 'test', 'XAU-stale' ) is None
+    assert cache.load( 'test', 'XAU-stale', fresh=False ) is not None
+
+
+def test_ys_cache_fecon235_evict_least_recently_used( tmpdir, monkeypatch ):
+    '''Eviction removes the entry which was accessed longest ago.'''
+    monkeypatch.setitem( cache._settings, 'directory', str(tmpdir) )
+    for code in ['A', 'B', 'C']:
+        path = cache.store( 'test', code, xau )
+    size = os.path.getsize( path )
+    #  Pretend A was used recently, and B long ago:
+    now = time.time()
+    os.utime( cache.cachepath('test', 'B'), (now - 999, now - 999) )
+    cache.evict( megabytes=(2.5 * size) / (1024 * 1024) )
+    assert cache.load( 'test', 'B' ) is None
+    assert cache.load( 'test', 'A' ) is not None
+    assert cache.cacheinfo()[0] == 2
+
+
+def test_ys_cache_fecon235_memo_scope_and_counters():
+    '''Within memo() each key computes once; outside nothing is retained.'''
+    calls = []
+    def fetch():
+        calls.append(1)
+        return xau
+    with cache.memo() as m:
+        df1 = cache.memoize( 'test', 'XAU', fetch )
+        df1.columns = ['renamed']
+        #  ^mutating a returned copy must not affect the memo:
+        with cache.memo() as inner:
+            df2 = cache.memoize( 'test', 'XAU', fetch )
+        assert inner is m
+        assert list(df2.columns) == ['Y']
+    assert [ m.hits, m.misses ] == [ 1, 1 ]
+    cache.memoize( 'test', 'XAU', fetch )
+    assert len(calls) == 2
+
+
+def test_ys_cache_fecon235_memo_threads_share():
+    '''Contexts created before either is entered share one memo,
+       and a thread leaving its context keeps the other's active.'''
+    calls = []
+    def fetch():
+        calls.append(1)
+        return xau
+    first, second = cache.memo(), cache.memo()
+    done = threading.Event()
+    def other():
+        with second as m2:
+            cache.memoize( 'test', 'XAU', fetch )
+            shared.append( m2 )
+        done.set()
+    shared = []
+    with first as m1:
+        thread = threading.Thread( target=other )
+        thread.start()
+        done.wait( 10 )
+        assert shared == [ m1 ]
+        cache.memoize( 'test', 'XAU', fetch )
+        with cache.Memo():
+            pass
+        #  ^memo which never became active leaves m1 active:
+        cache.memoize( 'test', 'XAU', fetch )
+    thread.join()
+    assert len( calls ) == 1
+    assert [ m1.hits, m1.misses ] == [ 2, 1 ]
+
+
+def test_ys_cache_fecon235_update_appends_tail():
+    '''Only rows since the overlap are requested, then appended.'''
+    starts = []
+    def tailfetch( start ):
+        starts.append( start )
+        return xau[ xau.index >= start ]
+    df = cache.update( xau[:-7], tailfetch, overlap=3 )
+    assert starts == [ str(xau.index[-10].date()) ]
+    assert df.equals( xau )
+
+
+def test_ys_cache_fecon235_update_detects_revision():
+    '''Revised overlapping rows require a full fetch.'''
+    revised = xau.copy()
+    revised.iloc[ -8, 0 ] += 1.0
+    def tailfetch( start ):
+        return revised[ revised.index >= start ]
+    assert cache.update( xau[:-7], tailfetch, overlap=3 ) is None
+
+
+def test_ys_cache_fecon235_cached_stale_uses_tailfetch( tmpdir, monkeypatch ):
+    '''Stale entry is updated via tailfetch instead of full fetch.'''
+    monkeypatch.setitem( cache._settings, 'directory', str(tmpdir) )
+    cache.store( 'test', 'XAU-tail', xau[:-4] )
+    calls = []
+    def fetch():
+        calls.append( 'full' )
+        return xau
+    def tailfetch( start ):
+        calls.append( 'tail' )
+        return xau[ xau.index >= start ]
+    monkeypatch.setattr( cache, 'freshness', [ (None, -1) ] )
+    df = cache.cached( 'test', 'XAU-tail', fetch, tailfetch )
+    assert calls == [ 'tail' ]
+    assert df.equals( xau )
+    assert cache.load( 'test', 'XAU-tail', fresh=False ).equals( xau )
+
+
+def test_ys_cache_fecon235_cached_tailfetch_fails( tmpdir, monkeypatch ):
+    '''Failing tailfetch falls back to full fetch.'''
+    monkeypatch.setitem( cache._settings, 'directory', str(tmpdir) )
+    monkeypatch.setattr( cache, 'freshness', [ (None, -1) ] )
+    #  ^every entry is stale.
+    cache.store( 'test', 'XAU-tailfail', xau[:-4] )
+    calls = []
+    def fetch():
+        calls.append( 'full' )
+        return xau
+    def tailfetch( start ):
+        calls.append( 'tail' )
+        raise IOError( 'HTTP Error 404: Not Found' )
+    df = cache.cached( 'test', 'XAU-tailfail', fetch, tailfetch )
+    assert calls == [ 'tail', 'full' ]
+    assert df.equals( xau )
+
+
+if __name__ == "__main__":
+     system.endmodule()
@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2016-11-06
+#  Python Module for import                           Date : 2026-10-17
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263 
 ''' 
 _______________|  test_fred : Test fecon235 yi_fred module.
@@ -6,6 +6,8 @@ _______________|  test_fred : Test fecon235 yi_fred module.
 - Include test of index_delta_secs() 
 - Indirect test of resample_main() via rewritten functions:
      daily(), monthly(), and quarterly().
+- Fast path readfred() agrees with general pandas parsing,
+     plus benchmark on the multi-decade daily S&P 500 archive.
 
 Testing: As of fecon235 v4, we favor pytest over nosetests, so e.g. 
     $ py.test --doctest-modules
@@ -15,11 +17,17 @@ REFERENCE
                or PDF at http://pytest.org/latest/pytest.pdf
 
 CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  Test that readfile() of URL falls back to pd.read_csv().
+2026-10-17  Add tests of readfred() equivalence and speed.
 2016-11-06  First version to verify fix #6.
 '''
 
 from __future__ import absolute_import, print_function
 
+import io
+import os
+import gzip
+import time
 import numpy as np
 import pandas as pd
 from fecon235.lib import yi_0sys as system
@@ -141,5 +149,70 @@ def test_yi_fred_fecon235_check_xau_resample_main():
 
 
 
+def readgeneral( data ):
+    '''General pandas parsing of FRED CSV bytes, as readfile() once did.'''
+    df = pd.read_csv( io.BytesIO(data), index_col=0, parse_dates=True,
+                      header=0, names=['T', 'Y'] )
+    df['Y'] = pd.to_numeric( df['Y'], errors='coerce' )
+    df['Y'] = df['Y'].fillna( method='pad' )
+    return df
+
+
+def test_yi_fred_fecon235_readfred_missing_values():
+    '''FRED "." is NaN, then filled forward, except leading rows.'''
+    data = ( b'DATE,VALUE\r\n2014-01-01,.\r\n2014-01-02,1.5\r\n'
+             + b'2014-01-03,.\r\n2014-01-06,-2.25\r\n' )
+    df = fred.readfred( data )
+    assert df.equals( readgeneral(data) )
+    assert np.isnan( df['Y'][0] )
+    assert list( df['Y'][1:] ) == [ 1.5, 1.5, -2.25 ]
+
+
+def test_yi_fred_fecon235_readfred_other_layout_falls_back():
+    '''Three columns are not FRED layout: ValueError for readfred().'''
+    try:
+        fred.readfred( b'T,A,B\n2014-01-01,1,2\n' )
+        assert False
+    except ValueError:
+        pass
+    df = fred.readfile( io.BytesIO(b'T,Y\n01/02/2014,3\n01/03/2014,4\n') )
+    #                                    ^non-ISO dates use pandas.
+    assert list( df['Y'] ) == [ 3.0, 4.0 ]
+    for bad in [ b'2014-13-01', b'2014-02-30', b'2014-0a-01' ]:
+        try:
+            fred.readfred( b'DATE,VALUE\n' + bad + b',1\n' )
+            assert False
+        except ValueError:
+            pass
+
+
+def test_yi_fred_fecon235_readfile_url_uses_pandas():
+    '''readfile() leaves URLs, not local files, to pd.read_csv().'''
+    path = os.path.abspath( 'zdata-xau-13hj-c30.csv' )
+    url = 'file://' + path.replace( os.sep, '/' )
+    assert not os.path.isfile( url )
+    assert fred.readfile( url ).equals( fred.readfile(path) )
+
+
+def test_yi_fred_fecon235_readfred_speed_vSlow():
+    '''readfred() matches, and beats, general parsing of S&P 500 archive.'''
+    archive = os.path.join( os.path.dirname(os.path.abspath(__file__)),
+                            '..', 'nb', 'FRED-SP500_1957-2014-ARC.csv.gz' )
+    with gzip.open( archive, 'rb' ) as f:
+        data = f.read()
+    assert fred.readfred( data ).equals( readgeneral(data) )
+    def best( fun ):
+        secs = []
+        for _ in range( 5 ):
+            start = time.time()
+            fun( data )
+            secs.append( time.time() - start )
+        return min( secs )
+    tfast = best( fred.readfred )
+    tgeneral = best( readgeneral )
+    print( ' ::  readfred speedup:', round(tgeneral / tfast, 1) )
+    assert tfast < tgeneral
+
+
 if __name__ == "__main__":
      system.endmodule()
@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2016-04-08
+#  Python Module for import                           Date : 2026-10-17
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263 
 ''' 
 _______________|  test_optimize : Test fecon235 ys_optimize module.
@@ -36,6 +36,9 @@ Our selected methods feature the following and their unification:
 Here we test three types of LOSS FUNCTIONS: sum of squared errors,
 sum of absolute errors, and median of absolute errors.
 
+For Holt-Winters, minholtgrid() in module ys_opt_holt evaluates the
+whole grid of minBrute() in one time pass, with the same result.
+
 
 Testing: As of fecon235 v4, we favor pytest over nosetests, so e.g. 
     $ py.test --doctest-modules
@@ -45,6 +48,7 @@ REFERENCE
                or PDF at http://pytest.org/latest/pytest.pdf
 
 CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  Add tests of loss_holtgrid() and minholtgrid() of ys_opt_holt.
 2016-04-08  Clarify model specification and add median absolute error.
 2016-04-06  Semantic change of names to avoid misunderstanding.
                minimize() -> optimize()
@@ -55,9 +59,12 @@ CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
 
 from __future__ import absolute_import, print_function
 
+import time
 import numpy as np
+import pandas as pd
 from fecon235.lib import yi_0sys as system
 from fecon235.lib import ys_optimize as yop
+from fecon235.lib import ys_opt_holt as oholt
 #
 #  N.B. -  in this tests directory without __init__.py, 
 #          we use absolute import as if outside the fecon235 package,
@@ -307,5 +314,58 @@ def test_optimize_ys_optimize_fecon235_rosenbrock_function():
     assert abs(result[1] - 1.0) < 0.0001
 
 
+#  ================================================ HOLT-WINTERS grid ========== 
+#  Loss of Holt-Winters parameters over the whole grid in one time pass:
+
+def randomwalk( n ):
+    '''Seeded random walk with drift, as a price series.'''
+    return 100 + np.cumsum( np.random.RandomState(235).normal(0.01, 1, n) )
+
+
+def test_ys_opt_holt_fecon235_loss_holtgrid():
+    '''Grid loss matches loss_holt() per pair, also in small chunks.'''
+    y = randomwalk( 120 )
+    alphagrid = np.linspace( 0.0, 1.0, 7 )
+    betagrid = np.linspace( 0.0, 0.6, 5 )
+    losses = oholt.loss_holtgrid( y, alphagrid, betagrid )
+    assert losses.shape == ( 7, 5 )
+    for i, alpha in enumerate( alphagrid ):
+        for j, beta in enumerate( betagrid ):
+            assert np.isclose( losses[i, j],
+                               oholt.loss_holt((alpha, beta), y) )
+    chunked = oholt.loss_holtgrid( y, alphagrid, betagrid, memory=2000 )
+    assert np.allclose( chunked, losses )
+
+
+def test_ys_opt_holt_fecon235_minholtgrid():
+    '''Same optimum as minBrute(loss_holt) on same grid.'''
+    y = randomwalk( 300 )
+    boundpairs = [ (0.05, 0.95), (0.0, 0.5) ]
+    expected = yop.minBrute( fun=oholt.loss_holt, funarg=( y, ),
+                             boundpairs=boundpairs, grids=15 )
+    result = oholt.minholtgrid( y, boundpairs, grids=15 )
+    assert np.allclose( result, expected )
+    alphabetaloss = oholt.optimize_holt( pd.DataFrame(y), grids=15,
+                                         alphas=(0.05, 0.95),
+                                         betas=(0.0, 0.5) )
+    assert np.allclose( alphabetaloss[:2], np.round(expected, 4) )
+
+
+def test_ys_opt_holt_fecon235_minholtgrid_speed_vSlow():
+    '''One time pass over the grid beats minBrute(loss_holt), grids=50.'''
+    y = randomwalk( 300 )
+    boundpairs = [ (0.0, 1.0), (0.0, 1.0) ]
+    start = time.time()
+    expected = yop.minBrute( fun=oholt.loss_holt, funarg=( y, ),
+                             boundpairs=boundpairs, grids=50 )
+    tbrute = time.time() - start
+    start = time.time()
+    result = oholt.minholtgrid( y, boundpairs, grids=50 )
+    tgrid = time.time() - start
+    print( ' ::  minholtgrid speedup:', round(tbrute / tgrid, 1) )
+    assert np.allclose( result, expected )
+    assert tgrid < tbrute
+
+
 if __name__ == "__main__":
      system.endmodule()
@@ -0,0 +1,227 @@
+#  Python Module for import                           Date : 2026-10-17
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+'''
+_______________|  test_quandl : Test fecon235 yi_quandl and yi_quandl_api.
+
+- Multiset get() aligns datasets in one outer join, including NOT FOUND.
+- ApiConfig loads the auth token once per process; environment overrides.
+- getcurve() and curvesnap() align futures contracts fetched concurrently.
+- cotr_batch() and groupcotr() agree with per-report computation.
+No network access is required: downloads are replaced by local frames.
+
+Testing: As of fecon235 v4, we favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+               or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  Add test of getqdl() maxi with cold cache.
+2026-10-17  Add tests of batched COTR positions.
+2026-10-17  Add tests of futures term structure.
+2026-10-17  Add tests of ApiConfig.
+2026-10-17  First version.
+'''
+
+from __future__ import absolute_import, print_function
+
+import io
+import pickle
+import numpy as np
+import pandas as pd
+from fecon235.lib import yi_0sys as system
+from fecon235.lib import yi_quandl as qdl
+from fecon235.lib import yi_quandl_api as qdlapi
+from fecon235.lib import ys_cache
+from fecon235.lib import ys_route
+from fecon235 import fecon235 as fe
+#
+#  N.B. -  In this tests directory without __init__.py,
+#          we use absolute import as if outside the fecon235 package,
+#          not relative import (cf. modules within lib).
+
+
+#  Local stand-ins for Quandl datasets, as CSV text:
+datasets = { 'EX/AA': 'Date,Open,Settle\n2014-01-02,1,2\n2014-01-01,3,4\n',
+             'EX/BB': 'Date,Value\n2014-01-03,5\n2014-01-01,6\n' }
+
+
+def download( url ):
+    '''Stand-in for qdlapi._download() by dataset code in url.'''
+    for code in datasets:
+        if 'datasets/' + code + '.csv' in url:
+            return pd.read_csv( io.StringIO(datasets[code]),
+                                index_col=0, parse_dates=True )
+    raise qdlapi.HTTPError( url, 404, 'Not Found', {}, None )
+
+
+def test_yi_quandl_api_fecon235_multiset_outer_join( monkeypatch ):
+    '''List of datasets gives one sorted frame with prefixed columns.'''
+    monkeypatch.setattr( qdlapi, '_download', download )
+    df = qdlapi.get([ 'EX/AA', 'EX/BB', 'EX/CC' ])
+    assert list(df.columns) == [ 'EX.AA - Open', 'EX.AA - Settle',
+                                 'EX.BB - Value', 'EX.CC - NOT FOUND' ]
+    assert [ str(d.date()) for d in df.index ] == [ '2014-01-01',
+                                          '2014-01-02', '2014-01-03' ]
+    assert df['EX.BB - Value'][0] == 6.0
+    assert df['EX.BB - Value'][2] == 5.0
+    assert np.isnan( df['EX.BB - Value'][1] )
+    assert np.isnan( df['EX.AA - Open'][2] )
+    assert df['EX.CC - NOT FOUND'].isnull().all()
+
+
+def test_yi_quandl_fecon235_getqdl_maxi_cold_cache( tmpdir, monkeypatch ):
+    '''Cold cache: maxi rows requested, not cached; else from cache.'''
+    monkeypatch.setitem( ys_cache._settings, 'directory', str(tmpdir) )
+    urls = []
+    def recorder( url ):
+        urls.append( url )
+        return download( url )
+    monkeypatch.setattr( qdlapi, '_download', recorder )
+    qdl.getqdl( 'EX/BB', maxi=1 )
+    assert 'rows=1' in urls[-1]
+    assert not ys_cache.exists( 'qdl', 'EX/BB' )
+    full = qdl.getqdl( 'EX/BB' )
+    assert len( full ) == 2
+    assert 'rows=' not in urls[-1]
+    df = qdl.getqdl( 'EX/BB', maxi=1 )
+    assert len( urls ) == 2
+    #  ^served from cache.
+    assert list( df.index ) == list( full.index[-1:] )
+    assert list( df['Y'] ) == list( full['Y'][-1:] )
+
+
+def test_yi_quandl_api_fecon235_config_token_once( tmpdir, monkeypatch ):
+    '''Token file is read once, then the token is shared by all calls.'''
+    tokenfile = str( tmpdir.join('authtoken.p') )
+    with open( tokenfile, 'wb' ) as f:
+        pickle.dump( 'secret', f )
+    monkeypatch.delenv( 'QUANDL_API_KEY', raising=False )
+    monkeypatch.setenv( 'QUANDL_TOKEN_FILE', tokenfile )
+    config = qdlapi.ApiConfig()
+    loads = []
+    realload = pickle.load
+    def load( f ):
+        loads.append( f )
+        return realload( f )
+    monkeypatch.setattr( pickle, 'load', load )
+    monkeypatch.setattr( qdlapi, 'config', config )
+    for _ in range( 3 ):
+        assert qdlapi._getauthtoken( '', False ) == 'secret'
+    assert len( loads ) == 1
+    #  Same token again is not rewritten to disk:
+    qdlapi._getauthtoken( 'secret', False )
+    assert config.token() == 'secret'
+    qdlapi._getauthtoken( 'other', False )
+    assert config.token() == 'other'
+    with open( tokenfile, 'rb' ) as f:
+        assert realload( f ) == 'other'
+
+
+def test_yi_quandl_api_fecon235_config_environment( monkeypatch ):
+    '''Environment overrides token, base URL, and timeout.'''
+    monkeypatch.setenv( 'QUANDL_API_KEY', 'envkey' )
+    monkeypatch.setenv( 'QUANDL_API_URL', 'http://127.0.0.1/api/' )
+    monkeypatch.setenv( 'QUANDL_TIMEOUT', '5' )
+    monkeypatch.setenv( 'QUANDL_TOKEN_FILE', '/nonexistent/authtoken.p' )
+    config = qdlapi.ApiConfig()
+    assert config.token() == 'envkey'
+    assert config.api_url == 'http://127.0.0.1/api/'
+    assert config.timeout == 5.0
+    urls = []
+    def download( url ):
+        urls.append( url )
+        return pd.DataFrame({ 'Value': [1.0] },
+                 index=pd.DatetimeIndex(['2014-01-01'], name='Date'))
+    monkeypatch.setattr( qdlapi, 'config', config )
+    monkeypatch.setattr( qdlapi, '_download', download )
+    qdlapi.get( 'EX/AA', verbose=False )
+    assert urls[0].startswith( 'http://127.0.0.1/api/datasets/EX/AA.csv?' )
+    assert 'auth_token=envkey' in urls[0]
+
+
+def futures( url ):
+    '''Stand-in for qdlapi._download() of Gold contracts in 2016:
+       Settle is month number plus day, missing after October.'''
+    for month in 'GJMQV':
+        if 'datasets/CME/GC' + month + '2016.csv' in url:
+            m = qdl.fut_months.index( month ) + 1
+            index = pd.DatetimeIndex([ '2015-12-30', '2015-12-31' ],
+                                     name='Date')
+            return pd.DataFrame({ 'Settle': [ m + 0.30, m + 0.31 ],
+                                  'Volume': [ 1.0, 2.0 ] }, index=index)
+    raise qdlapi.HTTPError( url, 404, 'Not Found', {}, None )
+
+
+def test_yi_quandl_fecon235_getcurve( tmpdir, monkeypatch ):
+    '''Curve is dates x contracts in delivery order, omitting missing.'''
+    monkeypatch.setitem( ys_cache._settings, 'directory', str(tmpdir) )
+    monkeypatch.setattr( qdlapi, '_download', futures )
+    assert qdl.fut_slangs( 'f4xau', '16f', '16z' ) == [ 'f4xau16g',
+          'f4xau16j', 'f4xau16m', 'f4xau16q', 'f4xau16v', 'f4xau16z' ]
+    assert qdl.fut_slangs( 'f4libor', '16z', '17h' ) == [ 'f4libor16z',
+                                                          'f4libor17h' ]
+    curve = qdl.getcurve( 'f4xau', '16f', '16z' )
+    assert list( curve.columns ) == [ 'f4xau16g', 'f4xau16j', 'f4xau16m',
+                                      'f4xau16q', 'f4xau16v' ]
+    assert list( curve.iloc[-1] ) == [ 2.31, 4.31, 6.31, 8.31, 10.31 ]
+    assert len( qdl.getcurve('f4xau', '16f', '16z', maxi=1) ) == 1
+
+
+def test_yi_quandl_fecon235_curvesnap( tmpdir, monkeypatch ):
+    '''Snapshot is delivery months x roots as of given date.'''
+    monkeypatch.setitem( ys_cache._settings, 'directory', str(tmpdir) )
+    monkeypatch.setattr( qdlapi, '_download', futures )
+    snap = qdl.curvesnap([ 'f4xau' ], '16j', '16q', date='2015-12-30' )
+    assert [ str(d.date()) for d in snap.index ] == [ '2016-04-01',
+                                         '2016-06-01', '2016-08-01' ]
+    assert list( snap['f4xau'] ) == [ 4.30, 6.30, 8.30 ]
+
+
+def reports( url ):
+    '''Stand-in for qdlapi._download() of CFTC COTR reports:
+       commodities by Money Manager, financials by Asset Manager.'''
+    for i, f in enumerate([ 'GC', 'SI', 'JY', 'EC', 'TY', 'ED', 'SP', 'ES' ]):
+        if 'datasets/CFTC/' + f + '_FO_ALL.csv' in url:
+            category = 'Money Manager' if f in ['GC', 'SI'] else 'Asset Manager'
+            index = pd.date_range( '2015-01-06', periods=40 - i, freq='W-TUE',
+                                   name='Date' )
+            k = np.arange( len(index) )
+            return pd.DataFrame({ category + ' Longs':  100 + (k * (i+3)) % 17,
+                                  category + ' Shorts': 50 + (k * (i+5)) % 13,
+                                  'Open Interest': 1000.0 }, index=index)
+    raise qdlapi.HTTPError( url, 404, 'Not Found', {}, None )
+
+
+def test_yi_quandl_fecon235_cotr_batch( tmpdir, monkeypatch ):
+    '''Batched positions agree with synthetics of qdlsynth.'''
+    monkeypatch.setitem( ys_cache._settings, 'directory', str(tmpdir) )
+    monkeypatch.setattr( qdlapi, '_download', reports )
+    codes = sorted( qdl.cotr_composites )
+    batch = qdl.cotr_batch( codes )
+    dfdic = qdl.getqdls( codes )
+    for code in codes:
+        expected = dfdic[ code ].iloc[:, 0]
+        assert np.allclose( batch[code].dropna(), expected.dropna() )
+
+
+def test_fecon235_groupcotr_batch( tmpdir, monkeypatch ):
+    '''groupcotr() agrees with column-wise normalize and ema.'''
+    monkeypatch.setitem( ys_cache._settings, 'directory', str(tmpdir) )
+    monkeypatch.setattr( qdlapi, '_download', reports )
+    ys_route.failclear()
+    #  ^forget codes which failed earlier, e.g. without network.
+    positions = fe.groupget( fe.cotr4w )
+    for alpha in [ 0, 0.26 ]:
+        expected = fe.groupfun( fe.normalize, positions )
+        if alpha:
+            expected = fe.groupfun( fe.ema, expected, alpha )
+        result = fe.groupcotr( fe.cotr4w, alpha )
+        assert list( result.columns ) == list( expected.columns )
+        assert result.index.equals( expected.index )
+        assert np.allclose( result.values, expected.values )
+
+
+if __name__ == "__main__":
+     system.endmodule()
@@ -0,0 +1,129 @@
+#  Python Module for import                           Date : 2026-10-17
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+'''
+_______________|  test_replay : Test fecon235 ys_replay module.
+
+- Record responses from a local origin server, then replay without it.
+- Keys omit host and auth_token, so fixtures are portable.
+- StandIn server serves fixtures at FRED and Quandl paths.
+No network access is required.
+
+Testing: As of fecon235 v4, we favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+               or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  First version.
+'''
+
+from __future__ import absolute_import, print_function
+
+import threading
+import pytest
+from fecon235.lib import yi_0sys as system
+from fecon235.lib import yi_fred as fred
+from fecon235.lib import yi_quandl_api as qdlapi
+from fecon235.lib import ys_http
+from fecon235.lib import ys_replay
+#
+#  N.B. -  In this tests directory without __init__.py,
+#          we use absolute import as if outside the fecon235 package,
+#          not relative import (cf. modules within lib).
+
+if system.pythontup() < (3, 0, 0):
+    pytest.skip('local test server uses Python 3 http.server',
+                allow_module_level=True)
+
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+
+
+class Server( ThreadingMixIn, HTTPServer ):
+    '''Threads, since sessions keep connections alive.'''
+    daemon_threads = True
+
+
+#  Daily gold prices, see test_timeseries.py for listing:
+with open('zdata-xau-13hj-c30.csv', 'rb') as f:
+    xaucsv = f.read()
+
+qdlcsv = b'Date,Value\n2014-01-03,5\n2014-01-01,6\n'
+
+
+class Origin( BaseHTTPRequestHandler ):
+    '''Stand-in for the live services: FRED and Quandl paths.'''
+    protocol_version = 'HTTP/1.1'
+
+    def log_message( self, *args ):
+        pass
+
+    def do_GET( self ):
+        if '/XAU/' in self.path:
+            status, body = [ 200, xaucsv ]
+        elif '/EX/BB.csv' in self.path:
+            status, body = [ 200, qdlcsv ]
+        else:
+            status, body = [ 404, b'' ]
+        self.send_response( status )
+        self.send_header( 'Content-Length', str(len(body)) )
+        self.end_headers()
+        self.wfile.write( body )
+
+
+def test_ys_replay_fecon235_urlkey():
+    '''Key omits host and auth_token, keeping other query parameters.'''
+    key = ys_replay.urlkey( 'https://www.quandl.com/api/v1/datasets/EX/BB'
+                            + '.csv?rows=5&auth_token=secret&sort_order=asc' )
+    assert key == '/api/v1/datasets/EX/BB.csv?rows=5&sort_order=asc'
+
+
+def test_ys_replay_fecon235_record_replay_standin( tmpdir, monkeypatch ):
+    '''Record via origin, replay with origin gone, then serve by StandIn.'''
+    fixtures = str( tmpdir.join('fixtures') )
+    #  Tokens are saved apart from the tests directory:
+    monkeypatch.setenv( 'QUANDL_TOKEN_FILE', str(tmpdir.join('token.p')) )
+    monkeypatch.setattr( qdlapi, 'config', qdlapi.ApiConfig() )
+    origin = Server( ('127.0.0.1', 0), Origin )
+    thread = threading.Thread( target=origin.serve_forever )
+    thread.daemon = True
+    thread.start()
+    base = 'http://127.0.0.1:' + str(origin.server_address[1])
+    try:
+        ys_replay.redirect( base )
+        ys_replay.record( fixtures )
+        expected = fred.getdata_fred( 'XAU', cache=False )
+        qdf = qdlapi.get( 'EX/BB', authtoken='secret' )
+        with pytest.raises( ys_http.HTTPError ):
+            fred.getdata_fred( 'NOSUCH', cache=False )
+    finally:
+        ys_replay.live()
+        origin.shutdown()
+        origin.server_close()
+    try:
+        #  Origin is gone, yet responses are on tape:
+        ys_replay.replay( fixtures )
+        assert fred.getdata_fred( 'XAU', cache=False ).equals( expected )
+        assert qdlapi.get( 'EX/BB', authtoken='other' ).equals( qdf )
+        with pytest.raises( ys_http.HTTPError ) as e:
+            fred.getdata_fred( 'NOSUCH', cache=False )
+        assert e.value.code == 404
+        ys_replay.live()
+        #  Over HTTP via stand-in server:
+        server = ys_replay.StandIn( fixtures )
+        ys_replay.redirect( server.base )
+        assert fred.getdata_fred( 'XAU', cache=False ).equals( expected )
+        assert qdlapi.get( 'EX/BB' ).equals( qdf )
+        assert server.requests == 2
+        server.close()
+    finally:
+        ys_replay.live()
+        ys_replay.redirect()
+    assert fred.makeURL( 'XAU' ).startswith(
+                                 'http://research.stlouisfed.org/fred2/' )
+
+
+if __name__ == "__main__":
+     system.endmodule()
@@ -0,0 +1,159 @@
+#  Python Module for import                           Date : 2026-10-17
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+'''
+_______________|  test_roll : Test fecon235 ys_roll module.
+
+- Roll rules: open interest crossover, days before expiry.
+- Contracts trading through the last date are never rolled out of.
+- Back and ratio adjustment agree with a plain loop over dates.
+- Batch of chains in one pass agrees with chains built one by one.
+No network access is required: downloads are replaced by local frames.
+
+Testing: As of fecon235 v4, we favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+               or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  Add tests of live contracts and roll without new price.
+2026-10-17  First version.
+'''
+
+from __future__ import absolute_import, print_function
+
+import numpy as np
+import pandas as pd
+from fecon235.lib import yi_0sys as system
+from fecon235.lib import yi_quandl_api as qdlapi
+from fecon235.lib import ys_cache
+from fecon235.lib import ys_roll
+#
+#  N.B. -  In this tests directory without __init__.py,
+#          we use absolute import as if outside the fecon235 package,
+#          not relative import (cf. modules within lib).
+
+
+nan = np.nan
+
+#  Three contracts over eight dates, delivery order by column:
+prices = np.array([[ 10.0,  nan,  nan ],
+                   [ 11.0, 12.0,  nan ],
+                   [ 12.0, 14.0,  nan ],
+                   [ 13.0, 15.0, 18.0 ],
+                   [  nan, 16.0, 19.0 ],
+                   [  nan, 17.0, 20.0 ],
+                   [  nan,  nan, 21.0 ],
+                   [  nan,  nan, 22.0 ]])
+
+openint = np.array([[ 5.0,  nan,  nan ],
+                    [ 5.0,  1.0,  nan ],
+                    [ 3.0,  4.0,  nan ],
+                    [ 4.0,  3.0,  1.0 ],
+                    [ nan,  5.0,  2.0 ],
+                    [ nan,  2.0,  3.0 ],
+                    [ nan,  nan,  3.0 ],
+                    [ nan,  nan,  3.0 ]])
+
+
+def loopchain( prices, held, adjust ):
+    '''Reference: adjust history at each roll by looping over dates.'''
+    values = [ prices[t, held[t]] for t in range(len(held)) ]
+    for t in range( 1, len(held) ):
+        if held[t] != held[t-1]:
+            old = prices[ :t+1, held[t-1] ]
+            old = old[ ~np.isnan(old) ][-1]
+            new = prices[ t, held[t] ]
+            for s in range( t ):
+                if adjust == 'back':
+                    values[s] += new - old
+                else:
+                    values[s] *= new / old
+    return np.array( values )
+
+
+def test_ys_roll_fecon235_rules():
+    '''Crossover never rolls back; expiry rolls days before last row.'''
+    held = ys_roll.roll_crossover( openint )
+    assert list( held ) == [ 0, 0, 1, 1, 1, 2, 2, 2 ]
+    #  Last valid rows are 3, 5, 7, so with days=1 roll at rows 2 and 4:
+    held = ys_roll.roll_expiry( prices, days=1 )
+    assert list( held ) == [ 0, 0, 1, 1, 2, 2, 2, 2 ]
+
+
+def test_ys_roll_fecon235_expiry_live():
+    '''Two contracts trade through last row: hold the front one,
+       unless its expiry row is given.'''
+    live = prices.copy()
+    live[ 6:, 1 ] = [ 18.0, 19.0 ]
+    held = ys_roll.roll_expiry( live, days=1 )
+    assert list( held ) == [ 0, 0, 1, 1, 1, 1, 1, 1 ]
+    held = ys_roll.roll_expiry( live, days=1, expiry=[ 8, 6, 8 ] )
+    assert list( held ) == [ 0, 0, 1, 1, 1, 2, 2, 2 ]
+    index = pd.date_range( '2016-01-25', periods=8 )
+    rows = ys_roll.expiryrows( ['f4xau16g', 'f4xau16j'], index )
+    assert list( rows ) == [ 7, 8 ]
+
+
+def test_ys_roll_fecon235_gap_without_new_price():
+    '''Roll date without price of new contract: gap at its first price.'''
+    late = prices.copy()
+    late[ 1:3, 1 ] = nan
+    held = np.array([ 0, 1, 1, 1, 1, 2, 2, 2 ])
+    #  Contract 1 first priced on row 3 at 15.0, contract 0 at 13.0:
+    values = ys_roll.chain( late, held, 'back' )
+    assert np.allclose( values[[0, 3, 4]], [ 10.0 + 2.0 + 3.0, 18.0, 19.0 ] )
+    values = ys_roll.chain( late, held, 'ratio' )
+    assert np.isclose( values[0], 10.0 * (15.0 / 13.0) * (20.0 / 17.0) )
+
+
+def test_ys_roll_fecon235_adjust():
+    '''Back and ratio adjustment agree with loop; last contract is raw.'''
+    held = ys_roll.roll_crossover( openint )
+    for adjust in [ 'back', 'ratio' ]:
+        values = ys_roll.chain( prices, held, adjust )
+        assert np.allclose( values, loopchain(prices, held, adjust) )
+        assert np.allclose( values[5:], [ 20.0, 21.0, 22.0 ] )
+    raw = ys_roll.chain( prices, held, None )
+    assert list( raw ) == [ 10.0, 11.0, 14.0, 15.0, 16.0, 20.0, 21.0, 22.0 ]
+
+
+def test_ys_roll_fecon235_batch():
+    '''Chains stacked in 3-D are built in one pass, same as one by one.'''
+    batch = np.stack([ prices, prices * 2, prices + 1 ])
+    weights = np.stack([ openint, openint[:, ::-1], openint ])
+    values = ys_roll.rollchain( batch, weights, 'oi', 'ratio' )
+    for i in range( 3 ):
+        single = ys_roll.rollchain( batch[i], weights[i], 'oi', 'ratio' )
+        assert np.allclose( values[i], single, equal_nan=True )
+
+
+def futures( url ):
+    '''Stand-in for qdlapi._download() of Gold contracts in 2016.'''
+    index = pd.date_range( '2016-01-01', periods=8, name='Date' )
+    for i, month in enumerate( 'GJM' ):
+        if 'datasets/CME/GC' + month + '2016.csv' in url:
+            return pd.DataFrame({ 'Settle': prices[:, i],
+                                  'Open Interest': openint[:, i] },
+                                index=index).dropna()
+    raise qdlapi.HTTPError( url, 404, 'Not Found', {}, None )
+
+
+def test_ys_roll_fecon235_continuous( tmpdir, monkeypatch ):
+    '''Continuous series from contracts via (stand-in) Quandl.'''
+    monkeypatch.setitem( ys_cache._settings, 'directory', str(tmpdir) )
+    monkeypatch.setattr( qdlapi, '_download', futures )
+    df = ys_roll.continuous( 'f4xau', '16g', '16m', rule='oi' )
+    held = ys_roll.roll_crossover( openint )
+    assert list( df.columns ) == [ 'Y' ]
+    assert np.allclose( df['Y'].values, loopchain(prices, held, 'back') )
+    #  Deliveries are after these dates, so the last contract is held:
+    df = ys_roll.continuous( 'f4xau', '16g', '16m', rule='expiry', days=1 )
+    held = ys_roll.roll_expiry( prices, days=1 )
+    assert held[-1] == 2
+    assert np.allclose( df['Y'].values, loopchain(prices, held, 'back') )
+
+
+if __name__ == "__main__":
+     system.endmodule()
@@ -0,0 +1,91 @@
+#  Python Module for import                           Date : 2026-10-17
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+'''
+_______________|  test_route : Test fecon235 ys_route module and get().
+
+- Codes are classified by form into exactly one backend.
+- get() calls only that backend, and remembers definitive failures.
+No network access is required: backends are replaced locally.
+
+Testing: As of fecon235 v4, we favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+               or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  Transient errors are not remembered.
+2026-10-17  First version.
+'''
+
+from __future__ import absolute_import, print_function
+
+import pytest
+from fecon235 import fecon235 as fe
+from fecon235.lib import yi_0sys as system
+from fecon235.lib import yi_fred as fred
+from fecon235.lib import yi_quandl as qdl
+from fecon235.lib import yi_quandl_api as qdlapi
+from fecon235.lib import ys_http
+from fecon235.lib import ys_route
+#
+#  N.B. -  In this tests directory without __init__.py,
+#          we use absolute import as if outside the fecon235 package,
+#          not relative import (cf. modules within lib).
+
+
+def test_ys_route_fecon235_route_by_form():
+    '''Each form of code goes to its backend.'''
+    assert ys_route.route( 's4spy' ) == 'stock'
+    assert ys_route.route( 'f4xau15z' ) == 'quandl'
+    assert ys_route.route( qdl.w4cotr_metals ) == 'quandl'
+    assert ys_route.route( qdl.m4spx_1871_p ) == 'quandl'
+    assert ys_route.route( 'CFTC/GC_FO_ALL' ) == 'quandl'
+    assert ys_route.route( qdl.d7xbtusd ) == 'quandl'
+    assert ys_route.route( fred.d4xau ) == 'fred'
+    assert ys_route.route( fred.m4xaueur ) == 'fred'
+    assert ys_route.route( 'DGS10' ) == 'fred'
+
+
+def test_ys_route_fecon235_get_one_backend_and_remember( monkeypatch ):
+    '''Invalid stock slang costs one stock call, then none while recent.'''
+    calls = []
+    def fake( name ):
+        def backend( code, *args ):
+            calls.append( name )
+            raise ValueError('Stock slang argument is invalid.')
+        return backend
+    for name in [ 'getfred', 'getqdl', 'getstock' ]:
+        monkeypatch.setattr( fe, name, fake(name) )
+    ys_route.failclear()
+    for _ in range( 3 ):
+        with pytest.raises( ValueError ) as e:
+            fe.get( 's4nosuchsymbol' )
+    assert 'slang argument is invalid' in str( e.value )
+    assert calls == [ 'getstock' ]
+    ys_route.failclear()
+
+
+def test_ys_route_fecon235_get_transient_not_remembered( monkeypatch ):
+    '''Timeouts and server errors are retried; 404 is remembered.'''
+    errors = [ IOError('timed out'),
+               ys_http.HTTPError( 'url', 503, 'Unavailable', {}, None ),
+               ys_http.HTTPError( 'url', 429, 'Too Many', {}, None ),
+               ys_http.HTTPError( 'url', 404, 'Not Found', {}, None ) ]
+    calls = []
+    def getfred( code, *args ):
+        calls.append( code )
+        raise errors[ len(calls) - 1 ]
+    monkeypatch.setattr( fe, 'getfred', getfred )
+    ys_route.failclear()
+    for _ in range( 6 ):
+        with pytest.raises( ValueError ):
+            fe.get( 'NOSUCHSERIES' )
+    assert len( calls ) == 4
+    assert ys_route.definitive( qdlapi.DatasetNotFound('gone') )
+    ys_route.failclear()
+
+
+if __name__ == "__main__":
+     system.endmodule()
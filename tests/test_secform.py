@@ -0,0 +1,92 @@
+#  Python Module for import                           Date : 2026-10-17
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+'''
+_______________|  test_secform : Test fecon235 yi_secform module.
+
+- Streaming parse of XML Information Table of form 13F.
+- Holdings index across filings, allocation and quarterly changes.
+No network access is required: filings are local XML text.
+
+Testing: As of fecon235 v4, we favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+               or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  First version.
+'''
+
+from __future__ import absolute_import, print_function
+
+import io
+from fecon235.lib import yi_0sys as system
+from fecon235.lib import yi_secform as sec
+#
+#  N.B. -  In this tests directory without __init__.py,
+#          we use absolute import as if outside the fecon235 package,
+#          not relative import (cf. modules within lib).
+
+
+def infotable( rows ):
+    '''XML Information Table as bytes, given (stock, cusip, usd, size,
+       putcall) rows, in the namespace used by EDGAR.'''
+    xml = [ '<?xml version="1.0" encoding="UTF-8"?>',
+            '<informationTable xmlns="http://www.sec.gov/edgar/'
+            + 'document/thirteenf/informationtable">' ]
+    for stock, cusip, usd, size, putcall in rows:
+        xml += [ '<infoTable>',
+                 '<nameOfIssuer>' + stock + '</nameOfIssuer>',
+                 '<titleOfClass>COM</titleOfClass>',
+                 '<cusip>' + cusip + '</cusip>',
+                 '<value>' + str(usd) + '</value>',
+                 '<shrsOrPrnAmt><sshPrnamt>' + str(size) + '</sshPrnamt>',
+                 '<sshPrnamtType>SH</sshPrnamtType></shrsOrPrnAmt>',
+                 ('<putCall>' + putcall + '</putCall>') if putcall else '',
+                 '<investmentDiscretion>SOLE</investmentDiscretion>',
+                 '<votingAuthority><Sole>' + str(size) + '</Sole>',
+                 '<Shared>0</Shared><None>0</None></votingAuthority>',
+                 '</infoTable>' ]
+    xml.append( '</informationTable>' )
+    return '\n'.join( xml ).encode( 'utf-8' )
+
+
+q2 = infotable([ ('SPDR Gold Trust', '78463V907', 300, 30, ''),
+                 ('Facebook Inc',    '30303M102', 100, 10, ''),
+                 ('Facebook Inc',    '30303M102',  50,  5, ''),
+                 ('Facebook Inc',    '30303M102',  50,  5, 'Call') ])
+
+q3 = infotable([ ('SPDR Gold Trust', '78463V907', 200, 20, ''),
+                 ('Citigroup Inc',   '172967424', 200, 40, '') ])
+
+
+def test_yi_secform_fecon235_read13f():
+    '''Parse rows with numeric columns, same layout as parse13f().'''
+    df = sec.read13f( io.BytesIO(q2) )
+    assert list( df.columns ) == [ col for col, tag in sec.columns13f ]
+    assert len( df ) == 4
+    assert list( df['usd'] ) == [ 300, 100, 50, 50 ]
+    assert df['putcall'].isnull().sum() == 3
+    assert df['putcall'][3] == 'Call'
+    assert df['vote1'][0] == 30
+
+
+def test_yi_secform_fecon235_index13f():
+    '''Holdings index of two quarters: allocation and changes.'''
+    holdings = sec.index13f({ ('druck', '2015Q2'): io.BytesIO(q2),
+                              ('druck', '2015Q3'): io.BytesIO(q3) })
+    assert list( holdings.index.names ) == [ 'manager', 'quarter',
+                                             'cusip', 'putcall' ]
+    top = sec.alloc13f( holdings, 'druck', '2015Q2', top=2 )
+    assert list( top['stock'] ) == [ 'SPDR Gold Trust', 'Facebook Inc' ]
+    assert list( top['usd'] ) == [ 300, 150 ]
+    assert list( top['pcent'] ) == [ 60.0, 30.0 ]
+    changes = sec.changes13f( holdings, 'druck' )
+    assert changes.loc[ ('78463V907', ''), '2015Q3' ] == -10
+    assert changes.loc[ ('30303M102', 'Call'), '2015Q3' ] == -5
+    assert changes.loc[ ('172967424', ''), '2015Q3' ] == 40
+
+
+if __name__ == "__main__":
+     system.endmodule()
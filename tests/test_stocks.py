@@ -0,0 +1,83 @@
+#  Python Module for import                           Date : 2026-10-17
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+'''
+_______________|  test_stocks : Test fecon235 yi_stocks module.
+
+- Local fixture source stands in for the vendors.
+- stock_batch() retrieves OHLCV of several stocks, omitting failures.
+- Columns other than Close are served from cache without retrieval.
+No network access is required.
+
+Testing: As of fecon235 v4, we favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+               or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  First version.
+'''
+
+from __future__ import absolute_import, print_function
+
+import datetime
+import pytest
+import pandas as pd
+from fecon235.lib import yi_0sys as system
+from fecon235.lib import yi_stocks as stocks
+from fecon235.lib import ys_cache
+#
+#  N.B. -  In this tests directory without __init__.py,
+#          we use absolute import as if outside the fecon235 package,
+#          not relative import (cf. modules within lib).
+
+
+def ohlcv( close ):
+    '''Recent daily OHLCV dataframe around close price.'''
+    today = datetime.date.today()
+    index = pd.date_range( end=today, periods=5, freq='D', name='Date' )
+    return pd.DataFrame({ 'Open':   [ close - 1.0 ] * 5,
+                          'High':   [ close + 2.0 ] * 5,
+                          'Low':    [ close - 2.0 ] * 5,
+                          'Close':  [ close + i for i in range(5) ],
+                          'Volume': [ 1000 * (i+1) for i in range(5) ] },
+                        index=index)
+
+
+def test_yi_stocks_fecon235_batch_fixture( tmpdir, monkeypatch ):
+    '''Batch from fixture source, then other columns from cache.'''
+    monkeypatch.setitem( ys_cache._settings, 'directory',
+                         str(tmpdir.join('cache')) )
+    fixtures = tmpdir.mkdir( 'fixtures' )
+    ohlcv( 100.0 ).to_csv( str(fixtures.join('SPY.csv')) )
+    ohlcv( 50.0 ).to_csv( str(fixtures.join('GLD.csv')) )
+    calls = []
+    local = stocks.fixture( str(fixtures) )
+    def reader( symbol, start, end ):
+        calls.append( symbol )
+        return local( symbol, start, end )
+    monkeypatch.setitem( stocks.readers, 'local', reader )
+    monkeypatch.setattr( stocks, 'sources', [ 'local' ] )
+    dfdic = stocks.stock_batch([ 's4spy', 's4gld', 's4nosuch' ], 30 )
+    assert sorted( dfdic ) == [ 's4gld', 's4spy' ]
+    assert list( dfdic['s4spy']['Close'] ) == [ 100., 101., 102., 103., 104. ]
+    assert sorted( calls ) == [ 'GLD', 'NOSUCH', 'SPY' ]
+    volume = stocks.stock_one( 's4spy', 30, col='Volume' )
+    assert list( volume['Y'] ) == [ 1000., 2000., 3000., 4000., 5000. ]
+    close = stocks.getstock( 's4gld', 30 )
+    assert close['Y'].iloc[-1] == 54.0
+    assert len( calls ) == 3
+    #  ^served from cache, no further retrieval.
+
+
+def test_yi_stocks_fecon235_setsource():
+    '''Unknown source name is rejected, leaving sources unchanged.'''
+    before = list( stocks.sources )
+    with pytest.raises( ValueError ):
+        stocks.setsource( 'nosuch' )
+    assert stocks.sources == before
+
+
+if __name__ == "__main__":
+     system.endmodule()
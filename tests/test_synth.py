@@ -0,0 +1,103 @@
+#  Python Module for import                           Date : 2026-10-17
+#  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263
+'''
+_______________|  test_synth : Test fecon235 ys_synth module.
+
+- Planner returns minimal leaf downloads and dependency order.
+- Shared inputs are fetched and evaluated exactly once.
+- Registries fredsynth and qdlsynth plan the expected leaves.
+No network access is required: leaf fetch functions are local.
+
+Testing: As of fecon235 v4, we favor pytest over nosetests, so e.g.
+    $ py.test --doctest-modules
+
+REFERENCE
+   pytest:  https://pytest.org/latest/getting-started.html
+               or PDF at http://pytest.org/latest/pytest.pdf
+
+CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  First version.
+'''
+
+from __future__ import absolute_import, print_function
+
+import pytest
+from fecon235.lib import yi_0sys as system
+from fecon235.lib import yi_fred as fred
+from fecon235.lib import yi_quandl as qdl
+from fecon235.lib import ys_synth as synth
+#
+#  N.B. -  In this tests directory without __init__.py,
+#          we use absolute import as if outside the fecon235 package,
+#          not relative import (cf. modules within lib).
+
+
+#  Daily gold prices, see test_timeseries.py for listing:
+xau = fred.readfile('zdata-xau-13hj-c30.csv')
+
+calls = []
+
+def double( df ):
+    calls.append('double')
+    return df * 2
+
+def add( df1, df2 ):
+    calls.append('add')
+    return df1 + df2
+
+#  Toy registry: both 'sum' and 'quad' need 'twice', which needs leaf 'X'.
+toy = { 'twice': ( ('X',),            double ),
+        'quad':  ( ('twice',),        double ),
+        'sum':   ( ('twice', 'quad'), add ) }
+
+
+def test_ys_synth_fecon235_plan_order():
+    '''Inputs precede dependents, and each leaf is listed once.'''
+    leaves, nodes = synth.plan( toy, ['sum', 'quad', 'X'] )
+    assert leaves == ['X']
+    assert nodes == ['twice', 'quad', 'sum']
+
+
+def test_ys_synth_fecon235_evaluate_shares_results():
+    '''Shared leaf is fetched once, each node is evaluated once.'''
+    fetched = []
+    def fetch( code ):
+        fetched.append( code )
+        return xau
+    del calls[:]
+    dfdic = synth.evaluate( toy, ['sum', 'quad'], fetch )
+    assert fetched == ['X']
+    assert calls == ['double', 'double', 'add']
+    assert dfdic['sum'].equals( xau * 6 )
+    assert dfdic['quad'].equals( xau * 4 )
+
+
+def test_ys_synth_fecon235_cycle_detected():
+    '''Cyclic registry must be rejected rather than recurse forever.'''
+    cyclic = { 'a': ( ('b',), double ),
+               'b': ( ('a',), double ) }
+    with pytest.raises( ValueError ):
+        synth.plan( cyclic, ['a'] )
+
+
+def test_ys_synth_fecon235_self_reference_is_leaf():
+    '''Code which lists itself as input denotes its own raw download.'''
+    archived = { 'd4spx': ( ('d4spx',), double ) }
+    assert synth.plan( archived, ['d4spx'] ) == [ ['d4spx'], ['d4spx'] ]
+
+
+def test_ys_synth_fecon235_fredplan_gold_crosses():
+    '''Gold in EUR and JPY terms share the daily gold download.'''
+    leaves = fred.fredplan([ fred.m4xaueur, fred.m4xaujpy ])
+    assert sorted(leaves) == sorted([ fred.d4xau, fred.d4eurusd,
+                                      fred.d4usdjpy ])
+
+
+def test_ys_synth_fecon235_qdlplan_cotr_metals():
+    '''COTR for metals shares the gold report with COTR for gold.'''
+    leaves = qdl.qdlplan([ qdl.w4cotr_xau, qdl.w4cotr_metals ])
+    assert leaves == ['CFTC/GC_FO_ALL', 'CFTC/SI_FO_ALL']
+
+
+if __name__ == "__main__":
+     system.endmodule()
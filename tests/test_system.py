@@ -1,4 +1,4 @@
-#  Python Module for import                           Date : 2015-12-21
+#  Python Module for import                           Date : 2026-10-17
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263 
 ''' 
 _______________|  test_system : Test fecon235 yi_0sys module.
@@ -12,11 +12,18 @@ REFERENCE:
                   or PDF at http://pytest.org/latest/pytest.pdf
 
 CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  Add tests for lazyimport() and import-time budget.
+2026-10-17  Add test for pmap() order and exceptions.
 2015-12-29  First edition for gitinfo(), Python and pandas versions.
 '''
 
 from __future__ import absolute_import, print_function
 
+import os
+import sys
+import time
+import subprocess
+import pytest
 from fecon235.lib import yi_0sys as system
 #
 #  N.B. -  in this tests directory without __init__.py, 
@@ -46,5 +53,59 @@ def test_gitinfo_yi_0sys_fecon235():
     assert repo == 'fecon235'
 
 
+def test_pmap_yi_0sys_fecon235():
+    '''Test pmap() keeps item order and raises after all calls finish.'''
+    def slow( x ):
+        time.sleep( 0.01 * (5 - x) )
+        #  ^later items finish first.
+        return x * x
+    assert system.pmap( slow, range(5), workers=3 ) == [0, 1, 4, 9, 16]
+    assert system.pmap( slow, range(5), workers=0 ) == [0, 1, 4, 9, 16]
+    done = []
+    def fragile( x ):
+        if x == 1:
+            raise KeyError( x )
+        done.append( x )
+    with pytest.raises( KeyError ):
+        system.pmap( fragile, range(4), workers=2 )
+    assert sorted(done) == [0, 2, 3]
+
+
+def test_lazyimport_yi_0sys_fecon235():
+    '''Module stand-in imports upon first attribute access, else fallback.'''
+    sys.modules.pop( 'wave', None )
+    wave = system.lazyimport( 'wave' )
+    assert 'wave' not in sys.modules
+    assert wave.Error
+    assert 'wave' in sys.modules
+    mod = system.lazyimport( 'nosuch_fecon235_module', fallback='json' )
+    assert mod.dumps( [1] ) == '[1]'
+    with pytest.raises( ImportError ):
+        system.lazyimport( 'nosuch_fecon235_module' ).anything
+
+
+#  Import of fecon235 must not load these, and finish within seconds:
+heavymodules = [ 'matplotlib', 'statsmodels', 'sympy', 'scipy.optimize',
+                 'scipy.stats', 'pandas_datareader' ]
+importbudget = 3.0
+
+
+def test_importbudget_fecon235():
+    '''Fresh interpreter imports fecon235 without heavy modules.'''
+    code = ( 'import sys, time\n'
+             + 't = time.time()\n'
+             + 'from fecon235.fecon235 import *\n'
+             + 't = time.time() - t\n'
+             + 'print(t)\n'
+             + 'print([m for m in ' + repr(heavymodules)
+             + ' if m in sys.modules])\n' )
+    env = dict( os.environ )
+    env['PYTHONPATH'] = os.pathsep.join( p for p in sys.path if p )
+    out = subprocess.check_output( [ sys.executable, '-c', code ], env=env )
+    seconds, loaded = out.decode('utf-8').splitlines()[-2:]
+    assert loaded == '[]'
+    assert float( seconds ) < importbudget
+
+
 if __name__ == "__main__":
      system.endmodule()
@@ -1,10 +1,14 @@
-#  Python Module for import                           Date : 2016-12-18
+#  Python Module for import                           Date : 2026-10-17
 #  vim: set fileencoding=utf-8 ff=unix tw=78 ai syn=python : per Python PEP 0263 
 ''' 
 _______________|  test_timeseries : Test fecon235 yi_timeseries module.
 
 - Include test of holt() and its workout dataframe. 
 - Include test of ema() which is a special case of Holt-Winters.
+- Linear filter kernel of holt_winters_growth() matches the plain loop.
+- Array API holtar() matches holt() and serves loss_holt().
+- Batched holtbatch() matches holt() per column, with NaNs.
+- HoltState updated incrementally matches holt() on full history.
 
 Doctests display at lower precision since equality test becomes fuzzy across 
 different systems if full floating point representation is used.
@@ -17,16 +21,26 @@ REFERENCE
                or PDF at http://pytest.org/latest/pytest.pdf
 
 CHANGE LOG  For latest version, see https://github.com/rsvp/fecon235
+2026-10-17  Add tests of HoltState.
+2026-10-17  Add tests of holtbatch() and groupholtf().
+2026-10-17  Add test of holtar() array API.
+2026-10-17  Add equivalence and speed tests of holt_winters_growth().
 2016-12-18  First version to verify fix #5 which revises ema():
                https://github.com/rsvp/fecon235/issues/5
 '''
 
 from __future__ import absolute_import, print_function
 
+import json
+import time
+import numpy as np
+import pandas as pd
+from fecon235 import fecon235 as fe
 from fecon235.lib import yi_0sys as system
 from fecon235.lib import yi_fred as fred
 from fecon235.lib import yi_1tools as tools
 from fecon235.lib import yi_timeseries as ts
+from fecon235.lib import ys_opt_holt as oholt
 #
 #  N.B. -  In this tests directory without __init__.py, 
 #          we use absolute import as if outside the fecon235 package,
@@ -224,5 +238,137 @@ def test_yi_timeseries_fecon235_check_ema():
 
 
 
+def loopholt( y, alpha, beta ):
+    '''Reference: Holt-Winters level and growth by looping over y.'''
+    l = np.zeros( y.size )
+    b = np.zeros( y.size )
+    l[0] = y[0]
+    for i in range( 1, y.size ):
+        l[i] = (alpha * y[i]) + ((1 - alpha) * (l[i-1] + b[i-1]))
+        b[i] = (beta * (l[i] - l[i-1])) + ((1 - beta) * b[i-1])
+    return [ l, b ]
+
+
+def randomwalk( n ):
+    '''Seeded random walk with drift, as a price series.'''
+    return 100 + np.cumsum( np.random.RandomState(235).normal(0.01, 1, n) )
+
+
+def test_yi_timeseries_fecon235_holt_winters_growth_filter():
+    '''Linear filter matches loop, including beta=0 and (N, 1) shape.'''
+    y = randomwalk( 500 )
+    for alpha, beta in [ (ts.hw_alpha, ts.hw_beta), (0.5, 0.0),
+                         (0.05, 0.9), (0.99, 0.01) ]:
+        l, b = ts.holt_winters_growth( y.reshape((-1, 1)), alpha, beta )
+        lloop, bloop = loopholt( y, alpha, beta )
+        assert l.shape == b.shape == ( 500, )
+        assert np.allclose( l, lloop, rtol=1e-10, atol=1e-9 )
+        assert np.allclose( b, bloop, rtol=1e-10, atol=1e-9 )
+    l, b = ts.holt_winters_growth( y[:1] )
+    assert list( l ) == [ y[0] ] and list( b ) == [ 0.0 ]
+
+
+def test_yi_timeseries_fecon235_holt_winters_growth_speed_vSlow():
+    '''Linear filter beats loop on 15,000 points.'''
+    y = randomwalk( 15000 )
+    def best( fun ):
+        secs = []
+        for _ in range( 5 ):
+            start = time.time()
+            fun( y, ts.hw_alpha, ts.hw_beta )
+            secs.append( time.time() - start )
+        return min( secs )
+    tfilter = best( ts.holt_winters_growth )
+    tloop = best( loopholt )
+    print( ' ::  holt_winters_growth speedup:', round(tloop / tfilter, 1) )
+    assert tfilter < tloop
+
+
+def test_yi_timeseries_fecon235_holtar():
+    '''Arrays from holtar() match holt() workout, NaN dropped alike.'''
+    gappy = xau.copy()
+    gappy.iloc[ 5 ] = np.nan
+    holtdf = ts.holt( gappy, 0.3, 0.1 )
+    y, l, b = ts.holtar( ts.holtarray(gappy), 0.3, 0.1 )
+    assert np.array_equal( y, holtdf['Y'].values )
+    assert np.allclose( l, holtdf['Level'].values )
+    assert np.allclose( b, holtdf['Growth'].values )
+    assert oholt.loss_holt( (0.3, 0.1), y ) == oholt.loss_holt( (0.3, 0.1),
+                                                                gappy )
+
+
+def groupholtf_loop( groupdf, h=12, alpha=ts.hw_alpha, beta=ts.hw_beta ):
+    '''Reference: former groupholtf(), one column at a time.'''
+    forecasts = []
+    for k in groupdf.columns:
+        holtdf = ts.holt( tools.todf(groupdf[k]), alpha, beta )
+        forecasts.append( ts.holtforecast(holtdf, h) )
+    keysdf = tools.paste( forecasts )
+    keysdf.columns = list( groupdf.columns )
+    return keysdf
+
+
+def test_yi_timeseries_fecon235_holtbatch():
+    '''Batch matches holt() per column, given leading and interior NaN.'''
+    Y = np.column_stack([ randomwalk(200), 2 * randomwalk(200)[::-1],
+                          randomwalk(200) + 50 ])
+    Y[ :30, 1 ] = np.nan
+    Y[ 100:105, 2 ] = np.nan
+    Y[ :7, 2 ] = np.nan
+    levels, growths, forecasts = ts.holtbatch( Y, 6, 0.3, 0.1 )
+    assert levels.shape == growths.shape == Y.shape
+    assert forecasts.shape == ( 7, 3 )
+    for j in range( 3 ):
+        valid = ~np.isnan( Y[:, j] )
+        assert np.isnan( levels[~valid, j] ).all()
+        holtdf = ts.holt( Y[:, j], 0.3, 0.1 )
+        assert np.allclose( levels[valid, j], holtdf['Level'].values )
+        assert np.allclose( growths[valid, j], holtdf['Growth'].values )
+        assert np.allclose( forecasts[:, j],
+                            ts.holtforecast(holtdf, 6)['Forecast'].values )
+    groupdf = pd.DataFrame( Y, columns=[ 'a', 'b', 'c' ] )
+    assert np.allclose( fe.groupholtf( groupdf, h=6 ).values,
+                        groupholtf_loop( groupdf, h=6 ).values )
+
+
+def test_yi_timeseries_fecon235_HoltState():
+    '''Incremental updates match holt() over all data; JSON round trip.'''
+    y = tools.todf( xau['Y'] * 1.0 )
+    state = ts.HoltState.fromholt( ts.holt(y[:20], 0.3, 0.1), 0.3, 0.1 )
+    assert state.last == y.index[19]
+    state.update( y['Y'][15:25] )
+    #             ^overlap before last is skipped.
+    state = ts.HoltState.fromdict( json.loads(json.dumps(state.todict())) )
+    assert state.last == y.index[24]
+    for value in y['Y'][25:].values:
+        state.update( value )
+    holtdf = ts.holt( y, 0.3, 0.1 )
+    assert np.isclose( state.level, holtdf['Level'].iloc[-1] )
+    assert np.isclose( state.growth, holtdf['Growth'].iloc[-1] )
+    assert np.allclose( state.forecast(6).values,
+                        ts.holtforecast(holtdf, 6).values )
+    state.update([ np.nan ])
+    assert state.y == y['Y'].iloc[-1]
+
+
+def test_yi_timeseries_fecon235_HoltState_mixed_updates():
+    '''Unindexed update with last, then indexed update: no point twice.
+       Type of last survives the round trip through todict().'''
+    y = tools.todf( xau['Y'] * 1.0 )
+    state = ts.HoltState.fromholt( ts.holt(y[:20], 0.3, 0.1), 0.3, 0.1 )
+    state.update( y['Y'].iloc[20], last=y.index[20] )
+    state.update( y['Y'][15:25] )
+    holtdf = ts.holt( y[:25], 0.3, 0.1 )
+    assert np.isclose( state.level, holtdf['Level'].iloc[-1] )
+    assert state.last == y.index[24]
+    state.update([ 1400.0 ])
+    assert state.last is None
+    for last in [ 'week 7', 3.5, 12, y.index[3], None ]:
+        state.last = last
+        dic = json.loads( json.dumps(state.todict()) )
+        again = ts.HoltState.fromdict( dic ).last
+        assert again == last and type( again ) == type( last )
+
+
 if __name__ == "__main__":
      system.endmodule()